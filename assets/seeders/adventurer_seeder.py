@@ -1,18 +1,19 @@
 import sqlite3
 
+ADVENTURERS_DATA = [
+    ("Mark", "Warrior", 135, 4, 0.75, 40, 75, 0.35, "Crushing Blow"),
+    ("Noah", "Priest", 75, 3, 0.7, 35, 50, 0.38, "Divine Prayer"),
+    ("Jayne", "Thief", 80, 6, 0.8, 25, 40, 0.33, "Surprise Attack"),
+    ("Sean", "Bard", 85, 3, 0.8, 25, 50, 0.3, "Discombobulating Tune")
+]
+
+
 class AdventurerSeeder:
     def __init__(self, db_path='data/dungeon_game.db'):
         self.db_path = db_path
 
     def populate_adventurers(self):
         """Inserts initial hero data into the adventurers table."""
-        adventurers_data = [
-            ("Mark", "Warrior", 135, 4, 0.75, 40, 75, 0.35, "Crushing Blow"),
-            ("Noah", "Priest", 75, 3, 0.7, 35, 50, 0.38, "Divine Prayer"),
-            ("Jayne", "Thief", 80, 6, 0.8, 25, 40, 0.33, "Surprise Attack"),
-            ("Sean", "Bard", 85, 3, 0.8, 25, 50, 0.3, "Discombobulating Tune")
-        ]
-
         insert_query = """
             INSERT INTO adventurers (name, type, max_HP, attack_speed, chance_to_hit,
                                 attack_damage_min, attack_damage_max, chance_to_block, special_attack)
@@ -22,7 +23,7 @@ class AdventurerSeeder:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.executemany(insert_query, adventurers_data)
+                cursor.executemany(insert_query, ADVENTURERS_DATA)
                 conn.commit()
         except sqlite3.Error as e:
             print(f"Error populating adventurers table: {e}")
\ No newline at end of file
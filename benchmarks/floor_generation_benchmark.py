@@ -0,0 +1,175 @@
+"""
+Times floor generation, full dungeon population and map drawing across floor sizes, and reports the p50/p99
+time and peak memory of each. No display is needed.
+
+Run from the project root:
+    python -m benchmarks.floor_generation_benchmark --output results.json
+and compare a later revision against it with:
+    python -m benchmarks.floor_generation_benchmark --compare results.json
+
+Peak memory is measured with tracemalloc on a separate run, so it does not slow down the timed runs. It
+counts Python allocations only; the pixels of pygame Surfaces are allocated by SDL and are not included.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from random import Random
+from assets.seeders.item_seeder import ITEMS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.controller.dungeon_manager import DungeonManager, FLOOR_COUNT
+from src.model.dungeon.dungeonfloor import DungeonFloor
+from src.model.managers.item_manager import ItemManager
+from src.model.managers.monster_manager import MonsterManager
+
+SIZES = (5, 8, 16, 32, 64, 128, 256)
+# Roughly the same amount of work at every size: more runs of small floors than of large ones
+FLOOR_WORK = 4096
+DUNGEON_WORK = 1024
+MIN_RUNS = 5
+# A case is reported as a regression when its p50 is this many times the baseline's
+DEFAULT_THRESHOLD = 1.2
+
+
+def floor_case(size):
+    """
+    A floor generation case. Each run generates a floor from its own seed, so every run of the benchmark
+    generates the same floors.
+
+    :param size: The number of rooms per side.
+    :return: A function taking the run number.
+    """
+    return lambda run: DungeonFloor(1, Random(run), size)
+
+
+def dungeon_case(size):
+    """
+    A full dungeon case: every floor generated and populated with monsters, items and pillars by the
+    DungeonManager.
+
+    :param size: The number of rooms per side of every floor, or None for the default sizes.
+    :return: A function taking the run number.
+    """
+    floor_sizes = [size] * FLOOR_COUNT if size is not None else None
+    return lambda run: DungeonManager.get_instance().initialize_dungeon(run, floor_sizes=floor_sizes)
+
+
+def map_case(size):
+    """
+    A create_map case, drawing a fully revealed floor generated up front.
+
+    :param size: The number of rooms per side.
+    :return: A function taking the run number.
+    """
+    floor = DungeonFloor(1, Random(0), size)
+    return lambda run: floor.create_map(reveal_all=True)
+
+
+def load_content():
+    """Fills the content managers from the seed data, as the database would."""
+    ItemManager.get_instance([(i + 1,) + row for i, row in enumerate(ITEMS_DATA)])
+    MonsterManager.get_instance([(i + 1,) + row for i, row in enumerate(MONSTERS_DATA)])
+
+
+def measure(function, runs):
+    """
+    Times a case and measures its peak memory.
+
+    :param function: The case, taking the run number.
+    :param runs: The number of timed runs.
+    :return: A result dictionary with the run count, p50 and p99 in milliseconds and peak memory in bytes.
+    """
+    # One untimed run first, so that imports and caches are warm
+    function(0)
+    times = []
+    for run in range(runs):
+        start = time.perf_counter()
+        function(run)
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    function(0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'runs': runs,
+            'p50_ms': statistics.median(times),
+            'p99_ms': statistics.quantiles(times, n=100, method='inclusive')[98],
+            'peak_bytes': peak}
+
+
+def run_benchmarks(sizes):
+    """
+    Runs every case.
+
+    :param sizes: The floor sizes to run the cases at.
+    :return: The results, keyed by case name such as 'floor/64'.
+    """
+    load_content()
+    results = {}
+    for size in sizes:
+        results[f'floor/{size}'] = measure(floor_case(size), max(MIN_RUNS, FLOOR_WORK // size))
+    results['dungeon/default'] = measure(dungeon_case(None), MIN_RUNS * 4)
+    for size in sizes:
+        results[f'dungeon/{size}'] = measure(dungeon_case(size), max(MIN_RUNS, DUNGEON_WORK // size))
+    for size in sizes:
+        results[f'create_map/{size}'] = measure(map_case(size), max(MIN_RUNS, FLOOR_WORK // size))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints how each case's p50 compares to a baseline run.
+
+    :param results: The results of this run.
+    :param baseline: The results of the baseline run.
+    :param threshold: The p50 ratio from which a case counts as a regression.
+    :return: The names of the regressed cases.
+    """
+    regressions = []
+    print(f"\n{'case':<20} {'base p50':>9} {'p50':>9} {'ratio':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['p50_ms'] / baseline[name]['p50_ms']
+        flag = "  REGRESSION" if ratio >= threshold else ""
+        print(f"{name:<20} {baseline[name]['p50_ms']:>9.3f} {result['p50_ms']:>9.3f} {ratio:>7.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Floor generation benchmark suite.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="floor sizes to run")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="compare against the results in this JSON file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="p50 ratio from which a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes)
+
+    print(f"{'case':<20} {'runs':>5} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>9}")
+    for name, result in results.items():
+        print(f"{name:<20} {result['runs']:>5} {result['p50_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+              f"{result['peak_bytes'] / 1024:>9.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                       'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Compares the binary save format against pickling the whole GameController, as older versions did.
+
+Run from the project root:
+    python -m benchmarks.save_format_benchmark
+"""
+import json
+import pickle
+import statistics
+import timeit
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA
+from assets.seeders.item_seeder import ITEMS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from assets.seeders.room_seeder import ROOM_DATA
+from src.controller.dungeon_manager import DungeonManager
+from src.controller.game_controller import GameController
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.managers.game_state_manager import GameStateManager
+from src.model.managers.item_manager import ItemManager
+from src.model.managers.monster_manager import MonsterManager
+from src.model.managers.room_manager import RoomManager
+from src.model.managers.save_format import decode_game_state, encode_game_state
+
+REPEATS = 7
+NUMBER = 50
+# Fixed so that every run measures the same dungeon
+SEED = 0
+
+
+def make_game_controller():
+    """
+    Builds a game in progress without opening a window: all four floors populated and the entrance of the
+    first floor visited.
+
+    :return: The game controller.
+    """
+    ItemManager.get_instance([(i + 1,) + row for i, row in enumerate(ITEMS_DATA)])
+    MonsterManager.get_instance([(i + 1,) + row for i, row in enumerate(MONSTERS_DATA)])
+    room_manager = RoomManager.get_instance([(json.dumps(doors), path, rotation) for doors, path, rotation in ROOM_DATA])
+    dungeon_manager = DungeonManager.get_instance()
+    dungeon_manager.initialize_dungeon(SEED)
+
+    game_controller = GameController.__new__(GameController)
+    game_controller.hero_name = ADVENTURERS_DATA[0][0]
+    game_controller.room_manager = room_manager
+    game_controller.dungeon_manager = dungeon_manager
+    game_controller.current_floor = 1
+    game_controller.position = dungeon_manager.get_floor_entrance(1)
+    game_controller.active_adventurer = AdventurerFactory.get_instance().make_adventurer(ADVENTURERS_DATA[0][:8])
+    game_controller.current_message = None
+    game_controller.pillar_status = {name: False for name in ItemManager.get_instance().one_time_items}
+    game_controller.return_to_menu = False
+    game_controller.debug = False
+    dungeon_manager.mark_room_visited(1, game_controller.position)
+    return game_controller
+
+
+def time_call(function):
+    """
+    Times a call, taking the median of several runs.
+
+    :param function: The function to time.
+    :return: Milliseconds per call.
+    """
+    runs = timeit.repeat(function, repeat=REPEATS, number=NUMBER)
+    return statistics.median(runs) / NUMBER * 1000
+
+
+def main():
+    game_controller = make_game_controller()
+    pickled = pickle.dumps(game_controller)
+    encoded = encode_game_state(game_controller.__getstate__())
+
+    results = [
+        ("pickle", len(pickled),
+         time_call(lambda: pickle.dumps(game_controller)),
+         time_call(lambda: pickle.loads(pickled))),
+        ("binary v1", len(encoded),
+         time_call(lambda: encode_game_state(game_controller.__getstate__())),
+         time_call(lambda: GameStateManager.restore_game_controller(decode_game_state(encoded))))
+    ]
+
+    print(f"{'format':<10} {'bytes':>8} {'save ms':>9} {'load ms':>9} {'total ms':>9}")
+    for name, size, save_ms, load_ms in results:
+        print(f"{name:<10} {size:>8} {save_ms:>9.3f} {load_ms:>9.3f} {save_ms + load_ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
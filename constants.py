@@ -27,6 +27,12 @@ FADED_BLUE = (100, 149, 237)
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 
+# Maximum redraws per second for screen loops (0 for no cap)
+FPS_CAP = 60
+
+# Posted by the save worker thread once a save has been written (or has failed)
+SAVE_COMPLETE_EVENT = pygame.USEREVENT + 1
+
 # Button Sizes
 MENU_BUTTON_WIDTH = 140
 MENU_BUTTON_HEIGHT = 40
@@ -98,8 +104,17 @@ ELITE_CHANCE = 0.15
 TRAP_CHANCE = 0.45
 ITEM_CHANCE = 0.55
 
-# For position marker on minimap
-MAP_CELL_WIDTH = 19
+# Memory budget (bytes) for transformed sprites cached by the SpriteManager
+SPRITE_CACHE_BUDGET = 16 * 1024 * 1024
+
+# Maximum number of rendered text surfaces kept by the TextCache
+TEXT_CACHE_SIZE = 256
 
 # For constructing minimap surface
-MAP_SURFACE_TILE_SIZE = 64
\ No newline at end of file
+MAP_SURFACE_TILE_SIZE = 64
+
+# Rooms per side the map surfaces are laid out for. Larger floors are scaled down to fit.
+MAP_SURFACE_TILES = 8
+
+# Width and height of the minimap drawn in the UI
+MINIMAP_SIZE = 150
\ No newline at end of file
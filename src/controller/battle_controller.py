@@ -1,7 +1,11 @@
 import sys
 import pygame
 from constants import BACKGROUND_COLOR, BLACK, LIGHT_BLUE, OFF_WHITE, WHITE
+from src.model.battle.battle_engine import BattleEngine
+from src.model.entities.combat_events import format_event
+from src.view.frame_limiter import FrameLimiter
 from src.view.gui_elements import Button
+from src.view.text_cache import TextCache
 
 
 class BattleController:
@@ -38,6 +42,8 @@ class BattleController:
         self.fonts = fonts
         self.draw_ui = draw_ui
         self.inventory_overlay = None
+        self.frame_limiter = FrameLimiter()
+        self.text_cache = TextCache.get_instance()
 
     def reset(self, screen, fonts, draw_ui):
         """
@@ -54,7 +60,7 @@ class BattleController:
     def start_battle(self, adventurer, monster, dungeon, current_floor, position, get_adventurer_portrait, minimap,
                      inventory_overlay):
         """
-        Handles the main battle loop.
+        Handles the main battle loop. The battle UI is redrawn once per handled batch of input.
 
         :param adventurer: The adventurer in the battle.
         :param monster: The current monster in the battle.
@@ -112,14 +118,15 @@ class BattleController:
 
         # Use the callable to fetch the hero portrait, then draw outline
         portrait = get_adventurer_portrait()
-        self.screen.blit(portrait, (650, 450))
+        if portrait is not None:
+            self.screen.blit(portrait, (650, 450))
         pygame.draw.rect(self.screen, BLACK, portrait_outline_top)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_left)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_bottom)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_right)
 
-        monster_text = self.fonts["small"].render(f"Monster HP: {monster.hp}", True, OFF_WHITE)
-        adventurer_text = self.fonts["small"].render(f"Your HP: {adventurer.hp}", True, OFF_WHITE)
+        monster_text = self.text_cache.render(self.fonts["small"], f"Monster HP: {monster.hp}", True, OFF_WHITE)
+        adventurer_text = self.text_cache.render(self.fonts["small"], f"Your HP: {adventurer.hp}", True, OFF_WHITE)
         self.screen.blit(monster_text, (50, 490))
         self.screen.blit(adventurer_text, (50, 510))
         self.screen.blit(minimap, (650, 0))
@@ -146,7 +153,7 @@ class BattleController:
         :param special_button: The button for using special ability
         :return: True if the battle continues, False otherwise.
         """
-        for event in pygame.event.get():
+        for event in self.frame_limiter.wait_for_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -219,8 +226,11 @@ class BattleController:
                 quit_button.draw(self.screen)
                 pygame.display.flip()
 
-                for event in pygame.event.get():
-                    if event.type == pygame.MOUSEBUTTONDOWN:
+                for event in self.frame_limiter.wait_for_events():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
                         mouse_pos = pygame.mouse.get_pos()
 
                         if menu_button.is_hovered(mouse_pos):
@@ -238,24 +248,7 @@ class BattleController:
         :param monster: The current monster in the battle.
         :param adventurer: The adventurer in the battle.
         """
-        if monster.hp > 0:
-            outcomes = adventurer.attack(monster).split(".")
-            for i in range(len(outcomes)):
-                # Call the passed draw_ui method (and add period back in)
-                self.draw_ui(outcomes[i] + ".", in_battle=True)
-                pygame.display.flip()
-                pygame.time.delay(1000)
-
-        if monster.hp > 0:
-            message = f"{monster.name} is attacking!"
-            # Call the passed draw_ui method
-            self.draw_ui(message)
-            outcomes = monster.attack(adventurer).split(".")
-            for i in range(len(outcomes)):
-                # Call the passed draw_ui method (and add period back in)
-                self.draw_ui(outcomes[i] + ".", in_battle=True)
-                pygame.display.flip()
-                pygame.time.delay(1000)
+        self.animate_turn(monster, BattleEngine(adventurer, monster).fight())
 
     def execute_special(self, monster, adventurer):
         """
@@ -264,23 +257,34 @@ class BattleController:
         :param monster: The current monster in the battle.
         :param adventurer: The adventurer in the battle.
         """
-        if monster.hp > 0:
-            # Call the special_action method to get the full message
-            outcomes = adventurer.special_action(monster).split(".")
-            for i in range(len(outcomes)):
-                if outcomes[i].strip():
-                    # Call the passed draw_ui method
-                    self.draw_ui(outcomes[i] + ".", in_battle=True)
-                    pygame.display.flip()
-                    pygame.time.delay(1000)
-
-        if monster.hp > 0:
-            message = f"{monster.name} is attacking!"
+        self.animate_turn(monster, BattleEngine(adventurer, monster).special())
+
+    def animate_turn(self, monster, result):
+        """
+        Shows a turn resolved by the BattleEngine, one combat event at a time. The adventurer's HP is shown as
+        it was after each side acted, rather than as it is at the end of the turn.
+
+        :param monster: The current monster in the battle.
+        :param result: The TurnResult of the turn.
+        """
+        for event in result.adventurer_events:
+            self.show_battle_message(format_event(event), result.adventurer_hp_after_action)
+
+        if result.monster_attacked:
             # Call the passed draw_ui method
-            self.draw_ui(message, in_battle=True)
-            outcomes = monster.attack(adventurer).split(".")
-            for i in range(len(outcomes)):
-                # Call the passed draw_ui method (and add period back in)
-                self.draw_ui(outcomes[i] + ".", in_battle=True)
-                pygame.display.flip()
-                pygame.time.delay(1000)
\ No newline at end of file
+            self.draw_ui(f"{monster.name} is attacking!", in_battle=True,
+                         adventurer_hp=result.adventurer_hp_after_action)
+            for event in result.monster_events:
+                self.show_battle_message(format_event(event), result.adventurer_hp)
+
+    def show_battle_message(self, message, adventurer_hp=None):
+        """
+        Shows a battle message for a second.
+
+        :param message: The message.
+        :param adventurer_hp: The adventurer's HP to show with it, or None for their current HP.
+        """
+        # Call the passed draw_ui method
+        self.draw_ui(message, in_battle=True, adventurer_hp=adventurer_hp)
+        pygame.display.flip()
+        pygame.time.delay(1000)
@@ -1,6 +1,67 @@
+import hashlib
 import os
 import sqlite3
 
+TABLE_COMMANDS = {
+    "adventurers": """
+        CREATE TABLE IF NOT EXISTS adventurers (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            type TEXT,
+            max_HP INTEGER,
+            attack_speed INTEGER,
+            chance_to_hit REAL,
+            attack_damage_min INTEGER,
+            attack_damage_max INTEGER,
+            chance_to_block REAL,
+            special_attack TEXT
+        );
+    """,
+    "monsters": """
+        CREATE TABLE IF NOT EXISTS monsters (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            type TEXT,
+            max_HP INTEGER,
+            attack_speed INTEGER,
+            chance_to_hit REAL,
+            attack_damage_min INTEGER,
+            attack_damage_max INTEGER,
+            chance_to_heal REAL,
+            heal_range_min INTEGER,
+            heal_range_max INTEGER
+        );
+    """,
+    "items": """
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT,
+            target TEXT NOT NULL,
+            one_time_item INTEGER, -- Need to use INTEGER instead of BOOLEAN
+            effect_min INTEGER,
+            effect_max INTEGER,
+            buff_type TEXT
+        );
+    """,
+    "rooms": """
+        CREATE TABLE IF NOT EXISTS rooms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            doors TEXT NOT NULL,
+            image_path TEXT NOT NULL,
+            rotation INTEGER NOT NULL,
+            UNIQUE(doors)
+        );
+    """,
+    # Holds the content hash of the seeded data
+    "metadata": """
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+}
+
 
 class DatabaseInitializer:
     """Responsible for initializing the database."""
@@ -35,63 +96,10 @@ class DatabaseInitializer:
 
     def create_tables(self):
         """Creates all necessary tables in the database."""
-        table_commands = {
-            "adventurers": """
-                CREATE TABLE IF NOT EXISTS adventurers (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    type TEXT,
-                    max_HP INTEGER,
-                    attack_speed INTEGER,
-                    chance_to_hit REAL,
-                    attack_damage_min INTEGER,
-                    attack_damage_max INTEGER,
-                    chance_to_block REAL,
-                    special_attack TEXT
-                );
-            """,
-            "monsters": """
-                CREATE TABLE IF NOT EXISTS monsters (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    type TEXT,
-                    max_HP INTEGER,
-                    attack_speed INTEGER,
-                    chance_to_hit REAL,
-                    attack_damage_min INTEGER,
-                    attack_damage_max INTEGER,
-                    chance_to_heal REAL,
-                    heal_range_min INTEGER,
-                    heal_range_max INTEGER
-                );
-            """,
-            "items": """
-                CREATE TABLE IF NOT EXISTS items (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    target TEXT NOT NULL,
-                    one_time_item INTEGER, -- Need to use INTEGER instead of BOOLEAN
-                    effect_min INTEGER,
-                    effect_max INTEGER,
-                    buff_type TEXT
-                );
-            """,
-            "rooms": """
-                CREATE TABLE IF NOT EXISTS rooms (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    doors TEXT NOT NULL,
-                    image_path TEXT NOT NULL,
-                    rotation INTEGER NOT NULL,
-                    UNIQUE(doors)
-                );
-            """
-        }
-
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                for table, command in table_commands.items():
+                for table, command in TABLE_COMMANDS.items():
                     cursor.execute(command)
                 conn.commit()
         except sqlite3.Error as e:
@@ -108,10 +116,47 @@ class DatabaseInitializer:
                 cursor.execute("DROP TABLE IF EXISTS monsters")
                 cursor.execute("DROP TABLE IF EXISTS items")
                 cursor.execute("DROP TABLE IF EXISTS rooms")
+                cursor.execute("DROP TABLE IF EXISTS metadata")
             self.create_tables()
         else:
             self.create_tables()
 
+    @staticmethod
+    def content_hash(seed_data):
+        """
+        Computes a fingerprint of the schema and the seed data. If either changes, so does the hash.
+        :param seed_data: The rows written by the seeders.
+        :return: The hex digest of the content.
+        """
+        return hashlib.sha256(repr((TABLE_COMMANDS, seed_data)).encode()).hexdigest()
+
+    def get_content_hash(self):
+        """
+        Reads the content hash stored when the database was last seeded.
+        :return: The stored hash, or None if the database has not been fully seeded.
+        """
+        if not self.database_exists():
+            return None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("SELECT value FROM metadata WHERE key = 'content_hash'").fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set_content_hash(self, content_hash):
+        """
+        Stores the content hash once seeding has finished.
+        :param content_hash: The hash of the seeded content.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('content_hash', ?)",
+                             (content_hash,))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error storing content hash: {e}")
+
 
 if __name__ == "__main__":
     import sys
@@ -1,8 +1,106 @@
+import random
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from src.model.dungeon.dungeonfloor import DungeonFloor
 from src.model.factories.item_factory import ItemFactory
 from src.model.factories.monster_factory import MonsterFactory
 from src.model.managers.item_manager import ItemManager
 from src.model.managers.monster_manager import MonsterManager
+from src.model.random_streams import RandomStreams
+
+# Number of floors in a dungeon
+FLOOR_COUNT = 4
+
+# How initialize_dungeon builds the floors after the first one: all at once, on a background worker thread,
+# or only when a floor is first used
+GENERATE_EAGER = 'eager'
+GENERATE_BACKGROUND = 'background'
+GENERATE_LAZY = 'lazy'
+
+
+class DungeonFloors(Sequence):
+    """
+    The floors of a dungeon, some of which may not be generated yet. Indexing a floor that is not ready waits
+    for its background generation to finish, or generates it there and then if nothing else is.
+    """
+
+    def __init__(self, generate_floor, count):
+        """
+        Constructor. No floors are generated yet.
+
+        :param generate_floor: Generates the floor with the given index (0-indexed).
+        :param count: The number of floors.
+        """
+        self._generate_floor = generate_floor
+        self._floors = [None] * count
+        # Futures of floors being generated in the background, by index
+        self._pending = {}
+        self._executor = None
+
+    def generate(self, index):
+        """
+        Generates a floor now, on the calling thread.
+
+        :param index: The floor index (0-indexed).
+        """
+        self._floors[index] = self._generate_floor(index)
+
+    def generate_in_background(self, indexes):
+        """
+        Generates floors one after another on a worker thread.
+
+        :param indexes: The floor indexes (0-indexed), in the order to generate them.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="floor-generator")
+        for index in indexes:
+            self._pending[index] = executor.submit(self._generate_floor, index)
+        # The worker thread exits once the queued floors are done
+        executor.shutdown(wait=False)
+        self._executor = executor
+
+    def cancel(self):
+        """
+        Stops background generation: floors not started yet are dropped, to be generated on first use instead,
+        and the floor being generated is waited for.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for index, future in list(self._pending.items()):
+            if future.cancelled():
+                del self._pending[index]
+
+    def is_ready(self, index):
+        """
+        Whether a floor can be used without waiting for it to be generated.
+
+        :param index: The floor index (0-indexed).
+        :return: True if the floor has been generated.
+        """
+        future = self._pending.get(index)
+        return self._floors[index] is not None or (future is not None and future.done())
+
+    def __getitem__(self, index):
+        """
+        Returns a floor, generating it or waiting for it first if need be.
+
+        :param index: The floor index (0-indexed), or a slice.
+        :return: The floor, or a list of floors for a slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self._floors))[index]
+        floor = self._floors[index]
+        if floor is None:
+            future = self._pending.pop(index, None)
+            floor = future.result() if future is not None else self._generate_floor(index)
+            self._floors[index] = floor
+        return floor
+
+    def __len__(self):
+        """Returns the number of floors, generated or not."""
+        return len(self._floors)
 
 
 class DungeonManager:
@@ -28,92 +126,135 @@ class DungeonManager:
         if DungeonManager._instance is not None:
             raise Exception("This class is a singleton! Use get_instance().")
         self.dungeon = []
+        # Rooms per side of each floor, or None for the default sizes. Set by initialize_dungeon.
+        self.floor_sizes = None
+        # Replaced with a seeded set of streams by initialize_dungeon
+        self.random_streams = RandomStreams()
         self.monster_manager = MonsterManager.get_instance()
         self.item_manager = ItemManager.get_instance()
 
-    def initialize_dungeon(self):
+    def initialize_dungeon(self, seed=None, generation=GENERATE_EAGER, floor_sizes=None):
         """
-        Creates and populates all floors of the dungeon.
+        Creates and populates all floors of the dungeon. Every floor, the pillar order and combat draw from
+        their own stream derived from the seed, so the same seed always gives the same dungeon, whichever
+        generation mode is used.
+        :param seed The seed to generate from, or None for a random one. Kept in random_streams.seed.
+        :param generation GENERATE_EAGER to build every floor now, GENERATE_BACKGROUND to build the first floor
+        now and the rest on a worker thread, or GENERATE_LAZY to build the first floor now and the rest when
+        first used.
+        :param floor_sizes The number of rooms per side of each floor, or None for the default sizes (5 to 8).
         :return The newly created dungeon.
         """
+        if floor_sizes is not None and len(floor_sizes) != FLOOR_COUNT:
+            raise ValueError(f"Expected {FLOOR_COUNT} floor sizes, got {len(floor_sizes)}.")
+        # A worker thread still generating the last dungeon would read the new pillar order
+        if isinstance(self.dungeon, DungeonFloors):
+            self.dungeon.cancel()
+        self.floor_sizes = floor_sizes
+        self.random_streams = RandomStreams(seed)
         # Randomize the pillar order
-        self.item_manager.initialize_pillar_order()
-        self.dungeon = [DungeonFloor(1), DungeonFloor(2), DungeonFloor(3), DungeonFloor(4)]
-
-        for i in range(4):
-            all_rooms = self.dungeon[i].get_room_list()
-
-            monster_rooms = [
-                coords for coords in all_rooms if self.dungeon[i].fetch_room(coords[0],
-                                                                             coords[1]).get_type() == 'MONSTER'
-            ]
-            elite_rooms = [
-                coords for coords in all_rooms if self.dungeon[i].fetch_room(coords[0], coords[1]).get_type() == 'ELITE'
-            ]
-            item_rooms = [
-                coords for coords in all_rooms if self.dungeon[i].fetch_room(coords[0], coords[1]).get_type() == 'ITEM'
-            ]
-
-            self.populate_rooms(i, monster_rooms, elite_rooms, item_rooms, all_rooms)
+        self.item_manager.initialize_pillar_order(self.random_streams.stream('pillars'))
+        # Create the streams up front, so that a worker thread only ever reads them
+        for i in range(FLOOR_COUNT):
+            self.random_streams.stream('floor', i + 1)
+            self.random_streams.stream('contents', i + 1)
+        self.random_streams.stream('combat')
 
+        # Floors generated later use the streams and sizes of this call, even if the fields change meanwhile
+        self.dungeon = DungeonFloors(partial(self.generate_floor, random_streams=self.random_streams,
+                                             floor_sizes=floor_sizes), FLOOR_COUNT)
+        self.dungeon.generate(0)
+        later_floors = range(1, FLOOR_COUNT)
+        if generation == GENERATE_EAGER:
+            for i in later_floors:
+                self.dungeon.generate(i)
+        elif generation == GENERATE_BACKGROUND:
+            self.dungeon.generate_in_background(later_floors)
+        elif generation != GENERATE_LAZY:
+            raise ValueError(f"Unknown floor generation mode: {generation}")
         return self.dungeon
 
-    def populate_rooms(self, floor, monster_rooms, elite_rooms, item_rooms, all_rooms):
+    def generate_floor(self, index, random_streams, floor_sizes):
+        """
+        Generates and populates one floor from its own random streams. Only touches the new floor, so it can
+        run on a worker thread.
+        :param index The floor index (0-indexed).
+        :param random_streams The RandomStreams of the dungeon the floor belongs to.
+        :param floor_sizes The number of rooms per side of each floor, or None for the default sizes.
+        :return The populated floor.
+        """
+        size = floor_sizes[index] if floor_sizes is not None else None
+        floor = DungeonFloor(index + 1, random_streams.stream('floor', index + 1), size)
+        self.populate_rooms(floor, index, floor.get_rooms_of_type('MONSTER'), floor.get_rooms_of_type('ELITE'),
+                            floor.get_rooms_of_type('ITEM'), floor.get_room_list_view(),
+                            random_streams.stream('contents', index + 1), random_streams.stream('combat'))
+        return floor
+
+    def populate_rooms(self, floor, floor_index, monster_rooms, elite_rooms, item_rooms, all_rooms, rng=random,
+                       combat_rng=None):
         """
         Populates the given floor with monsters, items, and pillars.
-        :param floor The floor on which the rooms will be populated.
-        :param monster_rooms A list of tuples (row, column) which denote the location of MONSTER rooms.
-        :param elite_rooms A list of tuples (row, column) which denote the location of ELITE rooms.
-        :param item_rooms A list of tuples (row, column) which denote the location of ITEM rooms.
-        :param all_rooms A list of tuples (row, column) which denote the location of all rooms.
+        :param floor The DungeonFloor on which the rooms will be populated.
+        :param floor_index The floor number (0-indexed), which picks the pillar.
+        :param monster_rooms The tuples (row, column) which denote the location of MONSTER rooms.
+        :param elite_rooms The tuples (row, column) which denote the location of ELITE rooms.
+        :param item_rooms The tuples (row, column) which denote the location of ITEM rooms.
+        :param all_rooms A sequence of tuples (row, column) which denote the location of all rooms.
+        :param rng The random stream to pick monsters and items with.
+        :param combat_rng The random stream the monsters fight with, or None for the dungeon's combat stream.
         """
         for room_coords in monster_rooms:
-            self.place_monster(floor, room_coords, monster_type="Normal")
+            self.place_monster(floor, room_coords, monster_type="Normal", rng=rng, combat_rng=combat_rng)
 
         for room_coords in elite_rooms:
-            self.place_monster(floor, room_coords, monster_type="Elite")
+            self.place_monster(floor, room_coords, monster_type="Elite", rng=rng, combat_rng=combat_rng)
 
         for room_coords in item_rooms:
-            self.place_item(floor, room_coords)
+            self.place_item(floor, room_coords, rng)
 
         # Third room for the pillar for debugging knowledge
         pillar_coords = all_rooms[2]
-        self.place_pillar(floor, pillar_coords)
+        self.place_pillar(floor, floor_index, pillar_coords)
 
-    def place_monster(self, floor, room_coords, monster_type):
+    def place_monster(self, floor, room_coords, monster_type, rng=random, combat_rng=None):
         """
         Places a monster in the specified room.
-        :param floor The floor number (0-indexed).
+        :param floor The DungeonFloor.
         :param room_coords The coordinates where the monster will be placed (row, column).
         :param monster_type The type of the monster.
+        :param rng The random stream to pick the monster with.
+        :param combat_rng The random stream the monster fights with, or None for the dungeon's combat stream.
         """
-        raw_data = self.monster_manager.get_monster_data(monster_type=monster_type)
+        raw_data = self.monster_manager.get_monster_data(monster_type=monster_type, rng=rng)
         if raw_data:
             raw_data_sliced = raw_data[1:]
             try:
                 monster = MonsterFactory.get_instance().make_monster(raw_data_sliced)
                 if monster:
-                    self.dungeon[floor].fetch_room(room_coords[0], room_coords[1]).set_monster(monster)
+                    monster.rng = combat_rng if combat_rng is not None else self.random_streams.stream('combat')
+                    floor.fetch_room(room_coords[0], room_coords[1]).set_monster(monster)
             except ValueError as e:
                 print(f"[DungeonManager] Error creating {monster_type.lower()} monster: {e}")
 
-    def place_item(self, floor, room_coords):
+    def place_item(self, floor, room_coords, rng=random):
         """
         Places a consumable item in the specified room.
-        :param floor: The floor number (0-indexed).
+        :param floor: The DungeonFloor.
         :param room_coords: The coordinates of the room where the item will be placed (row, column).
+        :param rng: The random stream to pick the item with.
         """
         # Attempt to get raw item data and create the item
-        raw_data = self.item_manager.get_random_consumable_item_data()
+        raw_data = self.item_manager.get_random_consumable_item_data(rng)
         if raw_data:
             item = ItemFactory.get_instance().create_item_from_raw(raw_data)
             if item:
-                self.dungeon[floor].fetch_room(room_coords[0], room_coords[1]).set_item(item)
+                floor.fetch_room(room_coords[0], room_coords[1]).set_item(item)
 
-    def place_pillar(self, floor_index, pillar_coords):
+    def place_pillar(self, floor, floor_index, pillar_coords):
         """
         Places a unique pillar item in the specified room.
-        :param floor_index: The floor number (0-indexed).
+        :param floor: The DungeonFloor.
+        :param floor_index: The floor number (0-indexed), which picks the pillar.
         :param pillar_coords: The coordinates of the room where the pillar shall be placed (row, column).
         """
         # Attempt to retrieve unique item data and place the pillar
@@ -121,7 +262,7 @@ class DungeonManager:
         if raw_data:
             pillar_item = ItemFactory.get_instance().create_unique_item(raw_data)
             if pillar_item:
-                self.dungeon[floor_index].fetch_room(pillar_coords[0], pillar_coords[1]).set_item(pillar_item)
+                floor.fetch_room(pillar_coords[0], pillar_coords[1]).set_item(pillar_item)
             else:
                 print(f"[DungeonManager] Failed to create a unique pillar item for Floor {floor_index + 1}.")
         else:
@@ -170,6 +311,20 @@ class DungeonManager:
         floor_map = self.dungeon[floor - 1].create_map(reveal_all)
         return floor_map
 
+    def get_minimap(self, floor, reveal_all=False):
+        """
+        Returns the cached minimap for the specified floor, scaled for the UI. The returned Surface is updated in
+        place as rooms are visited, so callers can keep drawing the same Surface.
+        :param floor: The floor number (1-indexed).
+        :param reveal_all: Whether to reveal all rooms or not
+        :return The minimap of the floor as a pygame Surface.
+        """
+        if floor < 1 or floor > len(self.dungeon):
+            print(f"[DungeonManager] Error: Invalid floor number {floor}.")
+            raise ValueError(f"Invalid floor number: {floor}")
+
+        return self.dungeon[floor - 1].get_minimap(reveal_all)
+
     def get_monster_in_room(self, floor, position):
         """
         Returns the monster in the specified room on the given floor.
@@ -212,10 +367,16 @@ class DungeonManager:
         """ Stores the object's state in a pickled dictionary.
         :return: dictionary of states to be stored.
         """
-        return {'dungeon': self.dungeon}
+        return {'dungeon': list(self.dungeon)}
 
     def __setstate__(self, state):
-        """ Restores the object's state from the pickled dictionary.
+        """ Restores the object's state from the pickled dictionary. Unpickling skips __init__, so the other
+        fields are rebuilt here. The seed is not pickled, so the random streams start from a new one.
         :param state: dictionary of restored states.
         """
-        self.dungeon = state['dungeon']
\ No newline at end of file
+        self.dungeon = state['dungeon']
+        # Every pickled floor is already generated, these are only kept for consistency
+        self.floor_sizes = [floor.get_length() for floor in self.dungeon]
+        self.random_streams = RandomStreams()
+        self.monster_manager = MonsterManager.get_instance()
+        self.item_manager = ItemManager.get_instance()
\ No newline at end of file
@@ -1,16 +1,17 @@
-import os
 import random
 import sys
 import pygame
 from constants import (
     BACKGROUND_COLOR, BLACK, BROWN, DARK_GREY, DARK_RED, DARK_VIOLET, FADED_GRAY,
-    GOLD, LIGHT_BLUE, MAP_CELL_WIDTH, MEDIUM_GREY, MENU_BUTTON_HEIGHT,
-    MENU_BUTTON_WIDTH, OFF_WHITE, RED, SCREEN_WIDTH, SCREEN_HEIGHT, VIOLET, WHITE, get_fonts
+    GOLD, LIGHT_BLUE, MEDIUM_GREY, MENU_BUTTON_HEIGHT,
+    MENU_BUTTON_WIDTH, OFF_WHITE, RED, SAVE_COMPLETE_EVENT, SCREEN_WIDTH, SCREEN_HEIGHT, VIOLET, WHITE, get_fonts
 )
 from src.controller.battle_controller import BattleController
-from src.controller.dungeon_manager import DungeonManager
+from src.controller.dungeon_manager import DungeonManager, GENERATE_BACKGROUND
+from src.view.frame_limiter import FrameLimiter
 from src.view.gui_elements import Button
 from src.view.inventory_overlay import InventoryOverlay
+from src.view.text_cache import TextCache
 from src.model.managers.adventurer_manager import AdventurerManager
 from src.model.managers.game_state_manager import GameStateManager
 from src.model.managers.room_manager import RoomManager
@@ -23,8 +24,12 @@ class GameController:
     Contains most of the game state. Handles the main gameplay loop, delegates responsibilities appropriately.
     """
 
-    def __init__(self, screen, hero_name, debug):
-        """Constructor. Initializes all fields, collects completed minimaps, initializes dungeon."""
+    def __init__(self, screen, hero_name, debug, seed=None):
+        """
+        Constructor. Initializes all fields and the dungeon.
+
+        :param seed: The seed to generate the dungeon from, or None for a random one.
+        """
         self.screen = screen
         self.hero_name = hero_name
         self.debug = debug
@@ -33,13 +38,12 @@ class GameController:
         self.sprite_manager = SpriteManager.get_instance()
         self.battle_manager = BattleController.get_instance(self.screen, self.fonts, self.draw_ui)
         self.dungeon_manager = DungeonManager.get_instance()
-        self.dungeon_manager.initialize_dungeon()
+        # Only the first floor is generated before the game starts, the rest follow on a worker thread
+        self.dungeon_manager.initialize_dungeon(seed, GENERATE_BACKGROUND)
         self.adventurer_manager = AdventurerManager.get_instance()
+        self.frame_limiter = FrameLimiter()
+        self.text_cache = TextCache.get_instance()
         self.minimap = None
-        self.full_maps = []
-        # Collect all fully revealed maps for display upon game completion
-        for i in range(4):
-            self.full_maps.append(self.dungeon_manager.get_floor_map(i + 1, reveal_all=True))
         # Attributes for game state
         self.current_floor = 1
         self.position = self.dungeon_manager.get_floor_entrance(self.current_floor)
@@ -65,13 +69,13 @@ class GameController:
 
     def display_game(self):
         """
-        Main gameplay loop. Delegates appropriate behaviors to other methods
+        Main gameplay loop. Delegates appropriate behaviors to other methods. The screen is only redrawn
+        after input arrives, at most FPS_CAP times a second; the loop sleeps in between.
 
         :return: 1 upon the user choosing to return to the main menu (upon battle defeat).
         """
-        if self.debug:
-            self.minimap = pygame.transform.scale(self.dungeon_manager.get_floor_map(self.current_floor, self.debug),
-                                                  (150, 150))
+        # Cached per floor and repainted in place as rooms are visited
+        self.minimap = self.dungeon_manager.get_minimap(self.current_floor, self.debug)
         while True:
             self.screen.fill(DARK_GREY)
 
@@ -80,14 +84,11 @@ class GameController:
             room_doors = current_room.valid_directions
             sprite_config = self.room_manager.get_room_by_doors(room_doors)
             self.render_room_sprite(sprite_config)
-            # Don't fetch map every frame if not needed.
-            if not self.debug:
-                self.minimap = pygame.transform.scale(self.dungeon_manager.get_floor_map(self.current_floor),
-                                                      (150, 150))
             self.draw_ui()
+            pygame.display.flip()
 
-            # Handle events
-            for event in pygame.event.get():
+            # Sleep until input arrives, then handle events
+            for event in self.frame_limiter.wait_for_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -117,8 +118,16 @@ class GameController:
                             dungeon=self.dungeon_manager.dungeon[self.current_floor - 1]
                         )
                     elif self.save_button.is_hovered(mouse_pos):
-                        GameStateManager.save_game_state(self)
-                        self.display_message("Game saved!", 500)
+                        GameStateManager.save_game_state(self, self.on_save_complete)
+                    elif event.button == 1:
+                        # Clicking a room on the minimap travels there
+                        target = self.dungeon_manager.dungeon[self.current_floor - 1].get_map_tile_at(
+                            mouse_pos[0] - 650, mouse_pos[1])
+                        if target is not None:
+                            self.travel_to(target)
+
+                elif event.type == SAVE_COMPLETE_EVENT:
+                    self.display_message("Game saved!" if event.error is None else "Could not save the game.")
 
                 elif event.type == pygame.KEYDOWN:
                     self.player_movement(event.key)
@@ -126,7 +135,6 @@ class GameController:
             if self.return_to_menu:
                 # This will be seen by main.py and trigger a return to the main menu.
                 return 1
-            pygame.display.flip()
 
     def player_movement(self, key):
         """
@@ -162,8 +170,37 @@ class GameController:
             else:
                 self.display_message("Invalid move: No valid path in that direction.", 250)
 
+    def travel_to(self, target):
+        """
+        Auto-travel: walks the shortest path through visited rooms to a room shown on the minimap in one action,
+        so it never walks into a room the player has not seen. Travel stops early in any room that starts an
+        interaction, such as a battle, an item or the exit.
+
+        :param target: The coordinates of the room to travel to (row, column).
+        """
+        floor = self.dungeon_manager.dungeon[self.current_floor - 1]
+        if target == self.position:
+            return
+        if not floor.fetch_room(*target).get_visited():
+            self.display_message("You can only travel to rooms you have seen.", 250)
+            return
+        path = floor.get_navigation().visited_path(self.position, target)
+        if path is None:
+            self.display_message("There is no known way to get there.", 250)
+            return
+
+        for coords in path:
+            self.position = coords
+            if self.room_interaction():
+                break
+
     def room_interaction(self):
-        """Handles interaction with the current room."""
+        """
+        Handles interaction with the current room.
+
+        :return: True if the room started an interaction (a battle, an item, a pillar, a trap or the exit), which
+        stops auto-travel.
+        """
         current_room = self.dungeon_manager.get_room(self.current_floor, self.position)
 
         if current_room.type in ["MONSTER", "ELITE"] and current_room.has_monster():
@@ -172,15 +209,18 @@ class GameController:
             self.handle_item_room()
         elif current_room.type == "EXIT":
             self.handle_exit_room()
-        elif current_room.type == "ENTRANCE":
-            self.display_message("You are back at the entrance.")
         elif current_room.type == "PILLAR" and current_room.has_item():
             self.handle_pillar_room()
         elif current_room.type == "TRAP" and not current_room.visited:
             self.handle_trap_room()
-        elif current_room.type == "EMPTY":
-            self.dungeon_manager.mark_room_visited(self.current_floor, self.position)
-            self.display_message("You've found an empty room. It smells in here.")
+        else:
+            if current_room.type == "ENTRANCE":
+                self.display_message("You are back at the entrance.")
+            elif current_room.type == "EMPTY":
+                self.dungeon_manager.mark_room_visited(self.current_floor, self.position)
+                self.display_message("You've found an empty room. It smells in here.")
+            return False
+        return True
 
     def handle_monster_room(self, room):
         """
@@ -265,7 +305,8 @@ class GameController:
     def handle_trap_room(self):
         """Handles interactions with TRAP rooms."""
         # Ensure player can't die to trap.
-        trap_dmg = min(random.randint(1, 10), self.active_adventurer.hp - 1)
+        trap_dmg = min(self.dungeon_manager.random_streams.stream('traps').randint(1, 10),
+                       self.active_adventurer.hp - 1)
         self.active_adventurer._update_hp(trap_dmg)
         self.display_message(f"It's a trap! You take {trap_dmg} damage.")
         self.dungeon_manager.mark_room_visited(self.current_floor, self.position)
@@ -316,10 +357,7 @@ class GameController:
             self.current_floor += 1
             self.position = self.dungeon_manager.get_floor_entrance(self.current_floor)
             self.dungeon_manager.mark_room_visited(self.current_floor, self.position)
-            if self.debug:
-                self.minimap = pygame.transform.scale(
-                    self.dungeon_manager.get_floor_map(self.current_floor, self.debug),
-                    (150, 150))
+            self.minimap = self.dungeon_manager.get_minimap(self.current_floor, self.debug)
             self.display_message(f"You've now entered floor {self.current_floor}.")
         else:
             # Player has not found all required pillars
@@ -350,6 +388,10 @@ class GameController:
         end_body6 = self.fonts["medium"].render("Hit \"NEXT\" to view the complete map!",
                                                 True, OFF_WHITE)
 
+        # Fully revealed maps of every floor
+        full_maps = [self.dungeon_manager.get_floor_map(i + 1, reveal_all=True)
+                     for i in range(len(self.dungeon_manager.dungeon))]
+
         # Buttons
         end_menu_button = Button(DARK_GREY, 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
         next_button = Button(OFF_WHITE, 635, 520, MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, self.fonts["small"],
@@ -383,7 +425,6 @@ class GameController:
         end_running = True
         while end_running:
             clicked = False
-            mouse_pos = pygame.mouse.get_pos()
             end_menu_button.draw(self.screen, outline=True)
             main_menu_button.draw(self.screen, outline=True)
             if position == 0:
@@ -421,15 +462,16 @@ class GameController:
                 self.screen.blit(empty_text, (590, 280 + elite_text.get_height() / 2 - 3))
                 self.screen.blit(entrance_text, (590, 330 + elite_text.get_height() / 2 - 3))
                 self.screen.blit(exit_text, (590, 380 + elite_text.get_height() / 2 - 3))
-                map_surface = pygame.transform.scale(self.full_maps[position - 1], (400, 400))
+                map_surface = pygame.transform.scale(full_maps[position - 1], (400, 400))
                 self.screen.blit(map_surface, (130, 25))
                 floor_text = self.fonts["large"].render(f"Floor {position}", True, OFF_WHITE)
                 self.screen.blit(floor_text, (SCREEN_WIDTH / 2 - floor_text.get_width() / 2, 430))
                 prev_button.draw(self.screen, True)
                 if position != 4:
                     next_button.draw(self.screen, True)
+            pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in self.frame_limiter.wait_for_events():
                 # left click
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     clicked = True
@@ -437,6 +479,7 @@ class GameController:
                     pygame.quit()
                     exit()
 
+            mouse_pos = pygame.mouse.get_pos()
             if clicked:
                 if next_button.is_hovered(mouse_pos) and position < 4:
                     position += 1
@@ -446,8 +489,6 @@ class GameController:
                     # Will be seen by handle_exit_room, which will set the return_to_menu field to True
                     return 1
 
-            pygame.display.flip()
-
     def render_room_sprite(self, sprite_config):
         """Renders the sprite for the current room."""
         if sprite_config and "sprite_name" in sprite_config and "rotation" in sprite_config:
@@ -466,10 +507,10 @@ class GameController:
     def render_monster_sprite(self, monster_name):
         choice = random.choice(("_one", "_two"))
         if monster_name == "Tom":
-            sprite = self.sprite_manager.get_sprite("tom")
+            sprite_name = "tom"
         else:
-            sprite = self.sprite_manager.get_sprite(monster_name.lower() + choice)
-        sprite_scaled = pygame.transform.scale(sprite, (450, 450))
+            sprite_name = monster_name.lower() + choice
+        sprite_scaled = self.sprite_manager.get_transformed_sprite(sprite_name, scale=(450, 450))
         self.screen.blit(sprite_scaled, (100, 0))
 
     def display_message(self, message, delay=0, in_battle=False):
@@ -479,11 +520,25 @@ class GameController:
         if delay > 0:
             pygame.time.delay(delay)
 
+    @staticmethod
+    def on_save_complete(error):
+        """
+        Save completion callback. Runs on the save worker thread, so it only posts an event for the gameplay loop.
+
+        :param error: None if the game was saved, otherwise the exception that stopped the save.
+        """
+        if error is not None:
+            print(f"[ERROR] Could not save the game: {error}")
+        # The game may have been closed while the save was being written
+        if pygame.get_init():
+            pygame.event.post(pygame.event.Event(SAVE_COMPLETE_EVENT, error=error))
+
     def set_active_adventurer(self, adventurer_name):
         """Sets the active adventurer."""
         raw_data = self.adventurer_manager.get_adventurer_data(name=adventurer_name)[1:]
         if raw_data:
             self.active_adventurer = AdventurerFactory.get_instance().make_adventurer(raw_data)
+            self.active_adventurer.rng = self.dungeon_manager.random_streams.stream('combat')
             if self.debug:
                 # Overpower Stats
                 self.active_adventurer.apply_buff(999 - self.active_adventurer.max_hp, "max_hp")
@@ -495,12 +550,14 @@ class GameController:
             print(f"Adventurer '{adventurer_name}' not found.")
         self.adventurer_manager.active_adventurer = self.active_adventurer
 
-    def draw_ui(self, message=None, in_battle=False):
+    def draw_ui(self, message=None, in_battle=False, adventurer_hp=None):
         """
         Draws the game's user interface.
 
         :param message: The message to be drawn, if any.
         :param in_battle: Whether the adventurer is currently in battle or not.
+        :param adventurer_hp: The HP to show for the adventurer, or None for their current HP. Battle messages
+        show the HP as of the step being shown.
         """
         bottom_rect = pygame.Rect(0, 450, 800, 150)
         right_rect = pygame.Rect(650, 0, 150, 450)
@@ -513,21 +570,25 @@ class GameController:
 
         # Draw adventurer portrait (and outline)
         portrait = self.get_adventurer_portrait()
-        self.screen.blit(portrait, (650, 450))
+        if portrait is not None:
+            self.screen.blit(portrait, (650, 450))
         pygame.draw.rect(self.screen, BLACK, portrait_outline_top)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_left)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_bottom)
         pygame.draw.rect(self.screen, BLACK, portrait_outline_right)
 
         # Display adventurer stats
-        current_hp, max_hp = self.active_adventurer.hp, self.active_adventurer.max_hp
+        current_hp = adventurer_hp if adventurer_hp is not None else self.active_adventurer.hp
+        max_hp = self.active_adventurer.max_hp
         block_chance, attack_speed = self.active_adventurer.block_chance, self.active_adventurer.attack_speed
         damage_range, hit_chance = self.active_adventurer.damage_range, self.active_adventurer.hit_chance
-        hp_text = self.fonts["small"].render(f"HP: {current_hp} / {max_hp}", True, OFF_WHITE)
-        block_text = self.fonts["extra_small"].render(f"Block %: {block_chance * 100:.0f}%", True, OFF_WHITE)
-        speed_text = self.fonts["extra_small"].render(f"Speed: {attack_speed}", True, OFF_WHITE)
-        range_text = self.fonts["extra_small"].render(f"Attack: {damage_range[0]}-{damage_range[1]}", True, OFF_WHITE)
-        hit_text = self.fonts["extra_small"].render(f"Hit %: {hit_chance * 100:.0f}%", True, OFF_WHITE)
+        # Labels only change with the stats, so most frames reuse the cached surfaces
+        render = self.text_cache.render
+        hp_text = render(self.fonts["small"], f"HP: {current_hp} / {max_hp}", True, OFF_WHITE)
+        block_text = render(self.fonts["extra_small"], f"Block %: {block_chance * 100:.0f}%", True, OFF_WHITE)
+        speed_text = render(self.fonts["extra_small"], f"Speed: {attack_speed}", True, OFF_WHITE)
+        range_text = render(self.fonts["extra_small"], f"Attack: {damage_range[0]}-{damage_range[1]}", True, OFF_WHITE)
+        hit_text = render(self.fonts["extra_small"], f"Hit %: {hit_chance * 100:.0f}%", True, OFF_WHITE)
         self.screen.blit(block_text, (660, 385))
         self.screen.blit(speed_text, (660, 350))
         self.screen.blit(range_text, (660, 315))
@@ -538,16 +599,16 @@ class GameController:
         if message:
             self.current_message = message
         if self.current_message:
-            message_text = self.fonts["small"].render(self.current_message, True, OFF_WHITE)
+            message_text = render(self.fonts["small"], self.current_message, True, OFF_WHITE)
             self.screen.blit(message_text, (50, 500))
 
         # Draw minimap
         self.screen.blit(self.minimap, (650, 0))
 
         # Draw current position on minimap
-        dim = MAP_CELL_WIDTH
-        pygame.draw.circle(self.screen, (255, 255, 255),
-                           (650 + self.position[1] * dim + dim / 2, 5 + self.position[0] * dim + 3), 5)
+        left, top, width, height = self.dungeon_manager.dungeon[self.current_floor - 1].get_map_tile_rect(
+            *self.position)
+        pygame.draw.circle(self.screen, (255, 255, 255), (650 + left + width / 2, top + height / 2), 5)
         if not in_battle:
             # Draw save and inventory buttons
             self.save_button.draw(self.screen, True)
@@ -555,26 +616,20 @@ class GameController:
 
     def get_adventurer_portrait(self):
         """
-        Returns the scaled portrait for the selected adventurer.
+        Returns the scaled portrait for the selected adventurer, cached by the SpriteManager.
 
-        :param: The portrait for the selected adventurer, scaled to 150x150
+        :return: The portrait for the selected adventurer, scaled to 150x150, or None if it could not be
+        loaded.
         """
-        if os.path.exists(f"assets/images/{self.hero_name}_portrait.png"):
-            portrait_path = f"assets/images/{self.hero_name}_portrait.png"
-        else:
-            portrait_path = f"_internal/assets/images/{self.hero_name}_portrait.png"
-        portrait = pygame.image.load(portrait_path).convert_alpha()
-        return pygame.transform.scale(portrait, (150, 150))
+        return self.sprite_manager.get_portrait(self.hero_name)
 
     def set_up_from_load(self, the_screen, the_fonts):
         self.screen = the_screen
         self.fonts = the_fonts
         self.battle_manager = BattleController.get_instance(self.screen, self.fonts, self.draw_ui)
         self.sprite_manager = SpriteManager.get_instance()
-        self.full_maps = []
-        # mirror constructor
-        for i in range(4):
-            self.full_maps.append(self.dungeon_manager.get_floor_map(i + 1, reveal_all=True))
+        self.frame_limiter = FrameLimiter()
+        self.text_cache = TextCache.get_instance()
         self.inventory_button = Button(color=LIGHT_BLUE, x=670, y=160, width=110, height=30,
                                        font=self.fonts["small"], text_color=(255, 255, 255), text="Inventory")
         self.save_button = Button(color=LIGHT_BLUE, x=670, y=200, width=110, height=30,
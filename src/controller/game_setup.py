@@ -6,10 +6,10 @@ from src.model.managers.item_manager import ItemManager
 from src.model.managers.monster_manager import MonsterManager
 from src.model.managers.room_manager import RoomManager
 from src.model.managers.sprite_manager import SpriteManager
-from assets.seeders.adventurer_seeder import AdventurerSeeder
-from assets.seeders.item_seeder import ItemSeeder
-from assets.seeders.monster_seeder import MonsterSeeder
-from assets.seeders.room_seeder import RoomSeeder
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA, AdventurerSeeder
+from assets.seeders.item_seeder import ITEMS_DATA, ItemSeeder
+from assets.seeders.monster_seeder import MONSTERS_DATA, MonsterSeeder
+from assets.seeders.room_seeder import ROOM_DATA, RoomSeeder
 
 
 class GameSetup:
@@ -32,26 +32,23 @@ class GameSetup:
         """
         # Step 1: Initialize the DatabaseInitializer
         db_initializer = DatabaseInitializer()
+        db_path = db_initializer.db_path
 
-        # Step 2: Check if the database exists
-        if not db_initializer.database_exists():
-            db_initializer.initialize_database()
-        else:
+        # Step 2: Reseed only if the schema or seed data changed since the database was last seeded
+        content_hash = db_initializer.content_hash((ADVENTURERS_DATA, ITEMS_DATA, MONSTERS_DATA, ROOM_DATA))
+        if db_initializer.get_content_hash() != content_hash:
             db_initializer.reset_database()
 
-        # Step 3: Run seeders to populate the database
-        AdventurerSeeder().populate_adventurers()
-        ItemSeeder().populate_items()
-        MonsterSeeder().populate_monsters()
-        RoomSeeder().populate_rooms()
+            # Step 3: Run seeders to populate the database
+            AdventurerSeeder(db_path).populate_adventurers()
+            ItemSeeder(db_path).populate_items()
+            MonsterSeeder(db_path).populate_monsters()
+            RoomSeeder(db_path).populate_rooms()
+            db_initializer.set_content_hash(content_hash)
 
         # Step 4: Fetch data from the database
-        db_manager = DatabaseManager.get_instance()
-        db_manager.connect()
-        items_data = db_manager.fetch_items()
-        rooms_data = db_manager.fetch_rooms()
-        monsters_data = db_manager.fetch_monsters()
-        adventurers_data = db_manager.fetch_adventurers()
+        db_manager = DatabaseManager.get_instance(db_path)
+        items_data, rooms_data, monsters_data, adventurers_data = db_manager.fetch_all()
         db_manager.close_connection()
 
         # Step 5: Initialize managers with the fetched data
@@ -0,0 +1,158 @@
+from src.model.entities.combat_events import format_events
+
+# Actions the adventurer can take on their turn
+FIGHT = 'fight'
+SPECIAL = 'special'
+
+# Outcomes of a battle
+ADVENTURER_WON = 'adventurer'
+MONSTER_WON = 'monster'
+
+# Turn limit for run(), as some pairings (e.g. a Priest praying against a regenerating monster) never end
+MAX_BATTLE_TURNS = 1000
+
+
+class TurnResult:
+    """
+    What happened in one battle turn: the adventurer's action and, if the monster was still standing, the
+    monster's attack, with both fighters' HP after each, so the turn can be shown one step at a time.
+    """
+
+    def __init__(self, action, adventurer_events, monster_events, adventurer_hp_after_action,
+                 monster_hp_after_action, adventurer_hp, monster_hp):
+        """
+        Constructor.
+
+        :param action: The adventurer's action, FIGHT or SPECIAL.
+        :param adventurer_events: The CombatEvents of the adventurer's action.
+        :param monster_events: The CombatEvents of the monster's attack, or None if it did not attack.
+        :param adventurer_hp_after_action: The adventurer's HP after their action, before the monster's attack.
+        :param monster_hp_after_action: The monster's HP after the adventurer's action.
+        :param adventurer_hp: The adventurer's HP after the turn.
+        :param monster_hp: The monster's HP after the turn.
+        """
+        self.action = action
+        self.adventurer_events = adventurer_events
+        self.monster_events = monster_events
+        self.adventurer_hp_after_action = adventurer_hp_after_action
+        self.monster_hp_after_action = monster_hp_after_action
+        self.adventurer_hp = adventurer_hp
+        self.monster_hp = monster_hp
+
+    @property
+    def monster_attacked(self):
+        """Whether the monster got to attack this turn."""
+        return self.monster_events is not None
+
+    @property
+    def adventurer_messages(self):
+        """The sentences describing the adventurer's action."""
+        return format_events(self.adventurer_events)
+
+    @property
+    def monster_messages(self):
+        """The sentences describing the monster's attack, or None if it did not attack."""
+        return format_events(self.monster_events) if self.monster_events is not None else None
+
+    @property
+    def outcome(self):
+        """ADVENTURER_WON or MONSTER_WON if the battle ended this turn, None otherwise."""
+        if self.monster_hp <= 0:
+            return ADVENTURER_WON
+        if self.adventurer_hp <= 0:
+            return MONSTER_WON
+        return None
+
+
+class BattleResult:
+    """The result of a battle run to the end by BattleEngine.run."""
+
+    def __init__(self, outcome, turns, adventurer_hp, monster_hp):
+        """
+        Constructor.
+
+        :param outcome: ADVENTURER_WON, MONSTER_WON, or None if the turn limit was reached.
+        :param turns: The number of turns taken.
+        :param adventurer_hp: The adventurer's HP at the end.
+        :param monster_hp: The monster's HP at the end.
+        """
+        self.outcome = outcome
+        self.turns = turns
+        self.adventurer_hp = adventurer_hp
+        self.monster_hp = monster_hp
+
+
+class BattleEngine:
+    """
+    Resolves battle turns between an adventurer and a monster with the combat rules of the entities, and
+    reports what happened as TurnResults. Knows nothing about the display: BattleController animates the
+    results, while balance tooling and automated play can run battles to the end with run().
+    """
+
+    def __init__(self, adventurer, monster):
+        """
+        Constructor.
+
+        :param adventurer: The Adventurer in the battle.
+        :param monster: The Monster in the battle.
+        """
+        self.adventurer = adventurer
+        self.monster = monster
+
+    @property
+    def outcome(self):
+        """ADVENTURER_WON or MONSTER_WON once the battle is over, None while it goes on."""
+        if not self.monster.is_alive():
+            return ADVENTURER_WON
+        if not self.adventurer.is_alive():
+            return MONSTER_WON
+        return None
+
+    def take_turn(self, action):
+        """
+        Resolves one turn: the adventurer's action, then the monster's attack if it is still alive. Nothing
+        happens once the monster is defeated.
+
+        :param action: FIGHT or SPECIAL.
+        :return: The TurnResult.
+        """
+        if action not in (FIGHT, SPECIAL):
+            raise ValueError(f"Unknown battle action: {action}")
+        adventurer, monster = self.adventurer, self.monster
+        adventurer_events = []
+        monster_events = None
+
+        if monster.is_alive():
+            if action == FIGHT:
+                adventurer_events = adventurer.attack(monster)
+            else:
+                adventurer_events = adventurer.special_action(monster)
+        adventurer_hp_after_action, monster_hp_after_action = adventurer.hp, monster.hp
+        if monster.is_alive():
+            monster_events = monster.attack(adventurer)
+
+        return TurnResult(action, adventurer_events, monster_events, adventurer_hp_after_action,
+                          monster_hp_after_action, adventurer.hp, monster.hp)
+
+    def fight(self):
+        """Resolves a turn in which the adventurer fights. See take_turn."""
+        return self.take_turn(FIGHT)
+
+    def special(self):
+        """Resolves a turn in which the adventurer uses their special action. See take_turn."""
+        return self.take_turn(SPECIAL)
+
+    def run(self, choose_action=None, max_turns=MAX_BATTLE_TURNS):
+        """
+        Runs the battle until one side falls.
+
+        :param choose_action: Called with the engine before each turn to pick FIGHT or SPECIAL. Always fights
+        if None.
+        :param max_turns: The most turns to run before giving up.
+        :return: The BattleResult.
+        """
+        turns = 0
+        while self.outcome is None and turns < max_turns:
+            self.take_turn(choose_action(self) if choose_action is not None else FIGHT)
+            turns += 1
+        return BattleResult(self.outcome, turns, self.adventurer.hp, self.monster.hp)
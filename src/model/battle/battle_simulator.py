@@ -0,0 +1,261 @@
+# NumPy is only needed by the balance tooling, not by the game itself
+import numpy as np
+from src.model.battle.battle_engine import MAX_BATTLE_TURNS
+from src.model.entities.adventurers import Bard, Priest, Thief, Warrior
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.monster_factory import MonsterFactory
+
+# Outcome codes in SimulationResult.outcomes, from the adventurer's side
+UNRESOLVED = 0
+WON = 1
+LOST = 2
+
+# The special action constants, read from the adventurer classes so the simulator follows any change to them
+WARRIOR_SPECIAL_HIT_CHANCE = Warrior._Warrior__my_special_hit_chance
+WARRIOR_SPECIAL_DAMAGE_RANGE = Warrior._Warrior__my_special_dmg_range
+PRIEST_SPECIAL_HEAL_RANGE = Priest._Priest__my_special_heal_range_percentage
+THIEF_DETECTION_CHANCE = Thief._Thief__my_detection_chance
+THIEF_NORMAL_ATTACK_CHANCE = Thief._Thief__my_normal_attack_chance
+BARD_SPECIAL_DAMAGE_RANGE = Bard._Bard__my_special_dmg_range
+
+
+class SimulationResult:
+    """The outcome of a batch of simulated battles, one array entry per battle."""
+
+    def __init__(self, outcomes, turns, adventurer_hp, monster_hp, adventurer_max_hp, monster_max_hp):
+        """
+        Constructor.
+
+        :param outcomes: The outcome code of each battle: WON, LOST or UNRESOLVED.
+        :param turns: The number of turns each battle took.
+        :param adventurer_hp: The adventurer's HP at the end of each battle.
+        :param monster_hp: The monster's HP at the end of each battle.
+        :param adventurer_max_hp: The adventurer's max HP.
+        :param monster_max_hp: The monster's max HP.
+        """
+        self.outcomes = outcomes
+        self.turns = turns
+        self.adventurer_hp = adventurer_hp
+        self.monster_hp = monster_hp
+        self.adventurer_max_hp = adventurer_max_hp
+        self.monster_max_hp = monster_max_hp
+
+    @property
+    def battles(self):
+        """The number of battles simulated."""
+        return len(self.outcomes)
+
+    @property
+    def win_rate(self):
+        """The share of battles the adventurer won."""
+        return float(np.mean(self.outcomes == WON))
+
+    @property
+    def loss_rate(self):
+        """The share of battles the monster won."""
+        return float(np.mean(self.outcomes == LOST))
+
+    @property
+    def unresolved_rate(self):
+        """The share of battles still going at the turn limit."""
+        return float(np.mean(self.outcomes == UNRESOLVED))
+
+    def turn_distribution(self):
+        """
+        Returns the distribution of battle lengths.
+
+        :return: An array whose entry t is the share of battles that took t turns.
+        """
+        return np.bincount(self.turns) / self.battles
+
+    def adventurer_hp_distribution(self):
+        """
+        Returns the distribution of the adventurer's remaining HP.
+
+        :return: An array whose entry h is the share of battles that left the adventurer with h HP.
+        """
+        return np.bincount(self.adventurer_hp, minlength=self.adventurer_max_hp + 1) / self.battles
+
+    def monster_hp_distribution(self):
+        """
+        Returns the distribution of the monster's remaining HP.
+
+        :return: An array whose entry h is the share of battles that left the monster with h HP.
+        """
+        return np.bincount(self.monster_hp, minlength=self.monster_max_hp + 1) / self.battles
+
+
+class BattleSimulator:
+    """
+    Monte Carlo battle simulator. Runs many independent battles between one adventurer and one monster at once,
+    as NumPy arrays holding each battle's HP, with the same rules as the entities: Entity.attack and its attack
+    count, Adventurer._block, Monster._regen and each adventurer class's special_action. Each battle plays like
+    BattleEngine.run: the adventurer acts, then the monster attacks if it is still standing.
+    """
+
+    def __init__(self, adventurer_data, monster_data):
+        """
+        Constructor. The stats are read from an adventurer and a monster built by the factories, so they are
+        clamped the same way as in the game.
+
+        :param adventurer_data: The adventurer's stats, laid out as for AdventurerFactory.make_adventurer.
+        :param monster_data: The monster's stats, laid out as for MonsterFactory.make_monster.
+        """
+        adventurer = AdventurerFactory.get_instance().make_adventurer(adventurer_data)
+        monster = MonsterFactory.get_instance().make_monster(monster_data)
+        self.adventurer_class = type(adventurer)
+        self.adventurer_max_hp = adventurer.max_hp
+        self.adventurer_hit_chance = adventurer.hit_chance
+        self.adventurer_damage_range = adventurer.damage_range
+        self.block_chance = adventurer.block_chance
+        self.monster_max_hp = monster.max_hp
+        self.monster_hit_chance = monster.hit_chance
+        self.monster_damage_range = monster.damage_range
+        self.heal_chance = monster.heal_chance
+        self.heal_range = monster.heal_range
+        # Attacks per Entity.attack call, as counted by Entity.__calculate_attack_num
+        self.adventurer_attacks = max(1, int(adventurer.attack_speed // monster.attack_speed))
+        self.monster_attacks = max(1, int(monster.attack_speed // adventurer.attack_speed))
+
+    def run(self, battles, special_chance=0.0, seed=None, max_turns=MAX_BATTLE_TURNS):
+        """
+        Simulates a number of battles.
+
+        :param battles: The number of battles.
+        :param special_chance: The chance the adventurer uses their special action on a turn instead of
+        fighting. 0 always fights, 1 always uses the special action.
+        :param seed: The seed of the random generator, or None for a random one.
+        :param max_turns: The most turns a battle may take before it is left unresolved.
+        :return: The SimulationResult.
+        """
+        rng = np.random.default_rng(seed)
+        adventurer_hp = np.full(battles, self.adventurer_max_hp, dtype=np.int64)
+        monster_hp = np.full(battles, self.monster_max_hp, dtype=np.int64)
+        turns = np.zeros(battles, dtype=np.int64)
+
+        # Indexes of the battles still going; each turn only works on those
+        ongoing = np.arange(battles)
+        for _ in range(max_turns):
+            if len(ongoing) == 0:
+                break
+            hero = adventurer_hp[ongoing]
+            enemy = monster_hp[ongoing]
+            special = rng.random(len(ongoing)) < special_chance
+
+            enemy = self._adventurer_attack(rng, hero, enemy, ~special)
+            hero, enemy = self._special_action(rng, hero, enemy, special)
+            hero = self._monster_attack(rng, enemy, hero, enemy > 0)
+
+            adventurer_hp[ongoing] = hero
+            monster_hp[ongoing] = enemy
+            turns[ongoing] += 1
+            ongoing = ongoing[(hero > 0) & (enemy > 0)]
+
+        outcomes = np.full(battles, UNRESOLVED, dtype=np.int8)
+        outcomes[adventurer_hp <= 0] = LOST
+        # A Bard's special action can knock out both sides, which counts as a win, as in BattleEngine
+        outcomes[monster_hp <= 0] = WON
+        return SimulationResult(outcomes, turns, adventurer_hp, monster_hp,
+                                self.adventurer_max_hp, self.monster_max_hp)
+
+    def _adventurer_attack(self, rng, hero, enemy, acting):
+        """
+        Entity.attack by the adventurer: a number of attacks, each rolling to hit, with the monster regenerating
+        after every hit it survives.
+
+        :param rng: The NumPy generator.
+        :param hero: The adventurer's HP in each battle.
+        :param enemy: The monster's HP in each battle.
+        :param acting: Which battles the attack happens in.
+        :return: The monster's HP afterwards.
+        """
+        for _ in range(self.adventurer_attacks):
+            hit = acting & (hero > 0) & (enemy > 0) & (rng.random(len(enemy)) <= self.adventurer_hit_chance)
+            damage = rng.integers(self.adventurer_damage_range[0], self.adventurer_damage_range[1] + 1, len(enemy))
+            enemy = self._monster_hit_response(rng, enemy, hit, damage)
+        return enemy
+
+    def _monster_attack(self, rng, enemy, hero, acting):
+        """
+        Entity.attack by the monster: a number of attacks, each rolling to hit, with the adventurer rolling to
+        block every hit.
+
+        :param rng: The NumPy generator.
+        :param enemy: The monster's HP in each battle.
+        :param hero: The adventurer's HP in each battle.
+        :param acting: Which battles the attack happens in.
+        :return: The adventurer's HP afterwards.
+        """
+        for _ in range(self.monster_attacks):
+            hit = acting & (enemy > 0) & (hero > 0) & (rng.random(len(hero)) <= self.monster_hit_chance)
+            damage = rng.integers(self.monster_damage_range[0], self.monster_damage_range[1] + 1, len(hero))
+            # Adventurer._block
+            hit &= rng.random(len(hero)) > self.block_chance
+            hero = np.where(hit, np.maximum(hero - damage, 0), hero)
+        return hero
+
+    def _monster_hit_response(self, rng, enemy, hit, damage):
+        """
+        Monster._hit_response: takes the damage, then rolls to regenerate if still alive.
+
+        :param rng: The NumPy generator.
+        :param enemy: The monster's HP in each battle.
+        :param hit: Which battles the monster is hit in.
+        :param damage: The damage in each battle.
+        :return: The monster's HP afterwards.
+        """
+        enemy = np.where(hit, np.maximum(enemy - damage, 0), enemy)
+        # Monster._regen
+        regen = hit & (enemy > 0) & (rng.random(len(enemy)) <= self.heal_chance)
+        heal = rng.integers(self.heal_range[0], self.heal_range[1] + 1, len(enemy))
+        return np.where(regen, np.minimum(enemy + heal, self.monster_max_hp), enemy)
+
+    def _special_action(self, rng, hero, enemy, acting):
+        """
+        The special_action of the adventurer's class.
+
+        :param rng: The NumPy generator.
+        :param hero: The adventurer's HP in each battle.
+        :param enemy: The monster's HP in each battle.
+        :param acting: Which battles the special action is used in.
+        :return: The adventurer's and the monster's HP afterwards.
+        """
+        size = len(hero)
+        acting = acting & (hero > 0) & (enemy > 0)
+        if self.adventurer_class is Warrior:
+            # Crushing Blow
+            hit = acting & (rng.random(size) <= WARRIOR_SPECIAL_HIT_CHANCE)
+            damage = rng.integers(WARRIOR_SPECIAL_DAMAGE_RANGE[0], WARRIOR_SPECIAL_DAMAGE_RANGE[1] + 1, size)
+            enemy = self._monster_hit_response(rng, enemy, hit, damage)
+        elif self.adventurer_class is Priest:
+            # Divine Prayer
+            heal = (rng.uniform(*PRIEST_SPECIAL_HEAL_RANGE, size) * self.adventurer_max_hp).astype(np.int64)
+            hero = np.where(acting, np.minimum(hero + heal, self.adventurer_max_hp), hero)
+        elif self.adventurer_class is Thief:
+            # Surprise Attack: detected, one attack, or an extra attack then one attack
+            roll = rng.random(size)
+            extra_attack = acting & (roll >= THIEF_DETECTION_CHANCE + THIEF_NORMAL_ATTACK_CHANCE)
+            enemy = self._adventurer_attack(rng, hero, enemy, extra_attack)
+            enemy = self._adventurer_attack(rng, hero, enemy, acting & (roll >= THIEF_DETECTION_CHANCE))
+        elif self.adventurer_class is Bard:
+            # Discombobulating Tune: the Bard takes half the damage dealt
+            damage = rng.integers(BARD_SPECIAL_DAMAGE_RANGE[0], BARD_SPECIAL_DAMAGE_RANGE[1] + 1, size)
+            enemy = self._monster_hit_response(rng, enemy, acting, damage)
+            hero = np.where(acting, np.maximum(hero - damage // 2, 0), hero)
+        return hero, enemy
+
+
+def simulate_battles(adventurer_data, monster_data, battles, special_chance=0.0, seed=None,
+                     max_turns=MAX_BATTLE_TURNS):
+    """
+    Simulates battles between an adventurer and a monster. See BattleSimulator.
+
+    :param adventurer_data: The adventurer's stats, laid out as for AdventurerFactory.make_adventurer.
+    :param monster_data: The monster's stats, laid out as for MonsterFactory.make_monster.
+    :param battles: The number of battles.
+    :param special_chance: The chance the adventurer uses their special action on a turn instead of fighting.
+    :param seed: The seed of the random generator, or None for a random one.
+    :param max_turns: The most turns a battle may take before it is left unresolved.
+    :return: The SimulationResult.
+    """
+    return BattleSimulator(adventurer_data, monster_data).run(battles, special_chance, seed, max_turns)
@@ -0,0 +1,265 @@
+from array import array
+from functools import lru_cache
+from operator import add, mul
+
+# Win tables kept for different stat signatures, least recently used dropped first
+WIN_TABLE_CACHE_SIZE = 32
+
+
+def stat_signature(adventurer, monster):
+    """
+    Returns every stat the outcome of a battle between an adventurer and a monster depends on, apart from their
+    current HP. Battles with the same signature share a win table.
+
+    :param adventurer: The Adventurer.
+    :param monster: The Monster.
+    :return: The signature, a tuple.
+    """
+    # Attacks per Entity.attack call, as counted by Entity.__calculate_attack_num
+    adventurer_attacks = max(1, int(adventurer.attack_speed // monster.attack_speed))
+    monster_attacks = max(1, int(monster.attack_speed // adventurer.attack_speed))
+    return (adventurer.max_hp, adventurer.hit_chance, tuple(adventurer.damage_range), adventurer.block_chance,
+            adventurer_attacks,
+            monster.max_hp, monster.hit_chance, tuple(monster.damage_range), monster.heal_chance,
+            tuple(monster.heal_range), monster_attacks)
+
+
+def win_probability(adventurer, monster):
+    """
+    Returns the exact probability that an adventurer beats a monster from their current HP, with the
+    adventurer fighting every turn until one side falls. The first query for a stat signature builds its
+    win table; later ones are a lookup.
+
+    :param adventurer: The Adventurer, about to take their turn.
+    :param monster: The Monster.
+    :return: The probability, between 0 and 1.
+    """
+    if monster.hp <= 0:
+        return 1.0
+    if adventurer.hp <= 0:
+        return 0.0
+    return win_table(stat_signature(adventurer, monster)).probability(adventurer.hp, monster.hp)
+
+
+@lru_cache(maxsize=WIN_TABLE_CACHE_SIZE)
+def win_table(signature):
+    """
+    Returns the win table of a stat signature, building it on first use.
+
+    :param signature: The signature, as returned by stat_signature.
+    :return: The WinTable.
+    """
+    return WinTable(*signature)
+
+
+class WinTable:
+    """
+    The adventurer's chance to win from every pair of HP values, for one stat signature. Battles follow
+    BattleEngine with the adventurer always fighting: each turn the adventurer makes their attacks, with the
+    monster rolling to regenerate after every hit it survives, then the monster makes its attacks if it is
+    still standing, with the adventurer rolling to block each hit.
+
+    The adventurer's HP never goes up, so the table is filled one adventurer HP at a time from the bottom.
+    The monster's HP can go up through regeneration, so each adventurer HP takes solving a linear system over
+    the monster's HP, for the turns in which the adventurer takes no damage. Its matrix is the same for every
+    adventurer HP and only links HP values within a damage or heal roll of each other, so it is factored
+    once, keeping only that band.
+    """
+
+    def __init__(self, adventurer_max_hp, adventurer_hit_chance, adventurer_damage_range, block_chance,
+                 adventurer_attacks, monster_max_hp, monster_hit_chance, monster_damage_range, heal_chance,
+                 heal_range, monster_attacks):
+        """
+        Constructor. Builds the table. The parameters are the entries of the stat signature.
+        """
+        self.adventurer_max_hp = adventurer_max_hp
+        self.monster_max_hp = monster_max_hp
+
+        turn = self.__adventurer_turn(monster_max_hp, adventurer_hit_chance, adventurer_damage_range,
+                                      adventurer_attacks, heal_chance, heal_range)
+        damage = self.__monster_turn(monster_hit_chance, monster_damage_range, block_chance, monster_attacks)
+        unhurt = damage.pop(0, 0.0)
+
+        # The system for one adventurer HP: the monster's HP after the adventurer's attacks is reached with the
+        # adventurer unhurt, or hurt down to a lower row of the table that is already known
+        kills = [0.0]
+        system = [None]
+        for hp in range(1, monster_max_hp + 1):
+            row = turn[hp]
+            kills.append(row.get(0, 0.0))
+            coefficients = {after: -unhurt * chance for after, chance in row.items() if after}
+            coefficients[hp] = coefficients.get(hp, 0.0) + 1.0
+            system.append(coefficients)
+        lower, upper, diagonal = self.__factor(system)
+        turn = [_band(row, 1, monster_max_hp) for row in turn]
+
+        self._rows = [array('d', [0.0]) * (monster_max_hp + 1)]
+        for adventurer_hp in range(1, adventurer_max_hp + 1):
+            # The chance to win after the monster's attacks, for each monster HP, if the adventurer is hurt
+            hurt = [0.0] * (monster_max_hp + 1)
+            for amount, chance in damage.items():
+                if amount < adventurer_hp:
+                    hurt = list(map(add, hurt, map(chance.__mul__, self._rows[adventurer_hp - amount])))
+            constants = [kills[hp] + _dot(turn[hp], hurt) for hp in range(monster_max_hp + 1)]
+            row = self.__solve(lower, upper, diagonal, constants)
+            # A monster at 0 HP has already lost
+            row[0] = 1.0
+            self._rows.append(array('d', row))
+
+    def probability(self, adventurer_hp, monster_hp):
+        """
+        Returns the adventurer's chance to win from the given HP, with the adventurer about to take their turn.
+
+        :param adventurer_hp: The adventurer's HP, up to their max HP.
+        :param monster_hp: The monster's HP, up to its max HP.
+        :return: The probability, between 0 and 1.
+        """
+        return min(max(self._rows[adventurer_hp][monster_hp], 0.0), 1.0)
+
+    @staticmethod
+    def __adventurer_turn(monster_max_hp, hit_chance, damage_range, attacks, heal_chance, heal_range):
+        """
+        Builds the distribution of the monster's HP after the adventurer's attacks, for each monster HP.
+
+        :return: A list indexed by monster HP, of dictionaries mapping the HP afterwards to its chance.
+        """
+        damage_chance = hit_chance / (damage_range[1] - damage_range[0] + 1)
+        heal_chance_each = heal_chance / (heal_range[1] - heal_range[0] + 1)
+        attack = [{0: 1.0}]
+        for hp in range(1, monster_max_hp + 1):
+            row = {hp: 1 - hit_chance}
+            for damage in range(damage_range[0], damage_range[1] + 1):
+                left = max(hp - damage, 0)
+                if left == 0:
+                    row[0] = row.get(0, 0.0) + damage_chance
+                    continue
+                # Monster._regen, rolled after every hit the monster survives
+                row[left] = row.get(left, 0.0) + damage_chance * (1 - heal_chance)
+                for heal in range(heal_range[0], heal_range[1] + 1):
+                    healed = min(left + heal, monster_max_hp)
+                    row[healed] = row.get(healed, 0.0) + damage_chance * heal_chance_each
+            attack.append(row)
+
+        turn = attack
+        for _ in range(attacks - 1):
+            turn = [WinTable.__then(row, attack) for row in turn]
+        return turn
+
+    @staticmethod
+    def __monster_turn(hit_chance, damage_range, block_chance, attacks):
+        """
+        Builds the distribution of the total damage the monster deals the adventurer in one turn. Damage past
+        the adventurer's HP is wasted, so the monster stopping once the adventurer falls does not change it.
+
+        :return: A dictionary mapping the damage to its chance.
+        """
+        landed = hit_chance * (1 - block_chance)
+        damage_chance = landed / (damage_range[1] - damage_range[0] + 1)
+        attack = {0: 1 - landed}
+        for damage in range(damage_range[0], damage_range[1] + 1):
+            attack[damage] = damage_chance
+
+        total = {0: 1.0}
+        for _ in range(attacks):
+            following = {}
+            for before, chance in total.items():
+                for damage, damage_chance in attack.items():
+                    following[before + damage] = following.get(before + damage, 0.0) + chance * damage_chance
+            total = following
+        return total
+
+    @staticmethod
+    def __then(row, step):
+        """
+        Follows a distribution over HP by one more step.
+
+        :param row: A dictionary mapping HP to its chance.
+        :param step: The distribution after the step from each HP, indexed by HP.
+        :return: The distribution afterwards.
+        """
+        following = {}
+        for hp, chance in row.items():
+            for after, step_chance in step[hp].items():
+                following[after] = following.get(after, 0.0) + chance * step_chance
+        return following
+
+    @staticmethod
+    def __factor(system):
+        """
+        LU-factors a banded system without pivoting; its matrix is diagonally dominant, as every turn has a
+        chance to end the battle or to hurt the adventurer unless they always block.
+
+        :param system: The rows of the matrix as dictionaries from column to value, indexed from 1.
+        :return: The bands of the rows of the unit lower factor, left of the diagonal, and of the upper
+        factor, right of the diagonal, and the diagonal of the upper factor.
+        """
+        lower, upper, diagonal = [None], [None], [0.0]
+        for index in range(1, len(system)):
+            row = dict(system[index])
+            multipliers = {}
+            column = min(row)
+            while column < index:
+                value = row.pop(column, 0.0)
+                if value:
+                    multiplier = value / diagonal[column]
+                    multipliers[column] = multiplier
+                    start, values = upper[column]
+                    for other, other_value in enumerate(values, start):
+                        row[other] = row.get(other, 0.0) - multiplier * other_value
+                column += 1
+            lower.append(_band(multipliers, 1, index - 1))
+            diagonal.append(row.pop(index))
+            upper.append(_band(row, index + 1, len(system) - 1))
+        return lower, upper, diagonal
+
+    @staticmethod
+    def __solve(lower, upper, diagonal, constants):
+        """
+        Solves a factored system.
+
+        :param lower: The bands of the rows of the unit lower factor.
+        :param upper: The bands of the rows of the upper factor.
+        :param diagonal: The diagonal of the upper factor.
+        :param constants: The right-hand side, indexed from 1.
+        :return: The solution as a list indexed from 1, with 0 at index 0.
+        """
+        size = len(constants)
+        solution = list(constants)
+        solution[0] = 0.0
+        for index in range(1, size):
+            solution[index] -= _dot(lower[index], solution)
+        for index in range(size - 1, 0, -1):
+            solution[index] = (solution[index] - _dot(upper[index], solution)) / diagonal[index]
+        return solution
+
+
+def _band(row, first, last):
+    """
+    Lays out the entries of a sparse row between two columns as a dense band, from its first to its last
+    entry in that range.
+
+    :param row: A dictionary mapping columns to values.
+    :param first: The first column to keep.
+    :param last: The last column to keep.
+    :return: The band, as the column it starts at and the list of its values.
+    """
+    columns = [column for column in row if first <= column <= last]
+    if not columns:
+        return first, []
+    start = min(columns)
+    values = [0.0] * (max(columns) - start + 1)
+    for column in columns:
+        values[column - start] = row[column]
+    return start, values
+
+
+def _dot(band, vector):
+    """
+    Returns the dot product of a band and a vector.
+
+    :param band: The band, as returned by _band.
+    :param vector: The vector, indexed by column.
+    :return: The product.
+    """
+    start, values = band
+    return sum(map(mul, values, vector[start:start + len(values)]))
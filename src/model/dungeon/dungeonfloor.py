@@ -1,17 +1,67 @@
 import random
-from copy import deepcopy
+from array import array
+from collections.abc import Sequence
 import pygame
 from pygame import Surface
 from colorama import Fore, Style
 from constants import (
     BACKGROUND_COLOR, BLACK, BROWN, DARK_RED, DARK_VIOLET, ELITE_CHANCE, EMPTY_CHANCE, ENTITY_CHANCE,
-    EVENT_CHANCE, FADED_GRAY, GOLD, ITEM_CHANCE, MAP_SURFACE_TILE_SIZE, MEDIUM_GREY, MONSTER_CHANCE,
-    RED, TRAP_CHANCE, VIOLET
+    EVENT_CHANCE, FADED_GRAY, GOLD, ITEM_CHANCE, MAP_SURFACE_TILE_SIZE, MAP_SURFACE_TILES, MEDIUM_GREY, MINIMAP_SIZE,
+    MONSTER_CHANCE, RED, TRAP_CHANCE, VIOLET
 )
 
+# Room types as stored in a DungeonFloor's type grid. A room's code is its index in this tuple.
+ROOM_TYPES = ('BLOCKED', 'EMPTY', 'MONSTER', 'ELITE', 'ITEM', 'TRAP', 'ENTRANCE', 'EXIT', 'PILLAR')
+ROOM_CODES = {room_type: code for code, room_type in enumerate(ROOM_TYPES)}
+BLOCKED_CODE = ROOM_CODES['BLOCKED']
+
+# Door bits, in the same order as Room.valid_directions: Up, Right, Down, Left
+DOOR_BITS = (1, 2, 4, 8)
+
+# Smallest and largest number of rooms per side of a floor
+MIN_FLOOR_SIZE = 5
+MAX_FLOOR_SIZE = 1024
+
+# Minimap color for each room code
+ROOM_COLORS = (BLACK, MEDIUM_GREY, RED, DARK_RED, GOLD, BROWN, VIOLET, DARK_VIOLET, FADED_GRAY)
+
+
+def roll_room_type(rng=random):
+    """
+    Rolls the type of a random accessible room.
+
+    :param rng: The random stream to roll with.
+    :return: The rolled room type.
+    """
+    # First roll: Decide the major category
+    main_category = rng.choices(
+        population=['ENTITY', 'EVENT', 'EMPTY'],
+        weights=[ENTITY_CHANCE, EVENT_CHANCE, EMPTY_CHANCE],
+        k=1
+    )[0]
+
+    if main_category == 'ENTITY':
+        return rng.choices(
+            population=['MONSTER', 'ELITE'],
+            weights=[MONSTER_CHANCE, ELITE_CHANCE],
+            k=1
+        )[0]
+    elif main_category == 'EVENT':
+        return rng.choices(
+            population=['TRAP', 'ITEM'],
+            weights=[TRAP_CHANCE, ITEM_CHANCE],
+            k=1
+        )[0]
+    # Directly assign 'EMPTY'
+    return 'EMPTY'
+
 
 class Room:
-    """Represents a single room. Should never be instantiated outside the context of within a Dungeon class."""
+    """
+    Represents a single room. Should never be instantiated outside the context of within a Dungeon class.
+    Rooms fetched from a DungeonFloor are views over the floor's grid: type, doors and visited status are
+    read from and written to the floor, while the monster and item are held by the Room itself.
+    """
 
     '''
     BLOCKED: Inaccessible room
@@ -23,47 +73,102 @@ class Room:
     ITEM: Room containing an item, picked up upon entry
     TRAP: Room that does some amount of damage to the adventurer upon entry
     '''
-    def __init__(self, room_type='BLOCKED'):
+    def __init__(self, room_type='BLOCKED', rng=random):
         """
         Constructor. Instantiates fields
 
         :param room_type: The room type of the room. Room types defined above.
+        :param rng: The random stream a 'RANDOM' room type is rolled with.
         """
+        # Floor and (row, column) this room is a view of. None for a standalone room.
+        self._floor = None
+        self._coords = None
         if room_type == 'RANDOM':
-            # First roll: Decide the major category
-            main_category = random.choices(
-                population=['ENTITY', 'EVENT', 'EMPTY'],
-                weights=[ENTITY_CHANCE, EVENT_CHANCE, EMPTY_CHANCE],
-                k=1
-            )[0]
-
-            if main_category == 'ENTITY':
-                self.type = random.choices(
-                    population=['MONSTER', 'ELITE'],
-                    weights=[MONSTER_CHANCE, ELITE_CHANCE],
-                    k=1
-                )[0]
-
-            elif main_category == 'EVENT':
-                self.type = random.choices(
-                    population=['TRAP', 'ITEM'],
-                    weights=[TRAP_CHANCE, ITEM_CHANCE],
-                    k=1
-                )[0]
-
-            elif main_category == 'EMPTY':
-                # Directly assign 'EMPTY'
-                self.type = 'EMPTY'
+            self._type = roll_room_type(rng)
         else:
             # Assign fixed room type for non-random cases
-            self.type = room_type
+            self._type = room_type
 
         # Up, Right, Down, Left
-        self.valid_directions = [False, False, False, False]
+        self._valid_directions = [False, False, False, False]
         # Attributes
         self.monster = None
         self.item = None
-        self.visited = False
+        self._visited = False
+
+    @classmethod
+    def _view(cls, floor, x, y):
+        """
+        Creates a room bound to a cell of a floor's grid.
+
+        :param floor: The DungeonFloor holding the grid.
+        :param x: The row position.
+        :param y: The column position.
+        :return: The bound room.
+        """
+        room = cls.__new__(cls)
+        room._bind(floor, x, y)
+        room.monster = None
+        room.item = None
+        return room
+
+    def _bind(self, floor, x, y):
+        """
+        Binds this room to a cell of a floor's grid, dropping any standalone type, door and visited state.
+
+        :param floor: The DungeonFloor holding the grid.
+        :param x: The row position.
+        :param y: The column position.
+        """
+        self._floor = floor
+        self._coords = (x, y)
+        self._type = None
+        self._valid_directions = None
+        self._visited = None
+
+    @property
+    def type(self):
+        if self._floor is None:
+            return self._type
+        return ROOM_TYPES[self._floor._types[self._floor._index(*self._coords)]]
+
+    @type.setter
+    def type(self, new_type):
+        if self._floor is None:
+            self._type = new_type
+        else:
+            self._floor._set_room_code(*self._coords, ROOM_CODES[new_type])
+
+    @property
+    def valid_directions(self):
+        if self._floor is None:
+            return self._valid_directions
+        doors = self._floor._doors[self._floor._index(*self._coords)]
+        return [bool(doors & bit) for bit in DOOR_BITS]
+
+    @valid_directions.setter
+    def valid_directions(self, new_directions):
+        if self._floor is None:
+            self._valid_directions = new_directions
+        else:
+            doors = 0
+            for bit, is_valid in zip(DOOR_BITS, new_directions):
+                if is_valid:
+                    doors |= bit
+            self._floor._set_doors(*self._coords, doors)
+
+    @property
+    def visited(self):
+        if self._floor is None:
+            return self._visited
+        return bool(self._floor._visited[self._floor._index(*self._coords)])
+
+    @visited.setter
+    def visited(self, new_visited):
+        if self._floor is None:
+            self._visited = new_visited
+        else:
+            self._floor._set_visited(*self._coords, new_visited)
 
     def __str__(self):
         """
@@ -92,6 +197,8 @@ class Room:
         :param monster: The monster to 'place' in the room.
         """
         self.monster = monster
+        if self._floor is not None:
+            self._floor._track_room(self)
 
     def get_monster(self):
         """
@@ -116,6 +223,8 @@ class Room:
         :param item: The item to place in the room
         """
         self.item = item
+        if self._floor is not None:
+            self._floor._track_room(self)
 
     def get_item(self):
         """
@@ -178,11 +287,13 @@ class Room:
         """
         # Up, Right, Down, Left
         directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        valid_directions = [False, False, False, False]
         count = 0
         for i in directions:
             if 0 <= x + i[0] < length and 0 <= y + i[1] < width and dungeon[x + i[0]][y + i[1]].type != 'BLOCKED':
-                self.valid_directions[count] = True
+                valid_directions[count] = True
             count += 1
+        self.valid_directions = valid_directions
 
     def __getstate__(self):
         """Stores the object's state in a pickled dictionary."""
@@ -194,30 +305,86 @@ class Room:
 
     def __setstate__(self, state):
         """Restores the object's state from the pickled dictionary."""
-        self.type = state['type']
-        self.valid_directions = state['valid_directions']
+        self._floor = None
+        self._coords = None
+        self._type = state['type']
+        self._valid_directions = state['valid_directions']
         self.monster = state['monster']
         self.item = state['item']
-        self.visited = state['visited']
+        self._visited = state['visited']
 
 
-class DungeonFloor:
-    """Represents one floor of a dungeon. Is made up of Rooms. A collection of these make up the whole dungeon."""
+class RoomListView(Sequence):
+    """
+    A read-only view of a floor's room coordinate list. Reads go straight to the floor's list, so nothing is
+    copied and the view always reflects the floor as it is now.
+    """
+
+    def __init__(self, floor):
+        """
+        Constructor.
+
+        :param floor: The DungeonFloor whose room list to view.
+        """
+        self._floor = floor
+
+    def __getitem__(self, index):
+        """Returns the (row, column) coordinates at an index, or a list of them for a slice."""
+        return self._floor._room_list[index]
+
+    def __len__(self):
+        """Returns the number of non-blocked rooms."""
+        return len(self._floor._room_list)
+
+    def __iter__(self):
+        """Iterates over the room coordinates in order."""
+        return iter(self._floor._room_list)
 
-    def __init__(self, floor_number):
-        """Constructor for Dungeon. Instantiates it."""
-        # 5x5, 6x6, 7x7, 8x8
-        self._length = floor_number + 4
-        self._width = floor_number + 4
+
+class DungeonFloor:
+    """
+    Represents one floor of a dungeon. Is made up of Rooms. A collection of these make up the whole dungeon.
+    Room types, doors and visited status are kept in flat byte arrays (one byte per cell, row-major); Room
+    objects are only kept for the rooms currently holding a monster or an item.
+    """
+
+    def __init__(self, floor_number, rng=None, size=None):
+        """
+        Constructor for Dungeon. Instantiates it.
+
+        :param floor_number: The floor number, which sets the floor's size unless one is given.
+        :param rng: The random stream the floor is generated with. Defaults to the random module.
+        :param size: The number of rooms per side, from MIN_FLOOR_SIZE to MAX_FLOOR_SIZE. Defaults to
+        floor_number + 4.
+        """
+        if size is None:
+            # 5x5, 6x6, 7x7, 8x8
+            size = floor_number + 4
+        if not MIN_FLOOR_SIZE <= size <= MAX_FLOOR_SIZE:
+            raise ValueError(f"Floor size must be between {MIN_FLOOR_SIZE} and {MAX_FLOOR_SIZE}, got {size}.")
+        self._length = size
+        self._width = size
         # Rooms by default are blocked
-        self._map = [[Room('BLOCKED') for _ in range(self._length)] for _ in range(self._width)]
+        cells = self._length * self._width
+        self._types = array('B', bytes(cells))
+        self._doors = array('B', bytes(cells))
+        self._visited = array('B', bytes(cells))
+        # Rooms holding a monster or an item, keyed by (row, column)
+        self._rooms = {}
+        # Coordinates of the non-blocked rooms of each type, indexed by room code. Kept by _set_room_code and
+        # rebuilt on load rather than pickled.
+        self._coords_by_code = [{} for _ in ROOM_TYPES]
+        # Cached minimap Surfaces, keyed by reveal_all. Not pickled.
+        self._minimaps = {}
+        # Navigation index, built on first request and dropped whenever the doors change. Not pickled.
+        self._navigation = None
         self._entrance_loc = None
         self._exit_loc = None
         self._pillar_loc = None
         # List to store non-blocked room coordinates
         self._room_list = []
         '''Populates the map, in addition to instantiating the entrance_loc, exit_loc, and room_list fields'''
-        self.__populate_map()
+        self.__populate_map(rng if rng is not None else random)
 
     def get_width(self) -> int:
         """
@@ -237,11 +404,29 @@ class DungeonFloor:
 
     def get_room_list(self) -> list[tuple[int, int]]:
         """
-        Returns a deep copy of the room coordinate list.
+        Returns a copy of the room coordinate list.
+
+        :return: A copy of the room coordinate list.
+        """
+        return list(self._room_list)
+
+    def get_room_list_view(self) -> RoomListView:
+        """
+        Returns a read-only view of the room coordinate list, without copying it.
 
-        :return: A deep copy of the room coordinate list.
+        :return: A view of the room coordinate list.
         """
-        return deepcopy(self._room_list)
+        return RoomListView(self)
+
+    def get_rooms_of_type(self, room_type):
+        """
+        Returns the coordinates of every room of a type, in the order they became that type, without scanning
+        the floor. The result is a read-only live view and must not be iterated while room types change.
+
+        :param room_type: A non-blocked room type, e.g. 'MONSTER'.
+        :return: A view of the (row, column) coordinates.
+        """
+        return self._coords_by_code[ROOM_CODES[room_type]].keys()
 
     def get_entrance_coords(self) -> tuple[int, int]:
         """
@@ -267,13 +452,38 @@ class DungeonFloor:
         """
         return self._pillar_loc
 
+    def get_room_code(self, x, y) -> int:
+        """
+        Returns the type code of the room at given coordinates without creating a Room. See ROOM_TYPES.
+
+        :param x: The row coordinate of the room.
+        :param y: The column coordinate of the room.
+        :return: The room type code.
+        """
+        return self._types[self._index(x, y)]
+
     def fetch_room(self, x, y) -> Room:
         """
         Fetches room at given coordinates.
 
         :return: The room at the passed coordinates.
         """
-        return self._map[x][y]
+        room = self._rooms.get((x, y))
+        if room is None:
+            room = Room._view(self, x, y)
+        return room
+
+    def get_navigation(self):
+        """
+        Returns the navigation index of the floor, building it if the floor has none or its doors changed.
+
+        :return: The FloorNavigation of the floor.
+        """
+        if self._navigation is None:
+            # Imported here, as the navigation module imports this one
+            from src.model.dungeon.navigation import FloorNavigation
+            self._navigation = FloorNavigation(self)
+        return self._navigation
 
     def reveal_adjacent_rooms(self, x, y):
         """
@@ -286,7 +496,7 @@ class DungeonFloor:
         for pair in directions:
             next_x, next_y = x + pair[0], y + pair[1]
             if 0 <= next_x < self._length and 0 <= next_y < self._width:
-                self._map[next_x][next_y].set_visited(True)
+                self._set_visited(next_x, next_y, True)
 
     def __str__(self):
         """
@@ -295,106 +505,199 @@ class DungeonFloor:
         :return: A string representation of this floor.
         """
         result = ""
-        for row in self._map:
-            result += " ".join(str(item) for item in row) + "\n"
+        for x in range(self._length):
+            result += " ".join(str(self.fetch_room(x, y)) for y in range(self._width)) + "\n"
         return result
 
-    @staticmethod
-    def __distance(a_x, a_y, b_x, b_y):
+    def _index(self, x, y) -> int:
         """
-        Static method used for calculating the number of rooms that need to be traversed from room A to B.
+        Returns the position of a cell in the flat grid arrays.
 
-        :param a_x: The row coordinate of room A.
-        :param a_y: The column coordinate of room A.
-        :param b_x: The row coordinate of room B.
-        :param b_y: The column coordinate of room B.
-        :return: The distance between the two rooms.
+        :param x: The row coordinate of the cell.
+        :param y: The column coordinate of the cell.
+        :return: The array index of the cell.
         """
-        current_x = a_x
-        current_y = a_y
-        count = 0
-        while current_y != b_y:
-            while current_x != b_x:
-                current_x = current_x + 1 if current_x < b_x else current_x - 1
-                count += 1
-            current_y = current_y + 1 if current_y < b_y else current_y - 1
-            count += 1
-        return count
+        return x * self._width + y
+
+    def _set_room_code(self, x, y, code):
+        """
+        Sets the type code of a cell.
 
-    def __populate_map(self):
-        """Responsible for populating a fresh map with an entrance, exit, pillar, et cetera."""
+        :param x: The row coordinate of the cell.
+        :param y: The column coordinate of the cell.
+        :param code: The new room type code.
+        """
+        index = self._index(x, y)
+        old_code = self._types[index]
+        if old_code != code:
+            self._types[index] = code
+            self._coords_by_code[old_code].pop((x, y), None)
+            if code != BLOCKED_CODE:
+                self._coords_by_code[code][(x, y)] = None
+
+    def _set_doors(self, x, y, doors):
+        """
+        Sets the door bits of a cell, dropping the navigation index if they changed.
+
+        :param x: The row coordinate of the cell.
+        :param y: The column coordinate of the cell.
+        :param doors: The new door bits. See DOOR_BITS.
+        """
+        index = self._index(x, y)
+        if self._doors[index] != doors:
+            self._doors[index] = doors
+            self._navigation = None
+
+    def _set_visited(self, x, y, new_visited):
+        """
+        Sets the visited status of a cell, repainting its tile on the cached minimap if the status changed.
+
+        :param x: The row coordinate of the cell.
+        :param y: The column coordinate of the cell.
+        :param new_visited: The new visited status of the cell.
+        """
+        index = self._index(x, y)
+        value = 1 if new_visited else 0
+        if self._visited[index] != value:
+            self._visited[index] = value
+            minimap = self._minimaps.get(False)
+            if minimap is not None:
+                self.__draw_minimap_tile(minimap, x, y, value)
+
+    def _track_room(self, room):
+        """
+        Keeps the Room object for a cell while it holds a monster or an item, and drops it once it holds neither.
+
+        :param room: A room bound to this floor.
+        """
+        if room.has_monster() or room.has_item():
+            self._rooms[room._coords] = room
+        else:
+            self._rooms.pop(room._coords, None)
+
+    def __place_exit(self, entrance_x, entrance_y, rng):
+        """
+        Picks the exit uniformly among the rooms more than length - 1 rooms away from the entrance (Manhattan
+        distance) and outside the entrance's column, which the path to the exit needs to leave. The rooms are
+        counted row by row in closed form, so this takes one pass over the rows however large the floor is. If
+        the entrance is too central for any room to be that far, the furthest rooms are used instead.
+
+        :param entrance_x: The row coordinate of the entrance.
+        :param entrance_y: The column coordinate of the entrance.
+        :param rng: The random stream to pick with.
+        :return: The coordinates of the exit (row, column).
+        """
+        # Runs of candidate rooms as (row, first column, last column)
+        runs = []
+        for x in range(self._length):
+            # Columns at least this far from the entrance's are far enough, and never the entrance's own
+            reach = max(self._length - abs(x - entrance_x), 1)
+            if entrance_y - reach >= 0:
+                runs.append((x, 0, entrance_y - reach))
+            if entrance_y + reach <= self._width - 1:
+                runs.append((x, entrance_y + reach, self._width - 1))
+        if not runs:
+            # The furthest rooms are the corners furthest from the entrance on both axes
+            far_rows = {x for x in (0, self._length - 1)
+                        if abs(x - entrance_x) == max(entrance_x, self._length - 1 - entrance_x)}
+            far_columns = {y for y in (0, self._width - 1)
+                           if abs(y - entrance_y) == max(entrance_y, self._width - 1 - entrance_y)}
+            runs = [(x, y, y) for x in sorted(far_rows) for y in sorted(far_columns)]
+
+        pick = rng.randrange(sum(last - first + 1 for _, first, last in runs))
+        for x, first, last in runs:
+            if pick <= last - first:
+                return x, first + pick
+            pick -= last - first + 1
+
+    def __populate_map(self, rng):
+        """
+        Responsible for populating a fresh map with an entrance, exit, pillar, et cetera.
+
+        :param rng: The random stream to generate with.
+        """
         # Store the entrance, exit, and pillar here
         essential_rooms = []
-        # Temporarily store other non-blocked rooms here
-        other_rooms = []
 
         # Place entrance
-        entrance_x, entrance_y = (random.randint(0, self._length - 1), random.randint(0, self._width - 1))
+        entrance_x, entrance_y = (rng.randint(0, self._length - 1), rng.randint(0, self._width - 1))
         self._entrance_loc = (entrance_x, entrance_y)
-        self._map[entrance_x][entrance_y] = Room('ENTRANCE')
+        self._set_room_code(entrance_x, entrance_y, ROOM_CODES['ENTRANCE'])
         essential_rooms.append((entrance_x, entrance_y))
 
         # Place exit
-        exit_x, exit_y = (random.randint(0, self._length - 1), random.randint(0, self._width - 1))
-        distance = self.__distance(entrance_x, entrance_y, exit_x, exit_y)
-        while distance <= self._length - 1:
-            exit_x, exit_y = (random.randint(0, self._length - 1), random.randint(0, self._width - 1))
-            distance = self.__distance(entrance_x, entrance_y, exit_x, exit_y)
+        exit_x, exit_y = self.__place_exit(entrance_x, entrance_y, rng)
         self._exit_loc = (exit_x, exit_y)
-        self._map[exit_x][exit_y] = Room('EXIT')
+        self._set_room_code(exit_x, exit_y, ROOM_CODES['EXIT'])
         essential_rooms.append((exit_x, exit_y))
 
         # Generate path and offshoots
-        path = self.__path_to_exit(entrance_x, entrance_y, exit_x, exit_y)
-        offshoot_rooms = self.__generate_offshoots(path)
+        path = self.__path_to_exit(entrance_x, entrance_y, exit_x, exit_y, rng)
+        offshoot_rooms = self.__generate_offshoots(path, rng)
         populated_rooms = path + offshoot_rooms
         # Initialize the room list
         self._room_list = populated_rooms
 
-        # Add all other rooms to other_rooms list
-        for a in populated_rooms:
-            x, y = a
-            self._map[x][y].define_valid_directions(self._length, self._width, self._map, x, y)
-            other_rooms.append((x, y))
+        # Set the doors of every non-blocked room
+        for x, y in populated_rooms:
+            self.__define_doors(x, y)
 
         # Place pillar
-        self.__place_pillar(populated_rooms, exit_x, exit_y)
-        pillar_coords = next(
-            (x, y) for x, y in populated_rooms if self._map[x][y].get_type() == 'PILLAR'
-        )
+        self.__place_pillar(populated_rooms, exit_x, exit_y, rng)
         # Add pillar as the third room in the list
-        essential_rooms.append(pillar_coords)
+        essential_rooms.append(self._pillar_loc)
 
         # Finalize the room list
-        self._room_list = essential_rooms + [room for room in other_rooms if room not in essential_rooms]
+        essential_set = set(essential_rooms)
+        self._room_list = essential_rooms + [room for room in populated_rooms if room not in essential_set]
+
+    def __define_doors(self, x, y):
+        """
+        Sets the door bits of a room according to whether the adjacent rooms are traversable or not.
+
+        :param x: The row position.
+        :param y: The column position.
+        """
+        # Up, Right, Down, Left
+        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+        doors = 0
+        for bit, (dx, dy) in zip(DOOR_BITS, directions):
+            next_x, next_y = x + dx, y + dy
+            if (0 <= next_x < self._length and 0 <= next_y < self._width and
+                    self._types[self._index(next_x, next_y)] != BLOCKED_CODE):
+                doors |= bit
+        self._set_doors(x, y, doors)
 
-    def __generate_offshoots(self, path):
+    def __generate_offshoots(self, path, rng):
         """
         Responsible for generating offshoot paths on the map.
 
         :param path: The path from the entrance to exit, sequence of (row, column) tuples.
+        :param rng: The random stream to generate with.
         :return: The locations of all offshoot rooms.
         """
         offshoot_length = self._length - 2
-        starting_points = random.sample(path[1:-1], offshoot_length - 1)
+        # A path that had to fall back to a short exit may have fewer rooms to branch from
+        branch_points = path[1:-1]
+        starting_points = rng.sample(branch_points, min(offshoot_length - 1, len(branch_points)))
         directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
         room_locations = []
         for x, y in starting_points:
-            direction = random.choice(directions)
+            direction = rng.choice(directions)
             if not self.__valid_direction_for_offshoot(direction, x, y):
                 direction = [-1 * direction[0], -1 * direction[1]]
             for i in range(offshoot_length):
                 next_x, next_y = x + direction[0] * (i + 1), y + direction[1] * (i + 1)
                 if (0 <= next_x < self._length and
                         0 <= next_y < self._width and
-                        self._map[next_x][next_y].type == 'BLOCKED'):
-                    self._map[next_x][next_y] = Room('RANDOM')
+                        self._types[self._index(next_x, next_y)] == BLOCKED_CODE):
+                    self._set_room_code(next_x, next_y, ROOM_CODES[roll_room_type(rng)])
                     room_locations.append((next_x, next_y))
                 else:
                     break
         return room_locations
 
-    def __path_to_exit(self, entrance_x, entrance_y, exit_x, exit_y) -> list:
+    def __path_to_exit(self, entrance_x, entrance_y, exit_x, exit_y, rng) -> list:
         """
         Responsible for creating and returning the path from the entrance to the exit of the dungeon.
 
@@ -402,6 +705,7 @@ class DungeonFloor:
         :param entrance_y: The column coordinate of the entrance.
         :param exit_x: The row coordinate of the exit.
         :param exit_y: The column coordinate of the exit.
+        :param rng: The random stream to roll room types with.
         :return: A list of coordinates (row, column) that is the path from the entrance to the exit.
         """
         current_x = entrance_x
@@ -410,27 +714,28 @@ class DungeonFloor:
         while current_y != exit_y:
             while current_x != exit_x:
                 current_x = current_x + 1 if current_x < exit_x else current_x - 1
-                self._map[current_x][current_y] = Room('RANDOM')
+                self._set_room_code(current_x, current_y, ROOM_CODES[roll_room_type(rng)])
                 path.append((current_x, current_y))
             current_y = current_y + 1 if current_y < exit_y else current_y - 1
             if current_x != exit_x or current_y != exit_y:
-                self._map[current_x][current_y] = Room('RANDOM')
+                self._set_room_code(current_x, current_y, ROOM_CODES[roll_room_type(rng)])
             path.append((current_x, current_y))
         return path
 
-    def __place_pillar(self, rooms, exit_x, exit_y):
+    def __place_pillar(self, rooms, exit_x, exit_y, rng):
         """
         Places one pillar somewhere on the map (excluding entrance/exit).
 
         :param rooms: A list of all traversable room coordinates.
         :param exit_x: The row coordinate of the exit.
         :param exit_y: The column coordinate of the exit.
+        :param rng: The random stream to place with.
         """
         # excludes entrance room
-        x, y = random.choice(rooms[1:])
+        x, y = rng.choice(rooms[1:])
         while x == exit_x and y == exit_y:
-            x, y = random.choice(rooms[1:])
-        self._map[x][y].set_type("PILLAR")
+            x, y = rng.choice(rooms[1:])
+        self._set_room_code(x, y, ROOM_CODES['PILLAR'])
         self._pillar_loc = (x, y)
         if (x, y) not in self._room_list:
             # Add to non-blocked list
@@ -446,68 +751,146 @@ class DungeonFloor:
         """
         new_x, new_y = x + direction[0], y + direction[1]
         return (0 <= new_x < self._length and 0 <= new_y < self._width and
-                self._map[new_x][new_y].type == 'BLOCKED')
+                self._types[self._index(new_x, new_y)] == BLOCKED_CODE)
 
     def create_map(self, reveal_all=False):
         """
-        Creates the minimap of the floor. By default, only returns visited rooms. Returns a Surface.
+        Creates the minimap of the floor. By default, only returns visited rooms. Returns a Surface, laid out
+        for MAP_SURFACE_TILES rooms per side of MAP_SURFACE_TILE_SIZE pixels; larger floors are scaled to fit.
 
         :param reveal_all: Whether all rooms should be revealed on the map or not.
         :return A pygame Surface representing the current floor's map.
         """
-        tile_size = MAP_SURFACE_TILE_SIZE
-        # 8 is max floor width/height for now
-        map_surface = Surface((MAP_SURFACE_TILE_SIZE * 8, MAP_SURFACE_TILE_SIZE * 8))
-        color = None
-        for row in range(self._length):
-            for col in range(self._width):
-                room = self._map[row][col]
-                x = col * tile_size
-                y = row * tile_size
-                if room.type == "MONSTER":
-                    color = RED
-                elif room.type == "ELITE":
-                    color = DARK_RED
-                elif room.type == "ITEM":
-                    color = GOLD
-                elif room.type == "PILLAR":
-                    color = FADED_GRAY
-                elif room.type == "TRAP":
-                    color = BROWN
-                elif room.type == "ENTRANCE":
-                    color = VIOLET
-                elif room.type == "EXIT":
-                    color = DARK_VIOLET
-                elif room.type == "EMPTY":
-                    color = MEDIUM_GREY
-                elif room.type == "BLOCKED":
-                    color = BLACK
-                if not reveal_all and room.visited:
-                    pygame.draw.rect(map_surface, color, (x, y, tile_size, tile_size))
-                elif reveal_all:
-                    pygame.draw.rect(map_surface, color, (x, y, tile_size, tile_size))
+        surface_size = MAP_SURFACE_TILE_SIZE * MAP_SURFACE_TILES
+        map_surface = Surface((surface_size, surface_size))
+        # The surface starts out black, so only non-blocked rooms need to be drawn
+        for row, col in self._room_list:
+            index = self._index(row, col)
+            if reveal_all or self._visited[index]:
+                pygame.draw.rect(map_surface, ROOM_COLORS[self._types[index]],
+                                 self.get_map_tile_rect(row, col, surface_size))
 
         return map_surface
 
+    def get_minimap(self, reveal_all=False):
+        """
+        Returns the minimap of the floor, scaled to MINIMAP_SIZE. The Surface is built on first request and
+        afterwards kept up to date in place, one tile at a time, whenever a room's visited status changes.
+
+        :param reveal_all: Whether all rooms should be revealed on the map or not.
+        :return A pygame Surface representing the current floor's map.
+        """
+        minimap = self._minimaps.get(reveal_all)
+        if minimap is None:
+            minimap = Surface((MINIMAP_SIZE, MINIMAP_SIZE))
+            for row, col in self._room_list:
+                if reveal_all or self._visited[self._index(row, col)]:
+                    self.__draw_minimap_tile(minimap, row, col, True)
+            self._minimaps[reveal_all] = minimap
+        return minimap
+
+    def get_map_tile_rect(self, row, col, map_size=MINIMAP_SIZE):
+        """
+        Returns the area a room covers on a map of the floor. Maps are laid out for MAP_SURFACE_TILES rooms per
+        side, or for the floor's size if it is larger. Tile edges are rounded up like pygame's nearest-neighbour
+        scale does, so the minimap matches a scaled create_map Surface and tiles never overlap. On a floor with
+        more rooms per side than the map has pixels, the rooms that fall between pixels get an empty tile.
+
+        :param row: The row coordinate of the room.
+        :param col: The column coordinate of the room.
+        :param map_size: The width and height of the map in pixels.
+        :return: The tile's (left, top, width, height).
+        """
+        tiles = max(MAP_SURFACE_TILES, self._length, self._width)
+        left, right = -(-col * map_size // tiles), -(-(col + 1) * map_size // tiles)
+        top, bottom = -(-row * map_size // tiles), -(-(row + 1) * map_size // tiles)
+        return left, top, right - left, bottom - top
+
+    def get_map_tile_at(self, x, y, map_size=MINIMAP_SIZE):
+        """
+        Returns the room whose tile covers a point of a map of the floor. The inverse of get_map_tile_rect.
+
+        :param x: The horizontal pixel position on the map.
+        :param y: The vertical pixel position on the map.
+        :param map_size: The width and height of the map in pixels.
+        :return: The coordinates of the room (row, column), or None if the point is off the floor.
+        """
+        tiles = max(MAP_SURFACE_TILES, self._length, self._width)
+        row, col = y * tiles // map_size, x * tiles // map_size
+        if 0 <= x < map_size and 0 <= y < map_size and row < self._length and col < self._width:
+            return row, col
+        return None
+
+    def __draw_minimap_tile(self, minimap, row, col, visible):
+        """
+        Paints one tile of a minimap Surface.
+
+        :param minimap: The minimap Surface.
+        :param row: The row coordinate of the tile.
+        :param col: The column coordinate of the tile.
+        :param visible: Whether the tile is revealed or not.
+        """
+        color = ROOM_COLORS[self._types[self._index(row, col)]] if visible else BLACK
+        pygame.draw.rect(minimap, color, self.get_map_tile_rect(row, col))
+
     def __getstate__(self):
         """Stores the object's state in a pickled dictionary."""
         return {'_length': self._length,
                 '_width': self._width,
-                '_map': self._map,
+                '_types': self._types,
+                '_doors': self._doors,
+                '_visited': self._visited,
+                '_rooms': self._rooms,
                 '_entrance_loc': self._entrance_loc,
                 '_exit_loc': self._exit_loc,
                 '_pillar_loc': self._pillar_loc,
                 '_room_list': self._room_list}
 
     def __setstate__(self, state):
-        """Restores the object's state from the pickled dictionary."""
+        """Restores the object's state from the pickled dictionary. Accepts saves holding a '_map' of Rooms."""
         self._length = state['_length']
         self._width = state['_width']
-        self._map = state['_map']
         self._entrance_loc = state['_entrance_loc']
         self._exit_loc = state['_exit_loc']
         self._pillar_loc = state['_pillar_loc']
         self._room_list = state['_room_list']
+        self._minimaps = {}
+        self._navigation = None
+        if '_map' in state:
+            self.__load_room_map(state['_map'])
+        else:
+            self._types = state['_types']
+            self._doors = state['_doors']
+            self._visited = state['_visited']
+            self._coords_by_code = [{} for _ in ROOM_TYPES]
+            for x, y in self._room_list:
+                self._coords_by_code[self._types[self._index(x, y)]][(x, y)] = None
+            self._rooms = {}
+            for (x, y), room in state['_rooms'].items():
+                room._bind(self, x, y)
+                self._rooms[(x, y)] = room
+
+    def __load_room_map(self, room_map):
+        """
+        Fills the grid arrays from a nested list of standalone Rooms, as stored by older saves.
+
+        :param room_map: The rooms of the floor, indexed [row][column].
+        """
+        cells = self._length * self._width
+        self._types = array('B', bytes(cells))
+        self._doors = array('B', bytes(cells))
+        self._visited = array('B', bytes(cells))
+        self._coords_by_code = [{} for _ in ROOM_TYPES]
+        self._rooms = {}
+        for x in range(self._length):
+            for y in range(self._width):
+                old_room = room_map[x][y]
+                room = self.fetch_room(x, y)
+                room.type = old_room.type
+                room.valid_directions = old_room.valid_directions
+                room.visited = old_room.visited
+                room.set_monster(old_room.monster)
+                room.set_item(old_room.item)
 
 if __name__ == "__main__":
     screen = pygame.display.set_mode((500, 500))
@@ -523,4 +906,4 @@ if __name__ == "__main__":
                 running = False
         screen.fill(BACKGROUND_COLOR)
         screen.blit(d_map, (0, 0))
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
@@ -0,0 +1,162 @@
+from array import array
+from collections import OrderedDict
+from src.model.dungeon.dungeonfloor import DOOR_BITS
+
+# Distance fields kept for targets other than the entrance, exit and pillar, least recently used dropped first
+TARGET_FIELD_CACHE_SIZE = 8
+
+# Marks a cell that cannot be reached in a distance field
+UNREACHABLE = -1
+
+
+class FloorNavigation:
+    """
+    Navigation index of one floor. Holds breadth-first distance fields over the floor's doors: one per target
+    room, giving every cell's number of moves to that room. The fields of the entrance, exit and pillar are
+    built up front and kept; other targets are built on first use and cached. A floor drops its navigation
+    whenever its doors change, so the fields always match the layout they were built from.
+    """
+
+    def __init__(self, floor):
+        """
+        Constructor. Builds the distance fields of the entrance, exit and pillar.
+
+        :param floor: The DungeonFloor to navigate.
+        """
+        self._floor = floor
+        width = floor.get_width()
+        # Array offset of the neighbour behind each door bit: Up, Right, Down, Left
+        self._steps = tuple(zip(DOOR_BITS, (-width, 1, width, -1)))
+        self._landmark_fields = {}
+        for coords in (floor.get_entrance_coords(), floor.get_exit_coords(), floor.get_pillar_coords()):
+            if coords is not None:
+                self._landmark_fields[coords] = self.__build_field(coords)
+        self._target_fields = OrderedDict()
+
+    def distance_field(self, target):
+        """
+        Returns the distance field of a target room.
+
+        :param target: The coordinates of the target room (row, column).
+        :return: An array holding each cell's number of moves to the target, in the floor's row-major cell
+        order, or UNREACHABLE.
+        """
+        field = self._landmark_fields.get(target)
+        if field is not None:
+            return field
+        field = self._target_fields.get(target)
+        if field is None:
+            field = self._target_fields[target] = self.__build_field(target)
+            if len(self._target_fields) > TARGET_FIELD_CACHE_SIZE:
+                self._target_fields.popitem(last=False)
+        else:
+            self._target_fields.move_to_end(target)
+        return field
+
+    def distance(self, start, target):
+        """
+        Returns the number of moves between two rooms.
+
+        :param start: The coordinates of the starting room (row, column).
+        :param target: The coordinates of the target room (row, column).
+        :return: The number of moves, or None if the target cannot be reached.
+        """
+        moves = self.distance_field(target)[self._floor._index(*start)]
+        return moves if moves != UNREACHABLE else None
+
+    def distance_to_entrance(self, start):
+        """Returns the number of moves from a room to the entrance, or None if it cannot be reached."""
+        return self.distance(start, self._floor.get_entrance_coords())
+
+    def distance_to_exit(self, start):
+        """Returns the number of moves from a room to the exit, or None if it cannot be reached."""
+        return self.distance(start, self._floor.get_exit_coords())
+
+    def distance_to_pillar(self, start):
+        """Returns the number of moves from a room to the pillar, or None if it cannot be reached."""
+        return self.distance(start, self._floor.get_pillar_coords())
+
+    def path(self, start, target):
+        """
+        Returns a shortest path between two rooms, following the target's distance field downhill. Doors are
+        tried in the order Up, Right, Down, Left, so the same rooms always give the same path.
+
+        :param start: The coordinates of the starting room (row, column).
+        :param target: The coordinates of the target room (row, column).
+        :return: The rooms to move through in order, ending with the target and not including the start. Empty
+        if the start is the target, None if the target cannot be reached.
+        """
+        return self.__follow(self.distance_field(target), start)
+
+    def visited_path(self, start, target):
+        """
+        Returns a shortest path between two rooms that only passes through visited rooms, as auto-travel must
+        not walk into rooms the player has not seen. Rooms are visited during play, so its distance field is
+        built on each call rather than cached.
+
+        :param start: The coordinates of the starting room (row, column).
+        :param target: The coordinates of the target room (row, column).
+        :return: The rooms to move through in order, as returned by path. None if the target cannot be reached
+        through visited rooms.
+        """
+        return self.__follow(self.__build_field(target, self._floor._visited, start), start)
+
+    def __follow(self, field, start):
+        """
+        Follows a distance field downhill from a room to its target.
+
+        :param field: The target's distance field.
+        :param start: The coordinates of the starting room (row, column).
+        :return: The rooms to move through in order, as returned by path.
+        """
+        floor = self._floor
+        width = floor.get_width()
+        index = floor._index(*start)
+        moves = field[index]
+        if moves == UNREACHABLE:
+            return None
+
+        doors = floor._doors
+        path = []
+        while moves > 0:
+            door_bits = doors[index]
+            for bit, offset in self._steps:
+                if door_bits & bit and field[index + offset] == moves - 1:
+                    index += offset
+                    break
+            moves -= 1
+            path.append(divmod(index, width))
+        return path
+
+    def __build_field(self, target, passable=None, start=None):
+        """
+        Builds the distance field of a target room with a breadth-first search through the floor's doors.
+
+        :param target: The coordinates of the target room (row, column).
+        :param passable: If given, a byte per cell in the floor's cell order, and the search only enters cells
+        where it is set.
+        :param start: The coordinates of a room the search may enter even if it is not passable.
+        :return: The distance field.
+        """
+        doors = self._floor._doors
+        steps = self._steps
+        start_index = self._floor._index(*start) if start is not None else None
+        field = array('i', [UNREACHABLE]) * len(doors)
+        index = self._floor._index(*target)
+        field[index] = 0
+        frontier = [index]
+        moves = 0
+        while frontier:
+            moves += 1
+            next_frontier = []
+            for index in frontier:
+                door_bits = doors[index]
+                for bit, offset in steps:
+                    if door_bits & bit:
+                        neighbour = index + offset
+                        if field[neighbour] == UNREACHABLE and (passable is None or passable[neighbour]
+                                                                or neighbour == start_index):
+                            field[neighbour] = moves
+                            next_frontier.append(neighbour)
+            frontier = next_frontier
+        return field
@@ -1,11 +1,16 @@
-import random
 from abc import abstractmethod
 from typing import final
+from src.model.entities.combat_events import (
+    BLOCK, CombatEvent, CRUSHING_BLOW, DAMAGE, DETECTED, DISCOMBOBULATING_TUNE, DIVINE_PRAYER, EXTRA_ATTACK, HIT,
+    MISS, SURPRISE_ATTACK
+)
 from src.model.entities.entities import Entity
 from src.model.entities.inventory import Inventory
 
 
 class Adventurer(Entity):
+    __slots__ = ('__my_type', '__my_block_chance', '__inventory')
+
     def __init__(self, the_name, the_type, the_max_hp,
                  the_attack_speed, the_hit_chance, the_damage_range,
                  the_block_chance):
@@ -34,33 +39,26 @@ class Adventurer(Entity):
 
     """ INTERNAL METHODS """
     @final
-    def _hit_response(self, the_dmg):
+    def _hit_response(self, the_dmg, the_events=None):
         """
         Checks for a successful block and negates received damage on success.
         Updates HP otherwise.
         :param the_dmg: received damage.
-        :return: block message on success.
+        :param the_events: list to append the combat events to; a new list if None.
+        :return: list of combat events: a block on success, a faint if HP reaches 0.
         """
-        message = ""
+        events = [] if the_events is None else the_events
 
         if not self.is_alive():
-            return message
+            return events
 
         # check block
         if self._block():
-            message += self._block_msg()
+            events.append(CombatEvent(BLOCK, self.name))
         else:
-            message += self._update_hp(the_dmg)
-
-        return message
+            self._update_hp(the_dmg, events)
 
-    @final
-    def _block_msg(self):
-        """
-        Returns a successful block message.
-        :return: block message.
-        """
-        return f"You blocked the attack."
+        return events
 
     @final
     def _block(self):
@@ -70,7 +68,7 @@ class Adventurer(Entity):
         """
         blocked = False
         # chance to block (random float within block chance)
-        if random.uniform(0, 1) <= self.block_chance:
+        if self.rng.uniform(0, 1) <= self.__my_block_chance:
             blocked = True
 
         return blocked
@@ -166,43 +164,36 @@ class Warrior(Adventurer):
         Methods:
         special_action(the_target): performs Crushing Blow.
     """
+    __slots__ = ()
     __my_special_hit_chance = 0.6
     __my_special_dmg_range = (85, 175)
 
     def special_action(self, the_target):
         """
         Performs Crushing Blow: chance of hit 40%, damage range 75 to 175.
-        Tracks the attack and outputs the appropriate message.
+        Tracks the attack as combat events.
         Does nothing if self is dead.
         :param the_target: attack target.
-        :return: Crushing Blow outcome message.
+        :return: list of Crushing Blow combat events.
         """
-        message = ""
+        events = []
         if not self.is_alive():
-            return message
+            return events
 
-        message += self.__special_action_msg(the_target)
+        events.append(CombatEvent(CRUSHING_BLOW, self.name, the_target.name))
         # crushing blow 85 to 175 dmg 60% chance to hit
         # attack roll (random float within the hit chance)
-        if random.uniform(0, 1) <= self.__my_special_hit_chance:
+        if self.rng.uniform(0, 1) <= self.__my_special_hit_chance:
             # damage roll (random int within damage_range)
-            damage = random.randint(*self.__my_special_dmg_range)
+            damage = self.rng.randint(*self.__my_special_dmg_range)
             # set health
-            message += f"{self.name} hit {the_target.name} for {damage} points."
-            message += the_target._hit_response(damage)
+            events.append(CombatEvent(HIT, self.name, the_target.name, damage))
+            the_target._hit_response(damage, events)
 
         else:
-            message += f"{self.name} missed the attack."
+            events.append(CombatEvent(MISS, self.name))
 
-        return message[:len(message) - 1]
-
-    def __special_action_msg(self, the_target):
-        """
-        Returns the Crushing Blow action message.
-        :param the_target: attack target.
-        :return: Crushing Blow message.
-        """
-        return f"{self.name} uses Crushing Blow on {the_target.name}."
+        return events
 
 
 class Priest(Adventurer):
@@ -212,33 +203,26 @@ class Priest(Adventurer):
         Methods:
         special_action(the_target): performs Divine Prayer.
     """
+    __slots__ = ()
     __my_special_heal_range_percentage = (0.4, 0.7)
 
     def special_action(self, the_target):
         """
         Performs Divine Prayer: heals between 40% to 70% of max HP.
-        Tracks the heal and outputs the appropriate message.
+        Tracks the heal as a combat event.
         Does nothing if self is dead.
         :param the_target: attack target.
-        :return: Divine Prayer outcome message.
+        :return: list of Divine Prayer combat events.
         """
-        message = ""
+        events = []
         if not self.is_alive():
-            return message
+            return events
 
-        heal = int(random.uniform(*self.__my_special_heal_range_percentage) * self.max_hp)
+        heal = int(self.rng.uniform(*self.__my_special_heal_range_percentage) * self.max_hp)
         self._update_hp(-heal)
-        message += self.__special_action_msg(heal)
-
-        return message[:len(message) - 1]
+        events.append(CombatEvent(DIVINE_PRAYER, self.name, amount=heal))
 
-    def __special_action_msg(self, the_heal):
-        """
-        Returns the Divine Prayer action message.
-        :param the_heal: heal points.
-        :return: Divine Prayer message.
-        """
-        return f"{self.name} uses Divine Prayer and heals for {the_heal}."
+        return events
 
 
 class Thief(Adventurer):
@@ -249,6 +233,7 @@ class Thief(Adventurer):
         Methods:
         special_action(the_target): performs Surprise Attack.
     """
+    __slots__ = ()
     # __my_special hit chance = 0.4
     __my_normal_attack_chance = 0.4
     __my_detection_chance = 0.2
@@ -257,45 +242,36 @@ class Thief(Adventurer):
         """
         Performs Surprise Attack: 40% chance of an extra attack, 40% chance
         of normal attack, 20% chance of being detected (no attack).
-        Tracks the attack and outputs the appropriate message.
+        Tracks the attack as combat events.
         Does nothing if self is dead.
         :param the_target: attack target.
-        :return: Surprise Attack outcome message.
+        :return: list of Surprise Attack combat events.
         """
-        message = ""
+        events = []
         if not self.is_alive():
-            return message
+            return events
 
-        message += self.__special_action_msg(the_target)
+        events.append(CombatEvent(SURPRISE_ATTACK, self.name, the_target.name))
         # miss: [0, 0.2)
         # hit: [0.2, 0.6)
         # extra hit: [0.6, 1]
         # attack roll (random float within the hit chance)
-        attack_roll = random.uniform(0, 1)
+        attack_roll = self.rng.uniform(0, 1)
 
         if attack_roll >= self.__my_detection_chance:
             # not detected: succeeds
             if attack_roll >= self.__my_detection_chance + self.__my_normal_attack_chance:
                 # extra attack
-                message += f"{self.name} gets an extra attack."
-                message += self.attack(the_target)
+                events.append(CombatEvent(EXTRA_ATTACK, self.name))
+                self.attack(the_target, events)
 
             # normal attack
-            message += "." + self.attack(the_target)
+            self.attack(the_target, events)
 
         else:
-            message += f"{self.name} was detected."
-
-        # utilizes Entity attack method trimming
-        return message
+            events.append(CombatEvent(DETECTED, self.name))
 
-    def __special_action_msg(self, the_target):
-        """
-        Returns the Surprise Attack action message.
-        :param the_target: attack target.
-        :return: Surprise Attack message.
-        """
-        return f"{self.name} uses Surprise Attack on {the_target.name}."
+        return events
 
 
 class Bard(Adventurer):
@@ -305,34 +281,27 @@ class Bard(Adventurer):
         Methods:
         special_action(the_target): performs Discombobulating Tune.
     """
+    __slots__ = ()
     __my_special_dmg_range = (30, 70)
 
     def special_action(self, the_target):
         """
         Performs Discombobulating Tune: hits the target for 30 to 70 points
         of damage. Bard takes half of the dealt damage.
-        Tracks the attack and outputs the appropriate message.
+        Tracks the attack as combat events.
         Does nothing if self is dead.
         :param the_target: attack target.
-        :return: Discombobulating Tune outcome message.
+        :return: list of Discombobulating Tune combat events.
         """
-        message = ""
+        events = []
         if not self.is_alive():
-            return message
-
-        message += self.__special_action_msg(the_target)
-        damage = random.randint(*self.__my_special_dmg_range)
-        message += f"{self.name} hit {the_target.name} for {damage} points."
-        message += the_target._hit_response(damage)
-        message += f"{self.name} takes {int(damage / 2)} points of damage."
-        self._update_hp(int(damage / 2))
+            return events
 
-        return message[:len(message) - 1]
+        events.append(CombatEvent(DISCOMBOBULATING_TUNE, self.name, the_target.name))
+        damage = self.rng.randint(*self.__my_special_dmg_range)
+        events.append(CombatEvent(HIT, self.name, the_target.name, damage))
+        the_target._hit_response(damage, events)
+        events.append(CombatEvent(DAMAGE, self.name, amount=int(damage / 2)))
+        self._update_hp(int(damage / 2), events)
 
-    def __special_action_msg(self, the_target):
-        """
-        Returns the Discombobulating Tune action message.
-        :param the_target: attack target.
-        :return: Discombobulating Tune message.
-        """
-        return f"{self.name} uses Discombobulating Tune on {the_target.name}."
\ No newline at end of file
+        return events
\ No newline at end of file
@@ -0,0 +1,56 @@
+from collections import namedtuple
+
+# Kinds of combat events
+HIT = 'hit'
+MISS = 'miss'
+BLOCK = 'block'
+REGEN = 'regen'
+FAINT = 'faint'
+DAMAGE = 'damage'
+CRUSHING_BLOW = 'crushing_blow'
+DIVINE_PRAYER = 'divine_prayer'
+SURPRISE_ATTACK = 'surprise_attack'
+EXTRA_ATTACK = 'extra_attack'
+DETECTED = 'detected'
+DISCOMBOBULATING_TUNE = 'discombobulating_tune'
+
+# The sentence shown for each kind of event
+EVENT_FORMATS = {
+    HIT: "{actor} hit {target} for {amount} points.",
+    MISS: "{actor} missed the attack.",
+    BLOCK: "You blocked the attack.",
+    REGEN: "{actor} healed for {amount} points.",
+    FAINT: "{actor} has fainted.",
+    DAMAGE: "{actor} takes {amount} points of damage.",
+    CRUSHING_BLOW: "{actor} uses Crushing Blow on {target}.",
+    DIVINE_PRAYER: "{actor} uses Divine Prayer and heals for {amount}.",
+    SURPRISE_ATTACK: "{actor} uses Surprise Attack on {target}.",
+    EXTRA_ATTACK: "{actor} gets an extra attack.",
+    DETECTED: "{actor} was detected.",
+    DISCOMBOBULATING_TUNE: "{actor} uses Discombobulating Tune on {target}."
+}
+
+# One thing that happened in combat: its kind, the name of the entity it happened to or that acted, the name
+# of the entity acted on if any, and the points of damage or healing if any. Events are only turned into text
+# by format_event, when shown.
+CombatEvent = namedtuple('CombatEvent', ('kind', 'actor', 'target', 'amount'), defaults=(None, None))
+
+
+def format_event(event):
+    """
+    Returns the sentence describing a combat event.
+
+    :param event: The CombatEvent.
+    :return: The sentence, ending with a period.
+    """
+    return EVENT_FORMATS[event.kind].format(actor=event.actor, target=event.target, amount=event.amount)
+
+
+def format_events(events):
+    """
+    Returns the sentences describing a list of combat events.
+
+    :param events: The CombatEvents, in order.
+    :return: A list of sentences.
+    """
+    return [format_event(event) for event in events]
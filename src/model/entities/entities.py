@@ -1,11 +1,16 @@
 import random
 from abc import abstractmethod
 from typing import final
+from src.model.entities.combat_events import CombatEvent, FAINT, HIT, MISS
 
 
 # Utilizes Template method: attack(target) calls _hit_response(damage),
 # which is implemented in subclasses.
 class Entity:
+    # Fixed attribute layout, so instances carry no __dict__. Subclasses declare their own __slots__.
+    __slots__ = ('__my_name', '__my_max_hp', '__my_attack_speed', '__my_hit_chance', '__my_damage_range',
+                 '__my_hp', 'rng')
+
     def __init__(self, the_name, the_max_hp, the_attack_speed, the_hit_chance, the_damage_range):
         """
         Represents a generic entity.
@@ -31,6 +36,8 @@ class Entity:
         ) if the_damage_range and len(the_damage_range) == 2 else (1, 1)
         # Initialize HP to max HP
         self.__my_hp = self.__my_max_hp
+        # Random stream for combat rolls: the random module unless a seeded stream is set. Not pickled.
+        self.rng = random
 
     def __str__(self):
         """
@@ -49,35 +56,39 @@ class Entity:
         return self.hp > 0
 
     @final
-    def attack(self, the_target):
+    def attack(self, the_target, the_events=None):
         """
         Performs an appropriate number of attacks based on own and the target's
         attack speeds. Randomly determines if an attack is successful (within attack
         chance) and triggers the target's hit response on success.
-        Tracks the battle sequence and represents it as a string of performed
-        attacks, missed attacks, successful hit responses, and faint messages.
+        Records the battle sequence as combat events: performed attacks, missed
+        attacks, successful hit responses, and faints.
         Does nothing if self or target is dead.
         :param the_target: attack target.
-        :return: string of battle actions performed by entity and target.
+        :param the_events: list to append the combat events to; a new list if None.
+        :return: list of combat events of the entity and target.
         """
-        message = ""
+        events = [] if the_events is None else the_events
+        # Stats are read from the slots once, rather than through the properties on every attack
+        name, hit_chance, damage_range = self.__my_name, self.__my_hit_chance, self.__my_damage_range
+        uniform, randint = self.rng.uniform, self.rng.randint
 
         # number of attacks
         for i in range(self.__calculate_attack_num(the_target)):
             # no attack if self or target is dead
-            if not self.is_alive() or not the_target.is_alive():
+            if self.__my_hp <= 0 or the_target.__my_hp <= 0:
                 break
 
             # hit: [0, hit_chance]
             # miss: [hit_chance, 1]
-            if random.uniform(0, 1) <= self.hit_chance:
-                damage = random.randint(*self.damage_range)
-                message += f"{self.name} hit {the_target.name} for {damage} points."
-                message += the_target._hit_response(damage)
+            if uniform(0, 1) <= hit_chance:
+                damage = randint(*damage_range)
+                events.append(CombatEvent(HIT, name, the_target.__my_name, damage))
+                the_target._hit_response(damage, events)
             else:
-                message += f"{self.name} missed the attack."
+                events.append(CombatEvent(MISS, name))
 
-        return message[:len(message) - 1]
+        return events
 
     """ INTERNAL METHODS """
     @final
@@ -89,40 +100,32 @@ class Entity:
         :return: number of attacks.
         """
         # determine number of attacks
-        attacks_per_turn = int(self.attack_speed // the_target.attack_speed)
+        attacks_per_turn = int(self.__my_attack_speed // the_target.__my_attack_speed)
         if attacks_per_turn == 0:
             attacks_per_turn = 1
 
         return attacks_per_turn
 
     @final
-    def _update_hp(self, the_diff):
+    def _update_hp(self, the_diff, the_events=None):
         """
         Subtracts the passed in difference from the entity's HP and updates the HP.
         Does not update HP to below 0 or above the HP max.
         :param the_diff: the HP difference.
-        :return: faint message if HP reaches 0.
-        """
-        message = ""
-        if self.hp - the_diff <= 0:
-            self.hp = 0
-            message += self._has_fainted_msg()
-        elif self.hp - the_diff > self.max_hp:
-            self.hp = self.max_hp
+        :param the_events: list to append a faint event to if HP reaches 0, or None.
+        """
+        hp = self.__my_hp - the_diff
+        if hp <= 0:
+            self.__my_hp = 0
+            if the_events is not None:
+                the_events.append(CombatEvent(FAINT, self.__my_name))
+        elif hp > self.__my_max_hp:
+            self.__my_hp = self.__my_max_hp
         else:
-            self.hp = self.hp - the_diff if self.hp - the_diff <= 999 else 999  # Cap at 99
-
-        return message
-
-    def _has_fainted_msg(self):
-        """
-        Returns the faint message for the entity.
-        :return: faint message.
-        """
-        return f"{self.name} has fainted."
+            self.__my_hp = hp if hp <= 999 else 999  # Cap at 99
 
     @abstractmethod
-    def _hit_response(self, the_dmg):
+    def _hit_response(self, the_dmg, the_events=None):
         # implemented in subclasses
         pass
 
@@ -212,4 +215,5 @@ class Entity:
         self.__my_attack_speed = state['__my_attack_speed']
         self.__my_hit_chance = state['__my_hit_chance']
         self.__my_damage_range = state['__my_damage_range']
-        self.__my_hp = state['__my_hp']
\ No newline at end of file
+        self.__my_hp = state['__my_hp']
+        self.rng = random
\ No newline at end of file
@@ -1,4 +1,3 @@
-import random
 from src.model.managers.item_manager import ItemManager
 
 
@@ -135,13 +134,13 @@ class Inventory:
             if not buff_type:
                 raise ValueError(f"Item '{item_data.name}' is missing a 'buff_type'.")
 
-            buff_value = random.randint(effect_min, effect_max)
+            buff_value = adventurer.rng.randint(effect_min, effect_max)
             adventurer.apply_buff(buff_value, buff_type)
             return True
 
         # Handle Energy Drink
         elif item_data.name == "Energy Drink":
-            heal_amount = random.randint(effect_min, effect_max)
+            heal_amount = adventurer.rng.randint(effect_min, effect_max)
             adventurer.heal_from_item(heal_amount)
             return True
         return False
@@ -163,7 +162,7 @@ class Inventory:
         # Check for Code Spike and calculate damage
         if effect_min is not None and effect_max is not None and item_data.name == "Code Spike":
             try:
-                damage = random.randint(effect_min, effect_max)
+                damage = monster.rng.randint(effect_min, effect_max)
 
                 # Apply damage and log monster health
                 monster.take_item_damage(damage)
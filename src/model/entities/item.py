@@ -1,4 +1,8 @@
 class Item:
+    # Fixed attribute layout, so instances carry no __dict__
+    __slots__ = ('__my_name', '__my_description', '__my_target', '__my_one_time_item', '__my_effect_min',
+                 '__my_effect_max', '__my_buff_type')
+
     def __init__(self, name, description, target, one_time_item,
                  effect_min=None, effect_max=None, buff_type=None):
         """
@@ -55,6 +59,17 @@ class Item:
     def buff_type(self):
         return self.__my_buff_type
 
+    def __reduce__(self):
+        """ Pickles the item as a reference to the shared instance with its fields, so that
+        unpickling gives back the ItemFactory's shared item instead of a copy.
+        :return: the callable and arguments that restore the item.
+        """
+        # Imported here, as the item factory imports this module
+        from src.model.factories.item_factory import ItemFactory
+        return ItemFactory.get_shared_item, (self.__my_name, self.__my_description, self.__my_target,
+                                             self.__my_one_time_item, self.__my_effect_min,
+                                             self.__my_effect_max, self.__my_buff_type)
+
     def __getstate__(self):
         """ Stores the object's state in a pickled dictionary.
         :return: dictionary of states to be stored.
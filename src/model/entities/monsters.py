@@ -1,9 +1,11 @@
-import random
 from typing import final
+from src.model.entities.combat_events import CombatEvent, REGEN
 from src.model.entities.entities import Entity
 
 
 class Monster(Entity):
+    __slots__ = ('__my_type', '__my_heal_chance', '__my_heal_range')
+
     def __init__(self, the_name, the_type, the_max_hp,
                  the_attack_speed, the_hit_chance, the_damage_range,
                  the_heal_chance, the_heal_range):
@@ -33,31 +35,27 @@ class Monster(Entity):
 
     """ INTERNAL METHODS """
     @final
-    def _hit_response(self, the_dmg):
+    def _hit_response(self, the_dmg, the_events=None):
         """
         Updates HP and heals on a successful regen.
         Does nothing if self is dead.
         :param the_dmg: received damage.
-        :return: regen message on success.
+        :param the_events: list to append the combat events to; a new list if None.
+        :return: list of combat events: a regen on success, a faint if HP reaches 0.
         """
-        message = ""
+        events = [] if the_events is None else the_events
+
+        if not self.is_alive():
+            return events
 
-        self._update_hp(the_dmg)
+        self._update_hp(the_dmg, events)
         if self.is_alive():
             heal = self._regen()
             if heal > 0:
-                message += self._regen_msg(heal)
+                events.append(CombatEvent(REGEN, self.name, amount=heal))
                 self._update_hp(-heal)
 
-        return message
-
-    def _regen_msg(self, the_heal):
-        """
-        Returns a successful regen message.
-        :param the_heal: the number of points healed.
-        :return: regen message.
-        """
-        return f"{self.name} healed for {the_heal} points."
+        return events
 
     def _regen(self):
         """
@@ -68,8 +66,8 @@ class Monster(Entity):
         heal = 0
 
         # Chance to heal (random float within heal chance)
-        if random.uniform(0, 1) <= self.heal_chance:
-            heal = random.randint(*self.heal_range)
+        if self.rng.uniform(0, 1) <= self.__my_heal_chance:
+            heal = self.rng.randint(*self.__my_heal_range)
 
         return heal
 
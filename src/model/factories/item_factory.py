@@ -1,8 +1,13 @@
 from src.model.entities.item import Item
 
+# Fields of an item's raw data, in the order the Item constructor takes them
+ITEM_FIELDS = ("name", "description", "target", "one_time_item", "effect_min", "effect_max", "buff_type")
+
 
 class ItemFactory:
     _instance = None
+    # Flyweight registry: the shared Item of each distinct content row, keyed by its fields
+    _items = {}
 
     @staticmethod
     def get_instance():
@@ -18,6 +23,8 @@ class ItemFactory:
     def create_item_from_raw(raw_data):
         """
         Create an Item instance from raw database data (dictionary).
+        Items are immutable and shared: a row is validated the first time it is seen, and
+        the same row always gives the same Item instance.
         :param raw_data: Dictionary containing item attributes.
         :return: An Item instance.
         """
@@ -30,6 +37,13 @@ class ItemFactory:
             if field not in raw_data:
                 raise KeyError(f"Missing required field: {field}")
 
+        fields = tuple(raw_data.get(field) for field in ITEM_FIELDS)
+        try:
+            return ItemFactory._items[fields]
+        except (KeyError, TypeError):
+            # Not seen yet, or holding an unhashable value that the validation below reports
+            pass
+
         # Type validation
         if not isinstance(raw_data.get("name"), str):
             raise TypeError("Invalid type for 'name'. Expected str.")
@@ -46,36 +60,27 @@ class ItemFactory:
         if raw_data.get("buff_type") is not None and not isinstance(raw_data["buff_type"], str):
             raise TypeError("Invalid type for 'buff_type'. Expected str or None.")
 
-        # Create and return the item
-        return Item(
-            name=raw_data["name"],
-            description=raw_data["description"],
-            target=raw_data["target"],
-            one_time_item=bool(raw_data["one_time_item"]),
-            effect_min=raw_data.get("effect_min"),
-            effect_max=raw_data.get("effect_max"),
-            buff_type=raw_data.get("buff_type"),
-        )
+        # Create, register and return the item
+        return ItemFactory.get_shared_item(*fields)
 
     @staticmethod
     def create_unique_item(raw_data):
         """
-        Create a unique item from raw data.
+        Create a unique item from raw data. The item is shared, as for create_item_from_raw.
         :param raw_data: Dictionary containing item attributes.
         :return: A unique Item instance.
         """
         try:
-            item = Item(
-                name=raw_data["name"],
-                description=raw_data["description"],
-                target=raw_data["target"],
+            return ItemFactory.get_shared_item(
+                raw_data["name"],
+                raw_data["description"],
+                raw_data["target"],
                 # Mark the item as unique
-                one_time_item=True,
-                effect_min=raw_data.get("effect_min"),
-                effect_max=raw_data.get("effect_max"),
-                buff_type=raw_data.get("buff_type"),
+                True,
+                raw_data.get("effect_min"),
+                raw_data.get("effect_max"),
+                raw_data.get("buff_type"),
             )
-            return item
         except KeyError as e:
             print(f"[ItemFactory] Missing key in raw_data: {e}")
             return None
@@ -91,4 +96,19 @@ class ItemFactory:
         # Representing the non-unique in raw data
         raw_data["one_time_item"] = 0
         item = ItemFactory.create_item_from_raw(raw_data)
-        return item
\ No newline at end of file
+        return item
+
+    @staticmethod
+    def get_shared_item(name, description, target, one_time_item, effect_min=None, effect_max=None,
+                        buff_type=None):
+        """
+        Returns the shared Item with the given fields, creating it the first time. The fields
+        are not validated, so they must come from a validated row or an existing Item.
+        :return: The shared Item instance.
+        """
+        fields = (name, description, target, one_time_item, effect_min, effect_max, buff_type)
+        item = ItemFactory._items.get(fields)
+        if item is None:
+            item = ItemFactory._items[fields] = Item(name, description, target, bool(one_time_item),
+                                                     effect_min, effect_max, buff_type)
+        return item
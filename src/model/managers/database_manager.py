@@ -1,5 +1,29 @@
 import sqlite3
 
+ITEMS_QUERY = """
+SELECT id, name, description, target, one_time_item, effect_min, effect_max, buff_type
+FROM items
+"""
+
+ROOMS_QUERY = """
+SELECT doors, image_path, rotation
+FROM rooms
+"""
+
+MONSTERS_QUERY = """
+SELECT id, name, type, max_HP, attack_speed, chance_to_hit,
+       attack_damage_min, attack_damage_max, chance_to_heal,
+       heal_range_min, heal_range_max
+FROM monsters
+"""
+
+ADVENTURERS_QUERY = """
+SELECT id, name, type, max_hp, attack_speed, chance_to_hit,
+        attack_damage_min, attack_damage_max, chance_to_block,
+        special_attack
+FROM adventurers
+"""
+
 
 class DatabaseManager:
     # Singleton instance
@@ -19,9 +43,13 @@ class DatabaseManager:
         self.cursor = None
 
     def connect(self):
-        """Establishes a connection to the database if not already connected."""
+        """Establishes a connection to the database if not already connected. The connection is kept open
+        and reused by every query until close_connection is called."""
         if not self.connection:
             self.connection = sqlite3.connect(self.db_path)
+            # The connection is kept open and reused, so use write-ahead logging: its reads then neither block on
+            # nor are blocked by a writer's transaction. The seeders themselves write one after another.
+            self.connection.execute("PRAGMA journal_mode=WAL")
             self.cursor = self.connection.cursor()
 
     def execute_query(self, query, params=()):
@@ -34,8 +62,24 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return []
+
+    def execute_queries(self, queries):
+        """
+        Executes several SELECT queries inside one read transaction, so they share a single snapshot of
+        the database.
+
+        :param queries: The queries to run, in order.
+        :return: A list holding each query's results. A failed query yields an empty list.
+        """
+        self.connect()
+        started = not self.connection.in_transaction
+        if started:
+            self.cursor.execute("BEGIN")
+        try:
+            return [self.execute_query(query) for query in queries]
         finally:
-            self.close_connection()
+            if started:
+                self.connection.commit()
 
     def close_connection(self):
         """Closes the database connection if open."""
@@ -47,36 +91,24 @@ class DatabaseManager:
 
     def fetch_items(self):
         """Fetches all items from the items table."""
-        query = """
-        SELECT id, name, description, target, one_time_item, effect_min, effect_max, buff_type
-        FROM items
-        """
-        return self.execute_query(query)
+        return self.execute_query(ITEMS_QUERY)
 
     def fetch_rooms(self):
         """Fetches all room configurations from the rooms table."""
-        query = """
-        SELECT doors, image_path, rotation
-        FROM rooms
-        """
-        return self.execute_query(query)
+        return self.execute_query(ROOMS_QUERY)
 
     def fetch_monsters(self):
-        query = """
-        SELECT id, name, type, max_HP, attack_speed, chance_to_hit, 
-               attack_damage_min, attack_damage_max, chance_to_heal,
-               heal_range_min, heal_range_max
-        FROM monsters
-        """
-        monsters = self.execute_query(query)
+        monsters = self.execute_query(MONSTERS_QUERY)
         return monsters
 
     def fetch_adventurers(self):
         """Fetches all adventurers from the adventurers table."""
-        query = """
-        SELECT id, name, type, max_hp, attack_speed, chance_to_hit,
-                attack_damage_min, attack_damage_max, chance_to_block,
-                special_attack
-        FROM adventurers
+        return self.execute_query(ADVENTURERS_QUERY)
+
+    def fetch_all(self):
+        """
+        Fetches every content table in one batch.
+
+        :return: A tuple containing (in order) the items, rooms, monsters and adventurers.
         """
-        return self.execute_query(query)
\ No newline at end of file
+        return tuple(self.execute_queries((ITEMS_QUERY, ROOMS_QUERY, MONSTERS_QUERY, ADVENTURERS_QUERY)))
@@ -1,11 +1,23 @@
+import os
 import pickle
+import threading
+from src.model.managers.room_manager import RoomManager
+from src.model.managers.save_format import decode_game_state, encode_game_state
+
+SAVE_PATH = 'data/save.dat'
+# Pickled GameController written by older versions, migrated on load
+LEGACY_SAVE_PATH = 'data/save.pkl'
 
 
 class GameStateManager:
     # Singleton instance
     _instance = None
+    # Serialises save writes; only the newest snapshot taken is ever written
+    _save_lock = threading.Lock()
+    _save_count = 0
+    _written_count = 0
     """
-    Handles save/load by initiating pickling/unpickling from save file.
+    Handles save/load by encoding/decoding the game state to/from the save file.
     """
 
     @staticmethod
@@ -18,18 +30,82 @@ class GameStateManager:
     @staticmethod
     def load_game_state():
         """
-        Loads the saved game state from save.pkl file.
+        Loads the saved game state from the save file. A legacy save.pkl is loaded if no save file exists
+        yet and is rewritten in the current format.
         :return: a saved instance of game_controller.
         """
-        with open('data/save.pkl', 'rb') as f:
-            state = pickle.load(f)
-        return state
+        if not os.path.exists(SAVE_PATH) and os.path.exists(LEGACY_SAVE_PATH):
+            with open(LEGACY_SAVE_PATH, 'rb') as f:
+                game_controller = pickle.load(f)
+            GameStateManager.save_game_state(game_controller).join()
+            # Restored the same way as a current save, rather than used as unpickled
+            state = decode_game_state(encode_game_state(game_controller.__getstate__()))
+            return GameStateManager.restore_game_controller(state)
+
+        with open(SAVE_PATH, 'rb') as f:
+            state = decode_game_state(f.read())
+        return GameStateManager.restore_game_controller(state)
 
     @staticmethod
-    def save_game_state(game_controller_instance):
+    def save_game_state(game_controller_instance, on_complete=None):
         """
-        Saves the current game state to save.pkl file.
+        Saves the current game state to the save file. The state is encoded on the calling thread, so the save
+        holds the game as it is now, then written on a worker thread.
         :param game_controller_instance: a game_controller instance.
+        :param on_complete: called from the worker thread once the save is done, with None on success or the
+        exception that stopped it.
+        :return: the worker thread.
+        """
+        data = encode_game_state(game_controller_instance.__getstate__())
+        with GameStateManager._save_lock:
+            GameStateManager._save_count += 1
+            save_number = GameStateManager._save_count
+        worker = threading.Thread(target=GameStateManager._write_save, args=(data, save_number, on_complete),
+                                  name="save-writer")
+        worker.start()
+        return worker
+
+    @staticmethod
+    def _write_save(data, save_number, on_complete):
+        """
+        Writes an encoded save atomically: the data goes to a temporary file that is synced to disk and then
+        renamed over the save file, so a crash mid-save leaves the previous save intact.
+        :param data: the encoded save.
+        :param save_number: the order this save was taken in. Saves overtaken by a newer one are dropped.
+        :param on_complete: the completion callback, or None.
         """
-        with open('data/save.pkl', 'wb') as f:
-            pickle.dump(game_controller_instance, f)
\ No newline at end of file
+        error = None
+        try:
+            with GameStateManager._save_lock:
+                if save_number > GameStateManager._written_count:
+                    temp_path = f"{SAVE_PATH}.tmp"
+                    with open(temp_path, 'wb') as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(temp_path, SAVE_PATH)
+                    GameStateManager._written_count = save_number
+        except OSError as e:
+            error = e
+        if on_complete is not None:
+            on_complete(error)
+
+    @staticmethod
+    def restore_game_controller(state):
+        """
+        Rebuilds a game controller from a decoded save, the same way unpickling one would.
+        :param state: The state dictionary returned by decode_game_state.
+        :return: the restored game_controller.
+        """
+        # Imported here, as the controllers import this module
+        from src.controller.dungeon_manager import DungeonManager
+        from src.controller.game_controller import GameController
+
+        dungeon_manager = DungeonManager.get_instance()
+        dungeon_manager.dungeon = state.pop('dungeon')
+        state['dungeon_manager'] = dungeon_manager
+        state['room_manager'] = RoomManager.get_instance()
+
+        game_controller = GameController.__new__(GameController)
+        game_controller.__setstate__(state)
+        return game_controller
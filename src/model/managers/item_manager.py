@@ -85,16 +85,17 @@ class ItemManager:
         """
         return self.other_items.get(item_name)
 
-    def get_random_consumable_item_data(self):
+    def get_random_consumable_item_data(self, rng=random):
         """
         Retrieve data for a random consumable item.
+        :param rng: The random stream to pick with.
         :return: Raw data for the item or None if no items are available.
         """
         if not self.other_items:
             print("[ERROR] No consumable items available.")
             return None
 
-        return random.choice(list(self.other_items.values()))
+        return rng.choice(list(self.other_items.values()))
 
     def reset_unique_items(self):
         """
@@ -102,10 +103,12 @@ class ItemManager:
         """
         self.unique_items_acquired.clear()
 
-    def initialize_pillar_order(self):
+    def initialize_pillar_order(self, rng=random):
         """
         Randomizes the order of one_time_items for unique item placement (pillars).
+        :param rng: The random stream to shuffle with.
         """
-        randomized_items = list(self.one_time_items.items())
-        random.shuffle(randomized_items)
+        # Shuffled from a fixed order, so that the same stream always gives the same order
+        randomized_items = sorted(self.one_time_items.items())
+        rng.shuffle(randomized_items)
         self.one_time_items = dict(randomized_items)
\ No newline at end of file
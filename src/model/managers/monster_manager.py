@@ -49,11 +49,12 @@ class MonsterManager:
             # Add the new monster data
             self.monster_data[monster_type].append(row)
 
-    def get_monster_data(self, monster_name=None, monster_type="normal"):
+    def get_monster_data(self, monster_name=None, monster_type="normal", rng=random):
         """
         Retrieve monster data by name or randomly.
         :param monster_name: The name of the monster to retrieve, or None for random.
         :param monster_type: The type of monster to retrieve ('normal' or 'elite').
+        :param rng: The random stream to pick a random monster with.
         :return: A tuple of monster data or None if not found.
         """
         if monster_type not in self.monster_data:
@@ -70,7 +71,7 @@ class MonsterManager:
         else:
             # Return random monster data
             if data:
-                random_monster = random.choice(data)
+                random_monster = rng.choice(data)
                 return random_monster
             else:
                 print("[ERROR] MonsterManager: No monsters available!")
@@ -0,0 +1,400 @@
+import struct
+import sys
+from array import array
+from src.model.dungeon.dungeonfloor import DungeonFloor, Room
+from src.model.entities.inventory import Inventory
+from src.model.entities.monsters import Monster
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.item_factory import ItemFactory
+from src.model.managers.item_manager import ItemManager
+
+# Signature and current version of the binary save format
+SAVE_MAGIC = b'DASV'
+SAVE_VERSION = 1
+# Stands in for a missing coordinate pair or string
+NONE_U16 = 0xFFFF
+
+U8 = struct.Struct('<B')
+U16 = struct.Struct('<H')
+# Game: current floor, position, flags (bit 0: return to menu, bit 1: debug)
+GAME_RECORD = struct.Struct('<BHHB')
+# String table: string count, byte length
+STRING_TABLE = struct.Struct('<HI')
+# Adventurer: max HP, HP, attack speed, hit chance, damage min/max, block chance
+ADVENTURER_RECORD = struct.Struct('<HHHdHHd')
+# Monster: max HP, attack speed, hit chance, damage min/max, heal chance, heal min/max
+MONSTER_RECORD = struct.Struct('<HHdHHdHH')
+# Inventory entry: item index, quantity
+INVENTORY_RECORD = struct.Struct('<HH')
+# Occupied room: row, column, monster index, monster HP, item index
+ROOM_RECORD = struct.Struct('<HHHHH')
+# Floor header: length, width, entrance, exit and pillar coordinates, room count, occupied room count
+FLOOR_HEADER = struct.Struct('<8HII')
+
+'''
+Layout (little-endian), version 1:
+    header      magic (4 bytes), version (u16)
+    content     monster table (name and type, alternating), a MONSTER_RECORD per monster, item name table
+    game        hero name, message, GAME_RECORD, pillar name table, pillar acquired flags (one byte each)
+    adventurer  name, type, ADVENTURER_RECORD, inventory capacity (u16), inventory entry count (u16),
+                INVENTORY_RECORDs
+    floors      count (u8), then per floor: FLOOR_HEADER, type, door and visited grids (one byte per cell),
+                room list (u16 pairs), ROOM_RECORDs
+Strings are a u16 byte length followed by UTF-8. Rooms refer to monsters and items by their index in the
+content tables. Monsters keep their stats and current HP; items are stored by name and rebuilt from the content
+database once per load.
+'''
+
+
+class SaveWriter:
+    """Appends fixed-width fields to a growing byte buffer."""
+
+    def __init__(self):
+        """Constructor, starts an empty buffer."""
+        self.buffer = bytearray()
+
+    def u8(self, value):
+        """Appends an unsigned byte."""
+        self.buffer += U8.pack(value)
+
+    def u16(self, value):
+        """Appends an unsigned 16-bit integer."""
+        self.buffer += U16.pack(value)
+
+    def string(self, text):
+        """Appends a length-prefixed UTF-8 string, or the missing marker for None."""
+        if text is None:
+            self.u16(NONE_U16)
+            return
+        encoded = text.encode('utf-8')
+        self.u16(len(encoded))
+        self.buffer += encoded
+
+    def strings(self, texts):
+        """Appends a table of strings: a count, a byte length, then the UTF-8 strings separated by NULs."""
+        encoded = '\0'.join(texts).encode('utf-8')
+        self.buffer += STRING_TABLE.pack(len(texts), len(encoded))
+        self.buffer += encoded
+
+    def raw(self, data):
+        """Appends bytes as they are."""
+        self.buffer += data
+
+
+class SaveReader:
+    """Reads fixed-width fields back out of a save buffer, in the order they were written."""
+
+    def __init__(self, data):
+        """
+        Constructor.
+
+        :param data: The bytes of the save.
+        """
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def __unpack(self, layout):
+        """Reads one struct layout and moves past it."""
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except struct.error:
+            raise ValueError("Save file is truncated.") from None
+        self.offset += layout.size
+        return values
+
+    def u8(self):
+        """Reads an unsigned byte."""
+        return self.__unpack(U8)[0]
+
+    def u16(self):
+        """Reads an unsigned 16-bit integer."""
+        return self.__unpack(U16)[0]
+
+    def string(self):
+        """Reads a length-prefixed UTF-8 string, or None for the missing marker."""
+        length = self.u16()
+        if length == NONE_U16:
+            return None
+        return str(self.raw(length), 'utf-8')
+
+    def strings(self):
+        """Reads a table of strings."""
+        count, length = self.__unpack(STRING_TABLE)
+        return str(self.raw(length), 'utf-8').split('\0') if count else []
+
+    def raw(self, length):
+        """Reads the given number of bytes."""
+        if self.offset + length > len(self.data):
+            raise ValueError("Save file is truncated.")
+        chunk = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return chunk
+
+    def array(self, typecode, count):
+        """Reads an array of the given type and item count, stored in little-endian order."""
+        values = array(typecode)
+        values.frombytes(self.raw(count * values.itemsize))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+
+def encode_game_state(state):
+    """
+    Encodes a game state into the binary save format.
+
+    :param state: The state dictionary of a GameController, as returned by its __getstate__.
+    :return: The encoded save.
+    """
+    # The content tables are filled while writing the rest, so they are put in front afterwards
+    monster_keys, item_keys = {}, {}
+    writer = SaveWriter()
+    writer.string(state['hero_name'])
+    writer.string(state['current_message'])
+    flags = int(bool(state['return_to_menu'])) | int(bool(state['debug'])) << 1
+    writer.raw(GAME_RECORD.pack(state['current_floor'], *state['position'], flags))
+    writer.strings(list(state['pillar_status']))
+    writer.raw(bytes(bool(acquired) for acquired in state['pillar_status'].values()))
+
+    _write_adventurer(writer, state['active_adventurer'], item_keys)
+
+    floors = state['dungeon_manager'].dungeon
+    writer.u8(len(floors))
+    for floor in floors:
+        _write_floor(writer, floor.__getstate__(), monster_keys, item_keys)
+
+    header = SaveWriter()
+    header.raw(SAVE_MAGIC)
+    header.u16(SAVE_VERSION)
+    header.strings([text for key in monster_keys for text in key[:2]])
+    header.raw(b''.join(MONSTER_RECORD.pack(*key[2:]) for key in monster_keys))
+    header.strings(list(item_keys))
+    return bytes(header.buffer + writer.buffer)
+
+
+def decode_game_state(data):
+    """
+    Decodes a binary save. The items are rebuilt from the ItemManager, so it must be set up first.
+
+    :param data: The bytes of the save.
+    :return: A state dictionary like GameController.__getstate__ returns, holding the floors under 'dungeon'
+    instead of a DungeonManager and without a RoomManager.
+    """
+    reader = SaveReader(data)
+    if bytes(reader.raw(len(SAVE_MAGIC))) != SAVE_MAGIC:
+        raise ValueError("Not a Dungeon Adventure save file.")
+    version = reader.u16()
+    if version != SAVE_VERSION:
+        raise ValueError(f"Unsupported save version: {version}")
+
+    # Monsters are restored from their state at full health, as unpickling would
+    monster_names = reader.strings()
+    monster_count = len(monster_names) // 2
+    monsters = [_monster_state(name, monster_type, record) for name, monster_type, record in zip(
+        monster_names[::2], monster_names[1::2],
+        MONSTER_RECORD.iter_unpack(reader.raw(monster_count * MONSTER_RECORD.size)))]
+    # Items are immutable, so every reference to one shares a single instance
+    items = [_make_item(name) for name in reader.strings()]
+
+    state = {'hero_name': reader.string(), 'current_message': reader.string()}
+    current_floor, position_x, position_y, flags = GAME_RECORD.unpack(reader.raw(GAME_RECORD.size))
+    state['current_floor'] = current_floor
+    state['position'] = (position_x, position_y)
+    state['return_to_menu'] = bool(flags & 1)
+    state['debug'] = bool(flags & 2)
+    pillar_names = reader.strings()
+    state['pillar_status'] = dict(zip(pillar_names, map(bool, reader.raw(len(pillar_names)))))
+
+    state['active_adventurer'] = _read_adventurer(reader, items)
+    state['dungeon'] = [_read_floor(reader, monsters, items) for _ in range(reader.u8())]
+    return state
+
+
+def _content_index(keys, key):
+    """
+    Finds a key's index in a content table, adding it if it is new.
+
+    :param keys: The table, as a dictionary of keys to indexes.
+    :param key: The key.
+    :return: The index.
+    """
+    return keys.setdefault(key, len(keys))
+
+
+def _write_adventurer(writer, adventurer, item_keys):
+    """
+    Writes the adventurer as a flat record.
+
+    :param writer: The SaveWriter.
+    :param adventurer: The adventurer.
+    :param item_keys: The item table.
+    """
+    writer.string(adventurer.name)
+    writer.string(adventurer.type)
+    writer.raw(ADVENTURER_RECORD.pack(adventurer.max_hp, adventurer.hp, adventurer.attack_speed,
+                                      adventurer.hit_chance, *adventurer.damage_range, adventurer.block_chance))
+    inventory = adventurer.inventory
+    writer.u16(inventory.capacity)
+    writer.u16(len(inventory.items))
+    for entry in inventory.items:
+        writer.raw(INVENTORY_RECORD.pack(_content_index(item_keys, entry["item"].name), entry["quantity"]))
+
+
+def _read_adventurer(reader, items):
+    """
+    Reads an adventurer record.
+
+    :param reader: The SaveReader.
+    :param items: The items of the item table.
+    :return: The rebuilt adventurer.
+    """
+    name, adventurer_type = reader.string(), reader.string()
+    max_hp, hp, attack_speed, hit_chance, damage_min, damage_max, block_chance = ADVENTURER_RECORD.unpack(
+        reader.raw(ADVENTURER_RECORD.size))
+    adventurer = AdventurerFactory.get_instance().make_adventurer(
+        (name, adventurer_type, max_hp, attack_speed, hit_chance, damage_min, damage_max, block_chance))
+    adventurer.hp = hp
+
+    adventurer.inventory = Inventory(reader.u16())
+    count = reader.u16()
+    try:
+        for item_index, quantity in INVENTORY_RECORD.iter_unpack(reader.raw(count * INVENTORY_RECORD.size)):
+            adventurer.inventory.add_item(items[item_index], quantity)
+    except IndexError:
+        raise ValueError("Save file refers to missing content.") from None
+    return adventurer
+
+
+def _write_floor(writer, state, monster_keys, item_keys):
+    """
+    Writes a floor from its state dictionary.
+
+    :param writer: The SaveWriter.
+    :param state: The floor's state, as returned by DungeonFloor.__getstate__.
+    :param monster_keys: The monster table.
+    :param item_keys: The item table.
+    """
+    records = []
+    for (x, y), room in state['_rooms'].items():
+        monster, item = room.get_monster(), room.get_item()
+        monster_index = item_index = NONE_U16
+        monster_hp = 0
+        if monster is not None:
+            monster_index = _content_index(monster_keys, _monster_key(monster))
+            monster_hp = monster.hp
+        if item is not None:
+            item_index = _content_index(item_keys, item.name)
+        records.append(ROOM_RECORD.pack(x, y, monster_index, monster_hp, item_index))
+
+    header = [state['_length'], state['_width']]
+    for coords in (state['_entrance_loc'], state['_exit_loc'], state['_pillar_loc']):
+        header.extend(coords if coords is not None else (NONE_U16, NONE_U16))
+    writer.raw(FLOOR_HEADER.pack(*header, len(state['_room_list']), len(records)))
+    writer.raw(state['_types'].tobytes())
+    writer.raw(state['_doors'].tobytes())
+    writer.raw(state['_visited'].tobytes())
+    room_list = array('H', [value for coords in state['_room_list'] for value in coords])
+    if sys.byteorder == 'big':
+        room_list.byteswap()
+    writer.raw(room_list.tobytes())
+    writer.raw(b''.join(records))
+
+
+def _read_floor(reader, monsters, items):
+    """
+    Reads a floor record.
+
+    :param reader: The SaveReader.
+    :param monsters: The state at full health of each monster in the monster table.
+    :param items: The items of the item table.
+    :return: The rebuilt floor.
+    """
+    length, width, *locations, room_count, record_count = FLOOR_HEADER.unpack(reader.raw(FLOOR_HEADER.size))
+    entrance, exit_, pillar = [None if coords == (NONE_U16, NONE_U16) else coords
+                               for coords in zip(locations[::2], locations[1::2])]
+    cells = length * width
+    state = {
+        '_length': length,
+        '_width': width,
+        '_entrance_loc': entrance,
+        '_exit_loc': exit_,
+        '_pillar_loc': pillar,
+        '_types': reader.array('B', cells),
+        '_doors': reader.array('B', cells),
+        '_visited': reader.array('B', cells)
+    }
+
+    room_list = reader.array('H', room_count * 2)
+    state['_room_list'] = list(zip(room_list[::2], room_list[1::2]))
+
+    state['_rooms'] = {}
+    floor = DungeonFloor.__new__(DungeonFloor)
+    floor.__setstate__(state)
+
+    # Occupied rooms are bound straight to the restored floor's grid
+    rooms = floor._rooms
+    records = reader.raw(record_count * ROOM_RECORD.size)
+    view = Room._view
+    try:
+        for x, y, monster_index, monster_hp, item_index in ROOM_RECORD.iter_unpack(records):
+            room = rooms[(x, y)] = view(floor, x, y)
+            if monster_index != NONE_U16:
+                monster = room.monster = Monster.__new__(Monster)
+                monster.__setstate__(monsters[monster_index])
+                monster.hp = monster_hp
+            if item_index != NONE_U16:
+                room.item = items[item_index]
+    except IndexError:
+        raise ValueError("Save file refers to missing content.") from None
+    return floor
+
+
+def _monster_key(monster):
+    """
+    Gets a monster's monster table entry: everything but its current HP.
+
+    :param monster: The monster.
+    :return: Name, type, then the fields of a MONSTER_RECORD.
+    """
+    state = monster.__getstate__()
+    return (state['__my_name'], state['__my_type'], state['__my_max_hp'], state['__my_attack_speed'],
+            state['__my_hit_chance'], *state['__my_damage_range'], state['__my_heal_chance'],
+            *state['__my_heal_range'])
+
+
+def _monster_state(name, monster_type, record):
+    """
+    Builds the state of a full health monster from its monster table entry.
+
+    :param name: The monster's name.
+    :param monster_type: The monster's type.
+    :param record: The unpacked MONSTER_RECORD.
+    :return: A state dictionary, as Monster.__getstate__ returns.
+    """
+    max_hp, attack_speed, hit_chance, damage_min, damage_max, heal_chance, heal_min, heal_max = record
+    return {'__my_name': name,
+            '__my_max_hp': max_hp,
+            '__my_attack_speed': attack_speed,
+            '__my_hit_chance': hit_chance,
+            '__my_damage_range': (damage_min, damage_max),
+            '__my_hp': max_hp,
+            '__my_type': monster_type,
+            '__my_heal_chance': heal_chance,
+            '__my_heal_range': (heal_min, heal_max)}
+
+
+def _make_item(name):
+    """
+    Makes an item from the content database.
+
+    :param name: The item's name.
+    :return: The item.
+    """
+    item_manager = ItemManager.get_instance()
+    raw_data = item_manager.one_time_items.get(name)
+    if raw_data is not None:
+        return ItemFactory.get_instance().create_unique_item(raw_data)
+    raw_data = item_manager.get_limited_item_data(name)
+    if raw_data is None:
+        raise ValueError(f"Unknown item in save: {name}")
+    return ItemFactory.get_instance().create_item_from_raw(raw_data)
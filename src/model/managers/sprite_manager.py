@@ -1,4 +1,11 @@
+import os
+from collections import OrderedDict
 import pygame
+from constants import SPRITE_CACHE_BUDGET, SPRITE_PATHS
+
+# Folders searched for portraits missing from SPRITE_PATHS, relative to the working directory.
+# Packaged builds keep their assets under _internal/.
+PORTRAIT_DIRS = ("assets/images", "_internal/assets/images")
 
 
 class SpriteManager:
@@ -17,6 +24,17 @@ class SpriteManager:
         if SpriteManager._instance is not None:
             raise Exception("This class is a singleton! Use get_instance() to access it.")
         self.sprites = {}
+        # Scaled portraits, keyed by (hero name, size)
+        self.portraits = {}
+        # Resolved once, rather than checked on every portrait lookup
+        self.portrait_dir = next((path for path in PORTRAIT_DIRS if os.path.isdir(path)), PORTRAIT_DIRS[-1])
+        # Transformed sprites keyed by (name, flip_x, rotate, scale), least recently used first
+        self.transformed_sprites = OrderedDict()
+        self.cache_budget = SPRITE_CACHE_BUDGET
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
 
     def preload_sprites(self, sprite_paths):
         """
@@ -51,14 +69,26 @@ class SpriteManager:
         sprite = self.sprites.get(name)
         return sprite
 
-    def get_transformed_sprite(self, name, flip_x=False, rotate=0):
+    def get_transformed_sprite(self, name, flip_x=False, rotate=0, scale=None):
         """
-        Dynamically transforms a sprite without caching the result.
+        Retrieves a flipped, scaled and/or rotated copy of a sprite. Results are cached (least recently
+        used first out) within the cache budget, so repeated requests cost a dictionary lookup.
         :param name: Name of the sprite.
         :param flip_x: Flip horizontally if True.
         :param rotate: Rotation angle in degrees.
+        :param scale: Size (width, height) to scale to, or None to keep the original size.
         :return: The transformed sprite or None if not found.
         """
+        # Lists are accepted for scale but are not hashable
+        scale = tuple(scale) if scale is not None else None
+        key = (name, flip_x, rotate, scale)
+        cached_sprite = self.transformed_sprites.get(key)
+        if cached_sprite is not None:
+            self.cache_hits += 1
+            self.transformed_sprites.move_to_end(key)
+            return cached_sprite
+        self.cache_misses += 1
+
         # Fetch the original sprite
         original_sprite = self.get_sprite(name)
         if not original_sprite:
@@ -71,12 +101,108 @@ class SpriteManager:
         if flip_x:
             transformed_sprite = pygame.transform.flip(transformed_sprite, True, False)
 
+        # Apply scaling if needed
+        if scale is not None:
+            transformed_sprite = pygame.transform.scale(transformed_sprite, scale)
+
         # Apply rotation if needed
         if rotate != 0:
             transformed_sprite = pygame.transform.rotate(transformed_sprite, rotate)
 
+        self.__cache_transformed_sprite(key, transformed_sprite)
         return transformed_sprite
 
+    def get_scaled_sprite(self, name, size):
+        """
+        Retrieves a sprite from SPRITE_PATHS scaled to the given size. The image is read from disk and
+        scaled on the first request only.
+        :param name: The SPRITE_PATHS key of the sprite.
+        :param size: Width and height to scale to.
+        :return: The scaled sprite or None if it is unknown or could not be loaded.
+        """
+        sprite = self.get_sprite(name)
+        if sprite is None and name in SPRITE_PATHS:
+            sprite = self.load_sprite(name, SPRITE_PATHS[name])
+        if sprite is None:
+            return None
+        return self.get_transformed_sprite(name, scale=size)
+
+    def __cache_transformed_sprite(self, key, sprite):
+        """
+        Adds a transformed sprite to the cache, evicting the least recently used ones to stay within budget.
+        Sprites larger than the whole budget are not cached.
+        :param key: The (name, flip_x, rotate, scale) key of the sprite.
+        :param sprite: The transformed sprite.
+        """
+        size = self.__sprite_bytes(sprite)
+        if size > self.cache_budget:
+            return
+        self.transformed_sprites[key] = sprite
+        self.cache_bytes += size
+        self.__evict_to_budget()
+
+    def __evict_to_budget(self):
+        """Evicts the least recently used transformed sprites until the cache fits within its budget."""
+        while self.cache_bytes > self.cache_budget and self.transformed_sprites:
+            _, evicted_sprite = self.transformed_sprites.popitem(last=False)
+            self.cache_bytes -= self.__sprite_bytes(evicted_sprite)
+            self.cache_evictions += 1
+
+    @staticmethod
+    def __sprite_bytes(sprite):
+        """
+        Returns the pixel memory used by a sprite.
+        :param sprite: The sprite.
+        :return: Size in bytes.
+        """
+        return int(sprite.get_width()) * int(sprite.get_height()) * int(sprite.get_bytesize())
+
+    def set_cache_budget(self, budget):
+        """
+        Sets the memory budget for cached transformed sprites, evicting sprites if the cache no longer fits.
+        :param budget: The budget in bytes.
+        """
+        self.cache_budget = budget
+        self.__evict_to_budget()
+
+    def get_cache_stats(self):
+        """
+        Returns the transformed sprite cache counters.
+        :return: Dictionary of hits, misses, evictions, cached entries and cached bytes.
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "evictions": self.cache_evictions,
+            "entries": len(self.transformed_sprites),
+            "bytes": self.cache_bytes
+        }
+
+    def get_portrait(self, hero_name, size=(150, 150)):
+        """
+        Retrieves a hero's portrait scaled to the given size. The portrait is loaded and scaled on the
+        first request only.
+        :param hero_name: Name of the hero (e.g. 'Mark').
+        :param size: Width and height of the portrait.
+        :return: The scaled portrait or None if it could not be loaded.
+        """
+        key = (hero_name, size)
+        portrait = self.portraits.get(key)
+        if portrait is None:
+            sprite_name = f"{hero_name.lower()}_portrait"
+            original_sprite = self.get_sprite(sprite_name)
+            if not original_sprite:
+                original_sprite = self.load_sprite(
+                    sprite_name, os.path.join(self.portrait_dir, f"{hero_name}_portrait.png"))
+            if not original_sprite:
+                return None
+            portrait = pygame.transform.scale(original_sprite, size)
+            self.portraits[key] = portrait
+        return portrait
+
     def clear_sprites(self):
         """Clears all loaded sprites and transformations."""
         self.sprites.clear()
+        self.portraits.clear()
+        self.transformed_sprites.clear()
+        self.cache_bytes = 0
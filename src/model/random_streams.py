@@ -0,0 +1,44 @@
+import hashlib
+import random
+
+
+def derive_seed(seed, *path):
+    """
+    Derives the seed of a named stream from a root seed.
+
+    :param seed: The root seed.
+    :param path: The name of the stream, e.g. ('floor', 2).
+    :return: A 64-bit seed.
+    """
+    digest = hashlib.sha256(repr((seed,) + path).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+class RandomStreams:
+    """
+    Independent random.Random streams derived from one root seed. Each stream is named by a path such as
+    ('floor', 2) and only depends on the seed and its name, so a seed always gives the same sequence on
+    every stream regardless of which other streams were used, or in which order.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Constructor.
+
+        :param seed: The root seed. A random one is picked if None.
+        """
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self._streams = {}
+
+    def stream(self, *path):
+        """
+        Returns the named stream. Asking for the same name again returns the same stream, continuing its
+        sequence.
+
+        :param path: The name of the stream.
+        :return: The random.Random stream.
+        """
+        rng = self._streams.get(path)
+        if rng is None:
+            rng = self._streams[path] = random.Random(derive_seed(self.seed, *path))
+        return rng
@@ -3,6 +3,8 @@ from constants import (
     DARK_GREY, FADED_BLUE, LIGHT_BLUE, MENU_BUTTON_HEIGHT, MENU_BUTTON_WIDTH,
     OFF_WHITE, PASTEL_RED, SCREEN_HEIGHT, SCREEN_WIDTH, SPRITE_PATHS
 )
+from src.model.managers.sprite_manager import SpriteManager
+from src.view.frame_limiter import FrameLimiter
 from src.view.gui_elements import Button
 
 
@@ -43,6 +45,8 @@ class CharacterScreen:
             MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT,
             self.fonts["small"], DARK_GREY, 'BACK'
         )
+        self.frame_limiter = FrameLimiter()
+        self.sprite_manager = SpriteManager.get_instance()
 
     def _initialize_adventurer_buttons(self):
         """Dynamically create buttons for all adventurers."""
@@ -114,9 +118,9 @@ class CharacterScreen:
                     wrapped_lines[i] = " " * indent_spaces + wrapped_lines[i]
 
             details.extend(wrapped_lines)
-            char_image = pygame.image.load(self.selected_character["image"])
-            char_image = pygame.transform.scale(char_image, (400, 400))
-            self.screen.blit(char_image, (SCREEN_WIDTH / 4 - 128, 25))
+            char_image = self.sprite_manager.get_scaled_sprite(self.selected_character["image"], (400, 400))
+            if char_image:
+                self.screen.blit(char_image, (SCREEN_WIDTH / 4 - 128, 25))
 
             self.screen.blit(char_name, (SCREEN_WIDTH / 2 + 100, 20))
             spacing = 50
@@ -167,8 +171,8 @@ class CharacterScreen:
                     if button.is_hovered((mouse_x, mouse_y)):
                         raw_data = self.adventurer_data[name]
 
-                        # Fetch image path from SPRITE_PATHS
-                        image_path = SPRITE_PATHS.get(name.lower(), SPRITE_PATHS["hero"])
+                        # Fetch image key from SPRITE_PATHS
+                        image_key = name.lower() if name.lower() in SPRITE_PATHS else "hero"
 
                         self.selected_character = {
                             "name": name,
@@ -180,7 +184,7 @@ class CharacterScreen:
                             "attack_damage_max": raw_data[7],
                             "chance_to_block": raw_data[8],
                             "special_attack": raw_data[9],
-                            "image": image_path
+                            "image": image_key
                         }
                         self.on_confirmation_screen = True
                         break
@@ -192,8 +196,10 @@ class CharacterScreen:
         """Main loop for character selection and confirmation."""
         import sys
         running = True
+        self.draw()
+        pygame.display.flip()
         while running:
-            for event in pygame.event.get():
+            for event in self.frame_limiter.wait_for_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
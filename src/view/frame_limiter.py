@@ -0,0 +1,36 @@
+import pygame
+from constants import FPS_CAP
+
+# Events that never change what is drawn on screen
+IDLE_EVENTS = (pygame.MOUSEMOTION,)
+
+
+class FrameLimiter:
+    """Caps how often a screen loop redraws and blocks between redraws until input arrives."""
+
+    def __init__(self, fps=FPS_CAP):
+        """
+        Constructor, initializes fields.
+
+        :param fps: The maximum number of redraws per second. 0 for no cap.
+        """
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+
+    def wait_for_events(self, timeout=0):
+        """
+        Waits for the next frame slot, then sleeps until at least one event that may change the
+        screen is queued. Mouse motion alone does not wake the loop.
+
+        :param timeout: Milliseconds to sleep before waking anyway, for animated screens. 0 waits
+        indefinitely.
+        :return: All queued events. Empty if the timeout ran out first.
+        """
+        self.clock.tick(self.fps)
+        while True:
+            event = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+            if event.type == pygame.NOEVENT:
+                return []
+            events = [event] + pygame.event.get()
+            if timeout or any(event.type not in IDLE_EVENTS for event in events):
+                return events
@@ -1,4 +1,5 @@
 import pygame
+from src.view.text_cache import TextCache
 
 
 class Button:
@@ -29,7 +30,7 @@ class Button:
         pygame.draw.rect(window, self.color, (self.x, self.y, self.width, self.height), 0)
         # If button has text, draw it!
         if self.text != '':
-            text = self.font.render(self.text, True, self.text_color)
+            text = TextCache.get_instance().render(self.font, self.text, True, self.text_color)
             window.blit(text, (self.x + (self.width / 2 - text.get_width() / 2),
                                self.y + (self.height / 2 - text.get_height() / 2)))
 
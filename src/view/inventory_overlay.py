@@ -1,7 +1,10 @@
 import sys
 import pygame
-from constants import FADED_BLUE, FADED_GRAY, LIGHT_BLUE, PASTEL_RED, SPRITE_PATHS
+from constants import FADED_BLUE, FADED_GRAY, LIGHT_BLUE, PASTEL_RED
+from src.model.managers.sprite_manager import SpriteManager
+from src.view.frame_limiter import FrameLimiter
 from src.view.gui_elements import Button
+from src.view.text_cache import TextCache
 
 
 class InventoryOverlay:
@@ -22,6 +25,9 @@ class InventoryOverlay:
         self.dungeon = dungeon
         # Needed initialization with a default value
         self.current_floor = 1
+        self.frame_limiter = FrameLimiter()
+        self.text_cache = TextCache.get_instance()
+        self.sprite_manager = SpriteManager.get_instance()
 
     def draw_pillar_buttons(self, button_size, spacing):
         """
@@ -64,12 +70,10 @@ class InventoryOverlay:
 
             # Determine the image to display (shrink to 100x100)
             sprite_key = name.split()[-1].lower() + "_pillar"
-            image_path = SPRITE_PATHS.get(
+            image = self.sprite_manager.get_scaled_sprite(
                 # Use a placeholder for blocked-out
-                sprite_key if acquired else "placeholder")
-            if image_path:
-                image = pygame.image.load(image_path)
-                image = pygame.transform.scale(image, (100, 100))
+                sprite_key if acquired else "placeholder", (100, 100))
+            if image:
                 image_x = row_start_x + i * (button_size + spacing) + button_size // 2 - image.get_width() // 2
                 image_y = row_y + 5
                 self.screen.blit(image, (image_x, image_y))
@@ -77,7 +81,7 @@ class InventoryOverlay:
                 # Display the buff text only if the pillar is acquired
                 if acquired:
                     buff_text = pillar_buffs.get(name, "")
-                    text_surface = self.fonts["extra_small"].render(buff_text, True, (255, 255, 255))
+                    text_surface = self.text_cache.render(self.fonts["extra_small"], buff_text, True, (255, 255, 255))
                     text_x = row_start_x + i * (
                                 button_size + spacing) + button_size // 2 - text_surface.get_width() // 2
                     text_y = row_y + button_size - 20
@@ -121,24 +125,22 @@ class InventoryOverlay:
             item_button.draw(self.screen)
 
             # Render the item name above the image
-            name_surface = self.fonts["extra_small"].render(name, True, (255, 255, 255))
+            name_surface = self.text_cache.render(self.fonts["extra_small"], name, True, (255, 255, 255))
             name_x = row_start_x + i * (button_size + spacing) + button_size // 2 - name_surface.get_width() // 2
             name_y = row_y + 8
             self.screen.blit(name_surface, (name_x, name_y))
 
             # Load and center usable item image within the button
             sprite_key = name.lower().replace(" ", "_")
-            image_path = SPRITE_PATHS.get(sprite_key)
-            if image_path:
-                image = pygame.image.load(image_path)
-                image = pygame.transform.scale(image, (64, 64))
+            image = self.sprite_manager.get_scaled_sprite(sprite_key, (64, 64))
+            if image:
                 image_x = row_start_x + i * (button_size + spacing) + button_size // 2 - image.get_width() // 2
                 image_y = name_y + name_surface.get_height() + 8
                 self.screen.blit(image, (image_x, image_y))
 
             # Display quantity text below the image
             quantity_text = f"x({quantity})"
-            text_surface = self.fonts["extra_small"].render(quantity_text, True, (255, 255, 255))
+            text_surface = self.text_cache.render(self.fonts["extra_small"], quantity_text, True, (255, 255, 255))
             text_x = row_start_x + i * (button_size + spacing) + button_size // 2 - text_surface.get_width() // 2
             text_y = image_y + image.get_height() + 8
             self.screen.blit(text_surface, (text_x, text_y))
@@ -185,7 +187,7 @@ class InventoryOverlay:
         :param dungeon: The current floor the adventurer is on (or the whole dungeon as a fallback).
         """
 
-        for event in pygame.event.get():
+        for event in self.frame_limiter.wait_for_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
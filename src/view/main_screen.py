@@ -6,8 +6,12 @@ from constants import (
     GOLD, LIGHT_BLUE, MEDIUM_GREY, MENU_BUTTON_HEIGHT, MENU_BUTTON_WIDTH,
     OFF_WHITE, RED, SCREEN_HEIGHT, SCREEN_WIDTH, VIOLET
 )
+from src.view.frame_limiter import FrameLimiter
 from src.view.gui_elements import Button
 
+# Milliseconds between redraws of the bobbing title when no input arrives
+TITLE_ANIMATION_INTERVAL = 33
+
 
 class MainScreen:
     """Represents the main menu and manual."""
@@ -34,6 +38,7 @@ class MainScreen:
             MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, self.fonts["small"], OFF_WHITE, 'MANUAL'
         )
         self.manual_menu_button = Button(DARK_GREY, 75, 75, 650, 450)
+        self.frame_limiter = FrameLimiter()
 
     def run(self):
         """
@@ -44,10 +49,11 @@ class MainScreen:
         running = True
         while running:
             clicked = False
-            mouse_pos = pygame.mouse.get_pos()
             self.screen.fill(BACKGROUND_COLOR)
+            self.draw_main_menu()
+            pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in self.frame_limiter.wait_for_events(TITLE_ANIMATION_INTERVAL):
                 # left click
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     clicked = True
@@ -55,8 +61,7 @@ class MainScreen:
                     pygame.quit()
                     exit()
 
-            self.draw_main_menu()
-
+            mouse_pos = pygame.mouse.get_pos()
             if clicked:
                 if self.new_game_button.is_hovered(mouse_pos):
                     return "new_game"
@@ -65,8 +70,6 @@ class MainScreen:
                 elif self.manual_button.is_hovered(mouse_pos):
                     self.show_manual()
 
-            pygame.display.flip()
-
     def draw_main_menu(self):
         """Draws the main menu buttons and title."""
         title = self.fonts["large"].render("DUNGEON ADVENTURE", True, LIGHT_BLUE)
@@ -120,7 +123,6 @@ class MainScreen:
         # Manual loop
         while manual_running:
             clicked = False
-            mouse_pos = pygame.mouse.get_pos()
 
             self.manual_menu_button.draw(self.screen, True)
             pygame.draw.rect(self.screen, OFF_WHITE, exit_button)
@@ -167,7 +169,9 @@ class MainScreen:
                                             SCREEN_HEIGHT / 5 - manual_body.get_height() / 2 + 178))
             self.screen.blit(manual_body6, (SCREEN_WIDTH / 2 - manual_body.get_width() / 2,
                                             SCREEN_HEIGHT / 5 - manual_body.get_height() / 2 + 210))
-            for event in pygame.event.get():
+            pygame.display.flip()
+
+            for event in self.frame_limiter.wait_for_events():
                 # left click
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     clicked = True
@@ -175,7 +179,6 @@ class MainScreen:
                     pygame.quit()
                     exit()
 
+            mouse_pos = pygame.mouse.get_pos()
             if clicked and exit_button.collidepoint(mouse_pos):
-                manual_running = False
-
-            pygame.display.flip()
\ No newline at end of file
+                manual_running = False
\ No newline at end of file
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """Keeps recently rendered text surfaces so unchanged labels are not re-rendered every frame."""
+    # Singleton instance
+    _instance = None
+
+    @staticmethod
+    def get_instance():
+        """Static method to fetch the singleton instance."""
+        if TextCache._instance is None:
+            TextCache._instance = TextCache()
+        return TextCache._instance
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Private constructor to prevent direct instantiation.
+
+        :param max_size: The maximum number of surfaces kept before the least recently used is dropped.
+        """
+        if TextCache._instance is not None:
+            raise Exception("This class is a singleton! Use get_instance() to access it.")
+        # Rendered surfaces keyed by (font, text, antialias, color), least recently used first
+        self.surfaces = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Returns the surface for the given text, rendering it only if it is not already cached.
+
+        :param font: The pygame Font to render with.
+        :param text: The text to render.
+        :param antialias: Whether the text should be antialiased.
+        :param color: The text color.
+        :return: The rendered text surface.
+        """
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drops every cached surface."""
+        self.surfaces.clear()
@@ -1,6 +1,8 @@
+import pickle
 import pytest
 from unittest.mock import patch, Mock
 from src.model.entities.adventurers import Adventurer, Warrior, Priest, Thief, Bard
+from src.model.entities.combat_events import DAMAGE, DISCOMBOBULATING_TUNE, HIT, format_events
 
 
 @pytest.fixture
@@ -38,7 +40,7 @@ def adventurer():
 def test_warrior_special_action(warrior, adventurer, mocker, force_roll, damage, message):
     mocker.patch('random.uniform', return_value=force_roll)  # Force hit
     mocker.patch('random.randint', return_value=damage)  # Force dmg
-    result = warrior.special_action(adventurer)
+    result = " ".join(format_events(warrior.special_action(adventurer)))
 
     assert "Mark uses Crushing Blow" in result
     assert message in result
@@ -50,7 +52,7 @@ def test_priest_special_action(priest, mocker):
     old_hp = 80 # create a measurable difference
     priest.hp = old_hp
     mocker.patch('random.uniform', return_value=0.1)  # Force heal percentage
-    result = priest.special_action(priest)
+    result = " ".join(format_events(priest.special_action(priest)))
     print(result)
 
     assert "Noah uses Divine Prayer and heals for " in result
@@ -63,7 +65,7 @@ def test_priest_special_action(priest, mocker):
                                                  (1, "extra attack")])
 def test_thief_special_action(thief, mocker, adventurer, force_roll, message):
     mocker.patch('random.uniform', return_value=force_roll)  # forcing attack roll
-    result = thief.special_action(adventurer)
+    result = " ".join(format_events(thief.special_action(adventurer)))
 
     assert "Jayne uses Surprise Attack" in result
     assert message in result
@@ -74,7 +76,7 @@ def test_thief_special_action(thief, mocker, adventurer, force_roll, message):
                                                   (19, 9)])
 def test_bard_special_action(bard, adventurer, mocker, dmg_target, dmg_self):
     mocker.patch('random.randint', return_value=dmg_target)
-    result = bard.special_action(adventurer)
+    result = " ".join(format_events(bard.special_action(adventurer)))
 
     assert "Sean uses Discombobulating Tune" in result
     assert "Sean hit" in result
@@ -82,13 +84,23 @@ def test_bard_special_action(bard, adventurer, mocker, dmg_target, dmg_self):
     assert bard.max_hp - bard.hp == dmg_self
 
 
+def test_bard_special_action_events(bard, adventurer, mocker):
+    mocker.patch('random.randint', return_value=20)
+    mocker.patch('random.uniform', return_value=1)  # No block
+    events = bard.special_action(adventurer)
+
+    assert [event.kind for event in events] == [DISCOMBOBULATING_TUNE, HIT, DAMAGE]
+    assert (events[1].actor, events[1].target, events[1].amount) == ("Sean", "Randy", 20)
+    assert events[2].amount == 10
+
+
 # Test blocking behavior (hit or block)
 @pytest.mark.parametrize("force_roll, hp_diff, message", [(0, 0, "blocked the attack"),
                                                           (1, 10, "")])
 def test_blocking_behavior(adventurer, mocker, force_roll, hp_diff, message):
     mocker.patch('random.uniform', return_value=force_roll) # forcing a block (0.2 chance)
     old_hp = adventurer.hp
-    result = adventurer._hit_response(10)  # Simulating a damage of 10 points
+    result = " ".join(format_events(adventurer._hit_response(10)))  # Simulating a damage of 10 points
 
     assert message in result
     assert old_hp - adventurer.hp == hp_diff
@@ -111,7 +123,7 @@ def test_hit_response_for_dead_adventurer(adventurer):
     result = adventurer._hit_response(10)
 
     # Should not perform any action and return empty response
-    assert result == ""
+    assert result == []
 
 
 # Test Adventurer's apply_buff method
@@ -167,4 +179,13 @@ def test_heal_from_item_full_health(adventurer):
 def test_heal_from_item_overheal(adventurer):
     adventurer.hp = 90  # Almost full health
     adventurer.heal_from_item(20)
-    assert adventurer.hp == 100  # Capped at max HP
\ No newline at end of file
+    assert adventurer.hp == 100  # Capped at max HP
+
+# Test the slotted layout keeps the save contract
+def test_slotted_round_trip(warrior, priest, thief, bard):
+    for adventurer in (warrior, priest, thief, bard):
+        adventurer.hp = 42
+        assert not hasattr(adventurer, "__dict__")
+        restored = pickle.loads(pickle.dumps(adventurer))
+        assert type(restored) is type(adventurer)
+        assert (restored.name, restored.hp, restored.block_chance) == (adventurer.name, 42, adventurer.block_chance)
@@ -0,0 +1,78 @@
+import csv
+import sqlite3
+import pytest
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA, AdventurerSeeder
+from assets.seeders.monster_seeder import MONSTERS_DATA, MonsterSeeder
+from src.controller.database_init import TABLE_COMMANDS
+from src.model.managers.database_manager import DatabaseManager
+
+pytest.importorskip("numpy")
+from tools.balance_sweep import (  # noqa: E402
+    TARGET_ADVENTURERS, TARGET_MONSTERS, adjust, build_tasks, build_variants, main
+)
+
+WARRIOR = ADVENTURERS_DATA[0][:8]
+PRIEST = ADVENTURERS_DATA[1][:8]
+OGRE = MONSTERS_DATA[0]
+TOM = MONSTERS_DATA[3]
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """A game database seeded with the adventurer and monster tables."""
+    path = str(tmp_path / "dungeon_game.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute(TABLE_COMMANDS["adventurers"])
+        conn.execute(TABLE_COMMANDS["monsters"])
+    AdventurerSeeder(path).populate_adventurers()
+    MonsterSeeder(path).populate_monsters()
+    # The sweep opens its own connection through the singleton
+    monkeypatch.setattr(DatabaseManager, '_instance', None)
+    return path
+
+
+def test_adjust():
+    assert adjust(TOM, 'hp', 10) == ("Tom", "Elite", 260) + TOM[3:]
+    assert adjust(TOM, 'speed', -1)[3] == 5
+    changed = adjust(WARRIOR, 'damage', 5)
+    assert changed[5:7] == (45, 80)
+    assert changed[:5] + changed[7:] == WARRIOR[:5] + WARRIOR[7:]
+
+
+def test_build_variants():
+    assert build_variants(['hp', 'speed'], [-5, 0, 5]) == [(None, 0), ('hp', -5), ('hp', 5), ('speed', -5),
+                                                          ('speed', 5)]
+
+
+def test_build_tasks():
+    variants = build_variants(['hp'], [10, 20])
+    tasks = build_tasks([WARRIOR, PRIEST], [OGRE, TOM], variants, TARGET_MONSTERS, 100, 0.5, 7)
+    assert len(tasks) == 12
+    assert [task[5] for task in tasks] == list(range(7, 19))
+    assert all(task[3:5] == (100, 0.5) for task in tasks)
+    # Each variant changes the base tables, not the previous variant
+    assert [task[2][2] for task in tasks if task[1] is WARRIOR] == [200, 250, 210, 260, 220, 270]
+    assert all(task[1] in (WARRIOR, PRIEST) for task in tasks)
+
+    tasks = build_tasks([WARRIOR], [TOM], variants, TARGET_ADVENTURERS, 100, 0.0, 0)
+    assert [(task[1][2], task[2]) for task in tasks] == [(135, TOM), (145, TOM), (155, TOM)]
+
+
+def test_serial_sweep(db_path, tmp_path, capsys):
+    output = str(tmp_path / "sweep.csv")
+    assert main(['--db', db_path, '--stats', 'hp', '--deltas', '50', '--adventurers', 'Warrior',
+                 '--monsters', 'Tom', 'Ogre', '--battles', '200', '--workers', '0', '--output', output]) == 0
+    assert "monsters hp +50" in capsys.readouterr().out
+
+    with open(output, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['variant'], row['monster']) for row in rows] == [('base', 'Ogre'), ('base', 'Tom'),
+                                                                  ('monsters hp +50', 'Ogre'),
+                                                                  ('monsters hp +50', 'Tom')]
+    assert all(row['class'] == "Warrior" and row['battles'] == '200' for row in rows)
+    assert all(0 <= float(row['win_rate']) <= 1 for row in rows)
+
+
+def test_missing_database(tmp_path, capsys):
+    assert main(['--db', str(tmp_path / "missing.db"), '--workers', '0']) == 1
+    assert "No database" in capsys.readouterr().out
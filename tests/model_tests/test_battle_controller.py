@@ -0,0 +1,35 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.controller.battle_controller import BattleController
+from src.model.battle.battle_engine import FIGHT, TurnResult
+from src.model.entities.combat_events import CombatEvent, HIT, REGEN
+
+
+@pytest.fixture
+def battle_controller():
+    """A BattleController recording what draw_ui is asked to show, with no real delays."""
+    calls = []
+    BattleController._instance = None
+    controller = BattleController.get_instance(object(), {"small": None},
+                                               lambda message, **kwargs: calls.append((message, kwargs)))
+    with patch("src.controller.battle_controller.pygame.display.flip"), \
+            patch("src.controller.battle_controller.pygame.time.delay"):
+        yield controller, calls
+    BattleController._instance = None
+
+
+def test_turn_animated_with_hp_of_each_step(battle_controller):
+    """Messages about the adventurer's attack should not already show the monster's damage."""
+    controller, calls = battle_controller
+    result = TurnResult(FIGHT,
+                        [CombatEvent(HIT, "Noah", "Ogre", 30), CombatEvent(REGEN, "Ogre", amount=5)],
+                        [CombatEvent(HIT, "Ogre", "Noah", 20)],
+                        75, 175, 55, 175)
+    controller.animate_turn(SimpleNamespace(name="Ogre"), result)
+    assert [(message, kwargs['adventurer_hp']) for message, kwargs in calls] == [
+        ("Noah hit Ogre for 30 points.", 75),
+        ("Ogre healed for 5 points.", 75),
+        ("Ogre is attacking!", 75),
+        ("Ogre hit Noah for 20 points.", 55)
+    ]
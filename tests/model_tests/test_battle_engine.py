@@ -0,0 +1,91 @@
+import random
+import subprocess
+import sys
+import pytest
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.model.battle.battle_engine import ADVENTURER_WON, BattleEngine, FIGHT, MONSTER_WON, SPECIAL
+from src.model.entities.combat_events import DIVINE_PRAYER, format_events
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.monster_factory import MonsterFactory
+
+
+def make_fighters(hero=0, enemy=0, seed=0):
+    """An adventurer and a monster from the seed data, rolling on one seeded stream."""
+    adventurer = AdventurerFactory.get_instance().make_adventurer(ADVENTURERS_DATA[hero][:8])
+    monster = MonsterFactory.get_instance().make_monster(MONSTERS_DATA[enemy])
+    adventurer.rng = monster.rng = random.Random(seed)
+    return adventurer, monster
+
+
+def test_turn_follows_entity_rules():
+    adventurer, monster = make_fighters(seed=4)
+    expected_adventurer, expected_monster = make_fighters(seed=4)
+    hero_events = expected_adventurer.attack(expected_monster)
+    hp_after_action = (expected_adventurer.hp, expected_monster.hp)
+    monster_events = expected_monster.attack(expected_adventurer)
+
+    result = BattleEngine(adventurer, monster).fight()
+    assert result.action == FIGHT
+    assert result.adventurer_events == hero_events
+    assert result.monster_events == monster_events
+    assert result.adventurer_messages == format_events(hero_events)
+    assert (result.adventurer_hp_after_action, result.monster_hp_after_action) == hp_after_action
+    assert (result.adventurer_hp, result.monster_hp) == (expected_adventurer.hp, expected_monster.hp)
+
+
+def test_no_counterattack_from_defeated_monster():
+    adventurer, monster = make_fighters()
+    monster.hp = 1
+    adventurer.hit_chance = 1
+    result = BattleEngine(adventurer, monster).fight()
+    assert not result.monster_attacked
+    assert result.outcome == ADVENTURER_WON
+
+
+def test_nothing_happens_after_battle():
+    adventurer, monster = make_fighters()
+    monster.hp = 0
+    result = BattleEngine(adventurer, monster).special()
+    assert result.adventurer_events == []
+    assert not result.monster_attacked
+
+
+def test_priest_special_heals():
+    adventurer, monster = make_fighters(hero=1, seed=2)
+    adventurer.hp = 10
+    result = BattleEngine(adventurer, monster).special()
+    assert result.action == SPECIAL
+    assert result.adventurer_events[0].kind == DIVINE_PRAYER
+    assert "Divine Prayer" in result.adventurer_messages[0]
+    # The heal shows before the monster's attack
+    assert result.adventurer_hp_after_action == 10 + result.adventurer_events[0].amount
+    assert result.adventurer_hp <= result.adventurer_hp_after_action
+
+
+def test_unknown_action():
+    with pytest.raises(ValueError):
+        BattleEngine(*make_fighters()).take_turn("flee")
+
+
+@pytest.mark.parametrize("hero", range(len(ADVENTURERS_DATA)))
+def test_run_to_the_end(hero):
+    for seed in range(20):
+        engine = BattleEngine(*make_fighters(hero=hero, enemy=seed % len(MONSTERS_DATA), seed=seed))
+        result = engine.run(lambda engine: SPECIAL if engine.adventurer.hp < 40 else FIGHT)
+        assert result.outcome in (ADVENTURER_WON, MONSTER_WON)
+        assert result.turns >= 1
+        # A Bard's special can knock out both sides at once, which counts as a win
+        assert (result.monster_hp == 0) == (result.outcome == ADVENTURER_WON)
+
+
+def test_engine_runs_without_pygame():
+    code = ("import sys; import src.model.battle.battle_engine; "
+            "assert 'pygame' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_turn_limit():
+    adventurer, monster = make_fighters(hero=1)
+    result = BattleEngine(adventurer, monster).run(lambda engine: SPECIAL, max_turns=5)
+    assert result.turns <= 5
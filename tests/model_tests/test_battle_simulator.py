@@ -0,0 +1,57 @@
+import random
+import pytest
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.model.battle.battle_engine import ADVENTURER_WON, BattleEngine
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.monster_factory import MonsterFactory
+
+np = pytest.importorskip("numpy")
+from src.model.battle.battle_simulator import LOST, UNRESOLVED, WON, simulate_battles  # noqa: E402
+
+WARRIOR = ADVENTURERS_DATA[0][:8]
+PRIEST = ADVENTURERS_DATA[1][:8]
+OGRE = MONSTERS_DATA[0]
+TOM = MONSTERS_DATA[3]
+
+
+def engine_win_rate(adventurer_data, monster_data, battles):
+    """The adventurer's win rate over battles fought with the object engine."""
+    wins = 0
+    for seed in range(battles):
+        adventurer = AdventurerFactory.get_instance().make_adventurer(adventurer_data)
+        monster = MonsterFactory.get_instance().make_monster(monster_data)
+        adventurer.rng = monster.rng = random.Random(seed)
+        wins += BattleEngine(adventurer, monster).run().outcome == ADVENTURER_WON
+    return wins / battles
+
+
+def test_matches_engine():
+    simulated = simulate_battles(WARRIOR, TOM, 100000, seed=1).win_rate
+    assert abs(simulated - engine_win_rate(WARRIOR, TOM, 3000)) < 0.03
+
+
+def test_seeded_runs_repeat():
+    first = simulate_battles(ADVENTURERS_DATA[2][:8], OGRE, 1000, special_chance=0.5, seed=7)
+    second = simulate_battles(ADVENTURERS_DATA[2][:8], OGRE, 1000, special_chance=0.5, seed=7)
+    assert np.array_equal(first.turns, second.turns)
+    assert np.array_equal(first.adventurer_hp, second.adventurer_hp)
+
+
+def test_results_consistent():
+    result = simulate_battles(ADVENTURERS_DATA[3][:8], OGRE, 5000, special_chance=0.5, seed=3)
+    assert result.win_rate + result.loss_rate + result.unresolved_rate == pytest.approx(1)
+    assert np.all(result.monster_hp[result.outcomes == WON] == 0)
+    assert np.all(result.adventurer_hp[result.outcomes == LOST] == 0)
+    assert result.adventurer_hp_distribution().sum() == pytest.approx(1)
+    assert len(result.adventurer_hp_distribution()) == ADVENTURERS_DATA[3][2] + 1
+    assert result.turn_distribution().sum() == pytest.approx(1)
+    assert result.turn_distribution()[0] == 0
+
+
+def test_turn_limit_leaves_battles_unresolved():
+    # A Priest who only prays never lands a blow
+    result = simulate_battles(PRIEST, OGRE, 200, special_chance=1, seed=0, max_turns=3)
+    assert np.all(result.turns <= 3)
+    assert np.all((result.outcomes == UNRESOLVED) | (result.outcomes == LOST))
+    assert np.all(result.monster_hp == OGRE[2])
@@ -0,0 +1,38 @@
+import pytest
+from unittest.mock import patch
+from src.controller.database_init import DatabaseInitializer
+
+
+@pytest.fixture
+def db_initializer(tmp_path):
+    """An initializer pointed at a temporary database file."""
+    with patch("src.controller.database_init.os.makedirs"):
+        initializer = DatabaseInitializer()
+    initializer.db_path = str(tmp_path / "dungeon_game.db")
+    return initializer
+
+
+def test_content_hash_tracks_seed_data():
+    seed_data = ([("Mark", "Warrior", 135)],)
+    assert DatabaseInitializer.content_hash(seed_data) == DatabaseInitializer.content_hash(seed_data)
+    assert DatabaseInitializer.content_hash(seed_data) != DatabaseInitializer.content_hash(([("Mark", "Warrior", 140)],))
+
+
+def test_no_hash_before_seeding(db_initializer):
+    assert db_initializer.get_content_hash() is None
+    db_initializer.create_tables()
+    assert db_initializer.get_content_hash() is None
+
+
+def test_content_hash_round_trip(db_initializer):
+    db_initializer.create_tables()
+    db_initializer.set_content_hash("abc")
+    db_initializer.set_content_hash("def")
+    assert db_initializer.get_content_hash() == "def"
+
+
+def test_reset_clears_content_hash(db_initializer):
+    db_initializer.create_tables()
+    db_initializer.set_content_hash("abc")
+    db_initializer.reset_database()
+    assert db_initializer.get_content_hash() is None
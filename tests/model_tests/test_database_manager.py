@@ -161,4 +161,29 @@ def test_edge_case_data(db_manager):
 def test_sql_injection(db_manager):
     malicious_input = "1; DROP TABLE items"
     result = db_manager.execute_query("SELECT * FROM items WHERE id = ?", (malicious_input,))
-    assert result == []  # No data should match
\ No newline at end of file
+    assert result == []  # No data should match
+
+
+def test_connection_persists(db_manager):
+    connection = db_manager.connection
+    db_manager.fetch_items()
+    db_manager.fetch_rooms()
+    assert db_manager.connection is connection
+    assert len(db_manager.fetch_monsters()) == 2  # Tables survive earlier queries
+
+
+def test_fetch_all(db_manager):
+    items, rooms, monsters, adventurers = db_manager.fetch_all()
+    assert [item[1] for item in items] == ['Sword', 'Shield']
+    assert len(rooms) == 2
+    assert [monster[1] for monster in monsters] == ['Hound', 'Teacher']
+    assert [adventurer[1] for adventurer in adventurers] == ['Knight', 'Wizard']
+    assert not db_manager.connection.in_transaction
+
+
+def test_fetch_all_missing_table(db_manager):
+    db_manager.connection.execute("DROP TABLE rooms")
+    db_manager.connection.commit()
+    items, rooms, monsters, adventurers = db_manager.fetch_all()
+    assert rooms == []
+    assert len(items) == 2
@@ -1,6 +1,11 @@
+import pickle
 import random
 import pytest
-from src.model.dungeon.dungeonfloor import DungeonFloor
+import pygame
+from constants import MAP_SURFACE_TILE_SIZE, MAP_SURFACE_TILES, MINIMAP_SIZE
+from src.model.dungeon.dungeonfloor import (
+    DungeonFloor, Room, ROOM_CODES, ROOM_COLORS, MAX_FLOOR_SIZE, MIN_FLOOR_SIZE
+)
 
 @pytest.fixture
 def dungeon_1():
@@ -86,3 +91,197 @@ def test_traversable(dungeon_1, dungeon_2, dungeon_3, dungeon_4):
         assert dungeon.get_entrance_coords() in visited
         assert dungeon.get_exit_coords() in visited
         assert dungeon.get_pillar_coords() in visited
+
+
+def test_blocked_rooms_not_stored(dungeon_4):
+    room_list = set(dungeon_4.get_room_list())
+    for x in range(dungeon_4.get_length()):
+        for y in range(dungeon_4.get_width()):
+            if (x, y) not in room_list:
+                assert dungeon_4.fetch_room(x, y).get_type() == "BLOCKED"
+    # No monsters or items placed yet, so no Room objects are kept
+    assert dungeon_4._rooms == {}
+
+
+def test_room_view_writes_through(dungeon_1):
+    x, y = dungeon_1.get_exit_coords()
+    dungeon_1.fetch_room(x, y).set_visited(True)
+    assert dungeon_1.fetch_room(x, y).get_visited()
+    assert dungeon_1.get_room_code(x, y) == ROOM_CODES["EXIT"]
+
+
+def test_occupied_room_kept(dungeon_1):
+    x, y = dungeon_1.get_pillar_coords()
+    room = dungeon_1.fetch_room(x, y)
+    room.set_item("pillar")
+    assert dungeon_1.fetch_room(x, y) is room
+    room.set_item(None)
+    assert (x, y) not in dungeon_1._rooms
+
+
+def test_doors_match_neighbours(dungeon_3):
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    for x, y in dungeon_3.get_room_list():
+        doors = dungeon_3.fetch_room(x, y).valid_directions
+        for is_open, (dx, dy) in zip(doors, directions):
+            new_x, new_y = x + dx, y + dy
+            in_bounds = 0 <= new_x < dungeon_3.get_length() and 0 <= new_y < dungeon_3.get_width()
+            assert is_open == (in_bounds and dungeon_3.fetch_room(new_x, new_y).get_type() != "BLOCKED")
+
+
+def test_pickle_round_trip(dungeon_2):
+    x, y = dungeon_2.get_pillar_coords()
+    dungeon_2.fetch_room(x, y).set_item("pillar")
+    restored = pickle.loads(pickle.dumps(dungeon_2))
+    assert str(restored) == str(dungeon_2)
+    assert restored.fetch_room(x, y).get_item() == "pillar"
+    assert restored.fetch_room(x, y).get_type() == "PILLAR"
+
+
+
+def rooms_by_scan(floor, room_type):
+    """The coordinates of every room of a type, found by scanning the whole floor."""
+    return {(x, y) for x in range(floor.get_length()) for y in range(floor.get_width())
+            if floor.get_room_code(x, y) == ROOM_CODES[room_type]}
+
+
+def test_rooms_of_type_match_scan(dungeon_4):
+    for room_type in ("EMPTY", "MONSTER", "ELITE", "ITEM", "TRAP", "ENTRANCE", "EXIT", "PILLAR"):
+        assert set(dungeon_4.get_rooms_of_type(room_type)) == rooms_by_scan(dungeon_4, room_type)
+
+
+def test_set_type_updates_rooms_of_type(dungeon_3):
+    x, y = dungeon_3.get_room_list()[-1]
+    old_type = dungeon_3.fetch_room(x, y).get_type()
+    dungeon_3.fetch_room(x, y).set_type("TRAP" if old_type != "TRAP" else "ITEM")
+    assert (x, y) not in dungeon_3.get_rooms_of_type(old_type)
+    assert (x, y) in dungeon_3.get_rooms_of_type(dungeon_3.fetch_room(x, y).get_type())
+
+
+def test_rooms_of_type_rebuilt_on_load(dungeon_2):
+    restored = pickle.loads(pickle.dumps(dungeon_2))
+    for room_type in ("MONSTER", "ELITE", "ITEM", "PILLAR"):
+        assert set(restored.get_rooms_of_type(room_type)) == rooms_by_scan(dungeon_2, room_type)
+
+
+def test_room_list_view(dungeon_1):
+    view = dungeon_1.get_room_list_view()
+    assert list(view) == dungeon_1.get_room_list()
+    assert view[2] == dungeon_1.get_pillar_coords()
+    assert len(view) == len(dungeon_1.get_room_list())
+    with pytest.raises(TypeError):
+        view[0] = (0, 0)
+
+def test_load_legacy_room_map(dungeon_1):
+    state = dungeon_1.__getstate__()
+    legacy_map = []
+    for x in range(dungeon_1.get_length()):
+        row = []
+        for y in range(dungeon_1.get_width()):
+            room = Room(dungeon_1.fetch_room(x, y).get_type())
+            room.valid_directions = dungeon_1.fetch_room(x, y).valid_directions
+            row.append(room)
+        legacy_map.append(row)
+    legacy_map[0][0].set_visited(True)
+    for key in ("_types", "_doors", "_visited", "_rooms"):
+        del state[key]
+    state["_map"] = legacy_map
+    restored = DungeonFloor.__new__(DungeonFloor)
+    restored.__setstate__(state)
+    assert str(restored) == str(dungeon_1)
+    assert restored.fetch_room(0, 0).get_visited()
+
+
+def test_minimap_updates_in_place(dungeon_4):
+    minimap = dungeon_4.get_minimap()
+    assert minimap.get_size() == (MINIMAP_SIZE, MINIMAP_SIZE)
+    x, y = dungeon_4.get_entrance_coords()
+    dungeon_4.fetch_room(x, y).set_visited(True)
+    dungeon_4.reveal_adjacent_rooms(*dungeon_4.get_exit_coords())
+    assert dungeon_4.get_minimap() is minimap
+    expected = pygame.transform.scale(dungeon_4.create_map(), (MINIMAP_SIZE, MINIMAP_SIZE))
+    assert pygame.image.tobytes(minimap, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_reveal_all_minimap(dungeon_2):
+    expected = pygame.transform.scale(dungeon_2.create_map(reveal_all=True), (MINIMAP_SIZE, MINIMAP_SIZE))
+    minimap = dungeon_2.get_minimap(reveal_all=True)
+    assert pygame.image.tobytes(minimap, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_seeded_floor_is_reproducible():
+    first = DungeonFloor(3, random.Random(5))
+    random.random()
+    second = DungeonFloor(3, random.Random(5))
+    assert str(first) == str(second)
+    assert first.get_room_list() == second.get_room_list()
+    assert first.get_pillar_coords() == second.get_pillar_coords()
+
+
+class CenterEntranceRandom(random.Random):
+    """Places the entrance in the center of the floor, where no room is length rooms away."""
+
+    def __init__(self, center, seed):
+        super().__init__(seed)
+        self._center = [center, center]
+
+    def randint(self, a, b):
+        return self._center.pop() if self._center else super().randint(a, b)
+
+
+def test_exit_far_from_entrance():
+    for seed in range(50):
+        floor = DungeonFloor(seed % 4 + 1, random.Random(seed))
+        (entrance_x, entrance_y), (exit_x, exit_y) = floor.get_entrance_coords(), floor.get_exit_coords()
+        assert exit_y != entrance_y
+        assert abs(exit_x - entrance_x) + abs(exit_y - entrance_y) > floor.get_length() - 1
+
+
+def test_exit_placed_with_center_entrance():
+    floor = DungeonFloor(1, CenterEntranceRandom(2, 0))
+    assert floor.get_entrance_coords() == (2, 2)
+    assert floor.get_exit_coords() in {(0, 0), (0, 4), (4, 0), (4, 4)}
+    assert floor.get_exit_coords() in floor.get_room_list()
+
+
+def test_large_floor_connected():
+    floor = DungeonFloor(1, random.Random(3), 128)
+    assert (floor.get_length(), floor.get_width()) == (128, 128)
+    rooms = set(floor.get_room_list())
+    assert len(rooms) == len(floor.get_room_list())
+    seen, stack = {floor.get_entrance_coords()}, [floor.get_entrance_coords()]
+    while stack:
+        x, y = stack.pop()
+        for next_coords in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if next_coords in rooms and next_coords not in seen:
+                seen.add(next_coords)
+                stack.append(next_coords)
+    assert seen == rooms
+
+
+@pytest.mark.parametrize("size", [MIN_FLOOR_SIZE - 1, MAX_FLOOR_SIZE + 1])
+def test_floor_size_out_of_range(size):
+    with pytest.raises(ValueError, match="Floor size"):
+        DungeonFloor(1, size=size)
+
+
+def test_large_floor_maps_keep_their_size():
+    floor = DungeonFloor(1, random.Random(3), 256)
+    map_size = MAP_SURFACE_TILE_SIZE * MAP_SURFACE_TILES
+    assert floor.create_map(reveal_all=True).get_size() == (map_size, map_size)
+    minimap = floor.get_minimap(reveal_all=True)
+    assert minimap.get_size() == (MINIMAP_SIZE, MINIMAP_SIZE)
+    # Each pixel shows the room it falls in, as if scaled down from a map with a pixel per room
+    for x in range(MINIMAP_SIZE):
+        for y in range(MINIMAP_SIZE):
+            row, col = floor.get_map_tile_at(x, y)
+            assert minimap.get_at((x, y)) == ROOM_COLORS[floor.get_room_code(row, col)]
+
+
+def test_tiles_do_not_overlap_on_floor_larger_than_minimap():
+    floor = DungeonFloor(1, random.Random(3), MINIMAP_SIZE * 2 + 7)
+    edges = [floor.get_map_tile_rect(0, col)[0] for col in range(floor.get_width())]
+    widths = [floor.get_map_tile_rect(0, col)[2] for col in range(floor.get_width())]
+    assert sum(widths) == MINIMAP_SIZE
+    assert all(left + width == next_left for left, width, next_left in zip(edges, widths, edges[1:]))
+    assert set(widths) == {0, 1}
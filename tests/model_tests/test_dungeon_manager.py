@@ -0,0 +1,123 @@
+import pickle
+import pytest
+from assets.seeders.item_seeder import ITEMS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.controller.dungeon_manager import DungeonManager, GENERATE_BACKGROUND, GENERATE_EAGER, GENERATE_LAZY
+from src.controller.game_controller import GameController
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.managers.item_manager import ItemManager
+from src.model.managers.monster_manager import MonsterManager
+from src.model.random_streams import RandomStreams
+
+
+@pytest.fixture
+def dungeon_manager():
+    """A DungeonManager over content managers filled from the seed data."""
+    ItemManager._instance = None
+    MonsterManager._instance = None
+    DungeonManager._instance = None
+    ItemManager.get_instance([(i + 1,) + row for i, row in enumerate(ITEMS_DATA)])
+    MonsterManager.get_instance([(i + 1,) + row for i, row in enumerate(MONSTERS_DATA)])
+    yield DungeonManager.get_instance()
+    ItemManager._instance = None
+    MonsterManager._instance = None
+    DungeonManager._instance = None
+
+
+def describe(dungeon):
+    """Everything generated for a dungeon, as plain values."""
+    return [(str(floor), floor.get_room_list(),
+             [(coords, room.get_monster() and room.get_monster().name, room.get_item() and room.get_item().name)
+              for coords, room in sorted(floor._rooms.items())])
+            for floor in dungeon]
+
+
+def test_same_seed_same_dungeon(dungeon_manager):
+    first = describe(dungeon_manager.initialize_dungeon(seed=1234))
+    second = describe(dungeon_manager.initialize_dungeon(seed=1234))
+    assert first == second
+    assert dungeon_manager.random_streams.seed == 1234
+
+
+def test_monsters_fight_with_combat_stream(dungeon_manager):
+    dungeon_manager.initialize_dungeon(seed=1234)
+    combat = dungeon_manager.random_streams.stream('combat')
+    monsters = [room.get_monster() for floor in dungeon_manager.dungeon for room in floor._rooms.values()
+                if room.get_monster()]
+    assert monsters and all(monster.rng is combat for monster in monsters)
+
+
+@pytest.mark.parametrize("generation", [GENERATE_BACKGROUND, GENERATE_LAZY])
+def test_deferred_generation_matches_eager(dungeon_manager, generation):
+    eager = describe(dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_EAGER))
+    assert describe(dungeon_manager.initialize_dungeon(seed=99, generation=generation)) == eager
+
+
+@pytest.mark.parametrize("generation", [GENERATE_BACKGROUND, GENERATE_LAZY])
+def test_deferred_floors_keep_their_streams(dungeon_manager, generation):
+    eager = describe(dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_EAGER))
+    dungeon = dungeon_manager.initialize_dungeon(seed=99, generation=generation)
+    dungeon_manager.random_streams = RandomStreams(5)
+    dungeon_manager.floor_sizes = [9, 9, 9, 9]
+    assert describe(dungeon) == eager
+
+
+def test_reinitialising_stops_background_generation(dungeon_manager):
+    eager = describe(dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_EAGER))
+    dungeon = dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_BACKGROUND)
+    dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_LAZY)
+    assert all(future.done() for future in dungeon._pending.values())
+    # Floors dropped from the worker are generated on first use
+    assert describe(dungeon) == eager
+
+
+def test_lazy_floors_generated_on_first_use(dungeon_manager):
+    dungeon = dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_LAZY)
+    assert len(dungeon) == 4
+    assert [dungeon.is_ready(i) for i in range(4)] == [True, False, False, False]
+    entrance = dungeon_manager.get_floor_entrance(3)
+    assert entrance == dungeon[2].get_entrance_coords()
+    assert [dungeon.is_ready(i) for i in range(4)] == [True, False, True, False]
+
+
+def test_background_floors_finish(dungeon_manager):
+    dungeon = dungeon_manager.initialize_dungeon(seed=99, generation=GENERATE_BACKGROUND)
+    assert [floor.get_length() for floor in dungeon] == [5, 6, 7, 8]
+    assert all(dungeon.is_ready(i) for i in range(4))
+
+
+def test_unknown_generation_mode(dungeon_manager):
+    with pytest.raises(ValueError):
+        dungeon_manager.initialize_dungeon(generation="sometimes")
+
+
+def test_configured_floor_sizes(dungeon_manager):
+    dungeon = dungeon_manager.initialize_dungeon(seed=99, floor_sizes=[12, 24, 48, 96])
+    assert [floor.get_length() for floor in dungeon] == [12, 24, 48, 96]
+    assert dungeon[3].fetch_room(*dungeon[3].get_pillar_coords()).get_item().one_time_item
+
+
+def test_floor_sizes_for_every_floor(dungeon_manager):
+    with pytest.raises(ValueError):
+        dungeon_manager.initialize_dungeon(floor_sizes=[12, 24])
+
+
+def test_legacy_pickle_enters_trap_room(dungeon_manager):
+    dungeon_manager.initialize_dungeon(seed=99)
+    # Pickled the way older versions saved the game
+    loaded = pickle.loads(pickle.dumps(dungeon_manager))
+    assert loaded.floor_sizes == [5, 6, 7, 8]
+
+    floor = loaded.dungeon[0]
+    position = floor.get_room_list()[-1]
+    floor.fetch_room(*position).set_type('TRAP')
+    game_controller = GameController.__new__(GameController)
+    game_controller.dungeon_manager = loaded
+    game_controller.current_floor = 1
+    game_controller.position = position
+    game_controller.active_adventurer = AdventurerFactory.get_instance().make_adventurer(
+        ("Noah", "Priest", 75, 3, 0.7, 35, 50, 0.38))
+    game_controller.display_message = lambda message, *args, **kwargs: None
+    game_controller.handle_trap_room()
+    assert game_controller.active_adventurer.hp < 75
+    assert floor.fetch_room(*position).get_visited()
@@ -1,4 +1,5 @@
 import pytest
+from src.model.entities.combat_events import CombatEvent, FAINT, format_event, format_events
 from src.model.entities.entities import Entity
 
 
@@ -7,12 +8,12 @@ class MockEntity(Entity):
     def __init__(self, the_name, the_max_hp, the_attack_speed, the_hit_chance, the_damage_range):
         super().__init__(the_name, the_max_hp, the_attack_speed, the_hit_chance, the_damage_range)
 
-    def _hit_response(self, the_dmg):
+    def _hit_response(self, the_dmg, the_events=None):
         # simulates behavior implemented in subclasses
-        message = ""
-        message += self._update_hp(the_dmg)
+        events = [] if the_events is None else the_events
+        self._update_hp(the_dmg, events)
 
-        return message
+        return events
 
 
 @pytest.fixture
@@ -92,22 +93,23 @@ def test_is_alive(hp_val, status, entity):
                                                         (1, "Attacker missed the attack")])
 def test_attack(force_roll, attack_outcome, attacker, target, mocker):
     mocker.patch('random.uniform', return_value=force_roll)
-    message = attacker.attack(target)
+    message = " ".join(format_events(attacker.attack(target)))
     assert attack_outcome in message
 
 
 def test_attack_kills_target(attacker, target, mocker):
     target.hp = 5
     mocker.patch('random.uniform', return_value=0)  # Force hit
-    message = attacker.attack(target)
-    assert "Target has fainted" in message
+    events = attacker.attack(target)
+    assert events[-1] == CombatEvent(FAINT, "Target")
+    assert "Target has fainted" in format_events(events)[-1]
 
 
 def test_attack_no_action_if_dead(attacker, target):
     target._update_hp(target.max_hp)
 
-    message = attacker.attack(target)
-    assert message == ""  # No actions should happen if target is dead
+    events = attacker.attack(target)
+    assert events == []  # No actions should happen if target is dead
 
 
 # Test _update_hp method
@@ -125,5 +127,6 @@ def test_update_hp(hp_in, hp_should, entity):
 
 # Test faint message
 def test_faint_message(entity):
-    faint_message = entity._has_fainted_msg()
-    assert faint_message == "Test Entity has fainted."
+    events = []
+    entity._update_hp(entity.max_hp, events)
+    assert format_event(events[0]) == "Test Entity has fainted."
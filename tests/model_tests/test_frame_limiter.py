@@ -0,0 +1,65 @@
+import pygame
+import pytest
+from unittest.mock import patch, MagicMock
+from src.view.frame_limiter import FrameLimiter
+
+
+def make_event(event_type):
+    """Return a stand-in for a pygame event of the given type."""
+    event = MagicMock()
+    event.type = event_type
+    return event
+
+
+@pytest.fixture
+def mock_clock():
+    """Mock pygame's Clock so no real time passes."""
+    with patch("src.view.frame_limiter.pygame.time.Clock") as mock_clock_class:
+        yield mock_clock_class.return_value
+
+
+def test_wait_for_events_ticks_at_fps(mock_clock):
+    """Each wait should take its frame slot from the clock at the configured rate."""
+    limiter = FrameLimiter(fps=30)
+    click = make_event(pygame.MOUSEBUTTONDOWN)
+    with patch("src.view.frame_limiter.pygame.event.wait", return_value=click), \
+            patch("src.view.frame_limiter.pygame.event.get", return_value=[]):
+        limiter.wait_for_events()
+
+    mock_clock.tick.assert_called_once_with(30)
+
+
+def test_wait_for_events_blocks_on_mouse_motion(mock_clock):
+    """Batches of mouse motion alone should not wake the loop."""
+    limiter = FrameLimiter()
+    motion = make_event(pygame.MOUSEMOTION)
+    click = make_event(pygame.MOUSEBUTTONDOWN)
+    with patch("src.view.frame_limiter.pygame.event.wait", side_effect=[motion, motion, click]) as mock_wait, \
+            patch("src.view.frame_limiter.pygame.event.get", return_value=[]):
+        events = limiter.wait_for_events()
+
+    assert mock_wait.call_count == 3
+    assert events == [click]
+
+
+def test_wait_for_events_returns_whole_batch(mock_clock):
+    """Once a non-idle event is queued, every event drained with it should be returned."""
+    limiter = FrameLimiter()
+    motion = make_event(pygame.MOUSEMOTION)
+    key = make_event(pygame.KEYDOWN)
+    with patch("src.view.frame_limiter.pygame.event.wait", return_value=motion), \
+            patch("src.view.frame_limiter.pygame.event.get", return_value=[motion, key]):
+        events = limiter.wait_for_events()
+
+    assert events == [motion, motion, key]
+
+
+def test_wait_for_events_timeout(mock_clock):
+    """With a timeout, an empty wait should return no events instead of blocking."""
+    limiter = FrameLimiter()
+    with patch("src.view.frame_limiter.pygame.event.wait",
+               return_value=make_event(pygame.NOEVENT)) as mock_wait:
+        events = limiter.wait_for_events(33)
+
+    mock_wait.assert_called_once_with(33)
+    assert events == []
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from src.model.entities.item import Item
 
@@ -44,4 +45,11 @@ def test_get_name():
         target="adventurer",
         one_time_item=True,
     )
-    assert item.name == "Mana Potion"
\ No newline at end of file
+    assert item.name == "Mana Potion"
+
+
+def test_slotted_round_trip():
+    item = Item("Code Spike", "Deals damage", "monster", False, 10, 20)
+    assert not hasattr(item, "__dict__")
+    restored = pickle.loads(pickle.dumps(item))
+    assert (restored.name, restored.effect_min, restored.effect_max) == ("Code Spike", 10, 20)
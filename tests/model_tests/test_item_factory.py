@@ -1,3 +1,4 @@
+import pickle
 import re
 import pytest
 from src.model.factories.item_factory import ItemFactory
@@ -195,4 +196,24 @@ def test_bulk_item_creation():
     }
     items = [ItemFactory.create_item_from_raw(raw_item_data) for _ in range(100)]
     assert len(items) == 100
-    assert all(isinstance(item, Item) for item in items)
\ No newline at end of file
+    assert all(isinstance(item, Item) for item in items)
+
+def test_items_are_shared(raw_item_data):
+    item = ItemFactory.create_item_from_raw(raw_item_data)
+    assert ItemFactory.create_item_from_raw(dict(raw_item_data)) is item
+    assert ItemFactory.create_unique_item(raw_item_data) is item
+    raw_item_data["one_time_item"] = 0
+    assert ItemFactory.create_standard_item(raw_item_data) is not item
+
+
+def test_invalid_row_rejected_every_time(raw_item_data):
+    raw_item_data["effect_min"] = "ten"
+    for _ in range(2):
+        with pytest.raises(TypeError, match="Invalid type for 'effect_min'"):
+            ItemFactory.create_item_from_raw(raw_item_data)
+
+
+def test_pickle_keeps_shared_item(raw_item_data):
+    item = ItemFactory.create_item_from_raw(raw_item_data)
+    assert all(restored is item for restored in pickle.loads(pickle.dumps([item, item])))
+    assert pickle.loads(pickle.dumps(item)) is item
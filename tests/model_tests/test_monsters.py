@@ -1,5 +1,7 @@
+import pickle
 import pytest
 from unittest.mock import patch
+from src.model.entities.combat_events import format_events
 from src.model.entities.monsters import Monster
 
 # Fixtures for standard monster types
@@ -17,7 +19,7 @@ def elite():
 def test_regen_behavior(monster, mocker, force_roll, heal, message):
     mocker.patch('random.uniform', return_value=force_roll) # forcing a regen
     mocker.patch('random.randint', return_value=heal)  # forcing a regen
-    result = monster._hit_response(10)  # Simulating a damage of 10 points
+    result = " ".join(format_events(monster._hit_response(10)))  # Simulating a damage of 10 points
 
     assert message in result
     assert monster.max_hp - monster.hp == 10 - heal
@@ -51,7 +53,7 @@ def test_hit_response_for_dead_monster(monster):
     result = monster._hit_response(10)
 
     # Should not perform any action and return empty response
-    assert result == ""
+    assert result == []
 
 #Item interactions
 def test_take_item_damage(elite):
@@ -72,4 +74,11 @@ def test_take_item_damage_kill(monster):
 def test_take_item_damage_already_defeated(monster):
     monster.hp = 0
     message = monster.take_item_damage(10)
-    assert "is already defeated!" in message
\ No newline at end of file
+    assert "is already defeated!" in message
+
+
+def test_slotted_round_trip(elite):
+    elite.hp = 42
+    assert not hasattr(elite, "__dict__")
+    restored = pickle.loads(pickle.dumps(elite))
+    assert (restored.name, restored.hp, restored.heal_range) == ("Tom", 42, (38, 50))
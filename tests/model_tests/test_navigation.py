@@ -0,0 +1,110 @@
+import random
+import pytest
+from types import SimpleNamespace
+from src.controller.game_controller import GameController
+from src.model.dungeon.dungeonfloor import DungeonFloor
+
+
+@pytest.fixture
+def floor():
+    return DungeonFloor(4, random.Random(11))
+
+
+def step_through_doors(floor, start, end):
+    """Whether a move between two rooms goes through an open door."""
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    offset = (end[0] - start[0], end[1] - start[1])
+    return offset in directions and floor.fetch_room(*start).valid_directions[directions.index(offset)]
+
+
+def test_distance_fields_match_paths(floor):
+    navigation = floor.get_navigation()
+    for start in floor.get_room_list():
+        path = navigation.path(start, floor.get_exit_coords())
+        assert len(path) == navigation.distance_to_exit(start)
+        assert all(step_through_doors(floor, a, b) for a, b in zip([start] + path, path))
+        if path:
+            assert path[-1] == floor.get_exit_coords()
+
+
+def test_landmark_distances(floor):
+    navigation = floor.get_navigation()
+    entrance, pillar = floor.get_entrance_coords(), floor.get_pillar_coords()
+    assert navigation.distance_to_entrance(entrance) == 0
+    assert navigation.distance_to_pillar(entrance) == navigation.distance_to_entrance(pillar)
+    assert navigation.distance(pillar, entrance) == navigation.distance_to_entrance(pillar)
+
+
+def test_path_to_any_room(floor):
+    navigation = floor.get_navigation()
+    start, target = floor.get_room_list()[-1], floor.get_room_list()[-2]
+    path = navigation.path(start, target)
+    assert path[-1] == target
+    assert navigation.path(start, start) == []
+
+
+def test_blocked_room_unreachable(floor):
+    rooms = set(floor.get_room_list())
+    blocked = next((x, y) for x in range(floor.get_length()) for y in range(floor.get_width())
+                   if (x, y) not in rooms)
+    navigation = floor.get_navigation()
+    assert navigation.path(floor.get_entrance_coords(), blocked) is None
+    assert navigation.distance(floor.get_entrance_coords(), blocked) is None
+
+
+def test_rebuilt_when_doors_change(floor):
+    navigation = floor.get_navigation()
+    assert floor.get_navigation() is navigation
+    room = floor.fetch_room(*floor.get_exit_coords())
+    room.valid_directions = room.valid_directions
+    assert floor.get_navigation() is navigation
+    room.valid_directions = [False, False, False, False]
+    rebuilt = floor.get_navigation()
+    assert rebuilt is not navigation
+    assert rebuilt.distance_to_exit(floor.get_entrance_coords()) is None
+
+
+def test_map_tile_at_inverts_tile_rect():
+    for floor in (DungeonFloor(2, random.Random(1)), DungeonFloor(1, random.Random(1), 40)):
+        for x in range(floor.get_length()):
+            for y in range(floor.get_width()):
+                left, top, width, height = floor.get_map_tile_rect(x, y)
+                assert floor.get_map_tile_at(left, top) == (x, y)
+                assert floor.get_map_tile_at(left + width - 1, top + height - 1) == (x, y)
+    assert DungeonFloor(1, random.Random(1)).get_map_tile_at(140, 140) is None
+
+
+def test_visited_path_avoids_unseen_rooms(floor):
+    navigation = floor.get_navigation()
+    entrance, exit_coords = floor.get_entrance_coords(), floor.get_exit_coords()
+    full_path = navigation.path(entrance, exit_coords)
+    assert len(full_path) > 1
+    floor.fetch_room(*exit_coords).set_visited(True)
+    assert navigation.visited_path(entrance, exit_coords) is None
+
+    for coords in full_path:
+        floor.fetch_room(*coords).set_visited(True)
+    assert navigation.visited_path(entrance, exit_coords) == full_path
+    assert navigation.visited_path(exit_coords, exit_coords) == []
+
+
+def test_travel_stays_in_visited_rooms(floor):
+    entrance, exit_coords = floor.get_entrance_coords(), floor.get_exit_coords()
+    full_path = floor.get_navigation().path(entrance, exit_coords)
+    game_controller = GameController.__new__(GameController)
+    game_controller.dungeon_manager = SimpleNamespace(dungeon=[floor])
+    game_controller.current_floor = 1
+    game_controller.position = entrance
+    entered, messages = [], []
+    game_controller.room_interaction = lambda: entered.append(game_controller.position)
+    game_controller.display_message = lambda message, *args: messages.append(message)
+
+    floor.fetch_room(*exit_coords).set_visited(True)
+    game_controller.travel_to(exit_coords)
+    assert entered == [] and game_controller.position == entrance
+    assert messages == ["There is no known way to get there."]
+
+    for coords in full_path:
+        floor.fetch_room(*coords).set_visited(True)
+    game_controller.travel_to(exit_coords)
+    assert entered == full_path
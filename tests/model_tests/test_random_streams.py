@@ -0,0 +1,27 @@
+import random
+from src.model.random_streams import RandomStreams, derive_seed
+
+
+def test_same_seed_same_sequence():
+    first, second = RandomStreams(42), RandomStreams(42)
+    assert [first.stream('floor', 1).random() for _ in range(5)] == \
+           [second.stream('floor', 1).random() for _ in range(5)]
+
+
+def test_streams_are_independent():
+    used = RandomStreams(42)
+    for _ in range(100):
+        used.stream('combat').random()
+    assert used.stream('floor', 2).random() == RandomStreams(42).stream('floor', 2).random()
+
+
+def test_stream_continues_its_sequence():
+    streams = RandomStreams(7)
+    assert streams.stream('items') is streams.stream('items')
+    expected = random.Random(derive_seed(7, 'items'))
+    assert [streams.stream('items').random() for _ in range(3)] == [expected.random() for _ in range(3)]
+
+
+def test_random_seed_when_none_given():
+    assert RandomStreams().seed != RandomStreams().seed
+
@@ -0,0 +1,181 @@
+import os
+import pickle
+import pytest
+from types import SimpleNamespace
+from assets.seeders.item_seeder import ITEMS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.controller.dungeon_manager import DungeonManager
+from src.controller.game_controller import GameController
+from src.model.dungeon.dungeonfloor import DungeonFloor, ROOM_CODES
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.item_factory import ItemFactory
+from src.model.factories.monster_factory import MonsterFactory
+from src.model.managers.game_state_manager import GameStateManager, LEGACY_SAVE_PATH, SAVE_PATH
+from src.model.managers.item_manager import ItemManager
+from src.model.managers.monster_manager import MonsterManager
+from src.model.managers.room_manager import RoomManager
+from src.model.managers.save_format import SAVE_MAGIC, decode_game_state, encode_game_state
+
+
+@pytest.fixture
+def managers():
+    """Content managers filled from the seed data, as the database would provide it."""
+    ItemManager._instance = None
+    MonsterManager._instance = None
+    ItemManager.get_instance([(i + 1,) + row for i, row in enumerate(ITEMS_DATA)])
+    MonsterManager.get_instance([(i + 1,) + row for i, row in enumerate(MONSTERS_DATA)])
+    yield
+    ItemManager._instance = None
+    MonsterManager._instance = None
+
+
+@pytest.fixture
+def game_state(managers):
+    """A game state with a wounded monster, an item, a pillar and a non-empty inventory."""
+    item_manager = ItemManager.get_instance()
+    floors = [DungeonFloor(2), DungeonFloor(4)]
+    for floor in floors:
+        monster_data = MonsterManager.get_instance().get_monster_data(monster_type="Elite")
+        monster = MonsterFactory.get_instance().make_monster(monster_data[1:])
+        monster.hp = 17
+        rooms = floor.get_room_list()
+        floor.fetch_room(*rooms[1]).set_monster(monster)
+        floor.fetch_room(*rooms[2]).set_item(
+            ItemFactory.get_instance().create_unique_item(item_manager.get_unique_item_data(0)))
+        floor.fetch_room(*rooms[0]).set_visited(True)
+
+    adventurer = AdventurerFactory.get_instance().make_adventurer(
+        ("Noah", "Priest", 75, 3, 0.7, 35, 50, 0.38))
+    adventurer.hp = 40
+    adventurer.apply_buff(5, "attack_damage")
+    adventurer.inventory.add_item(
+        ItemFactory.get_instance().create_item_from_raw(item_manager.get_limited_item_data("Energy Drink")), 2)
+
+    return {
+        'hero_name': "Noah",
+        'room_manager': None,
+        'dungeon_manager': SimpleNamespace(dungeon=floors),
+        'current_floor': 2,
+        'position': floors[1].get_entrance_coords(),
+        'active_adventurer': adventurer,
+        'current_message': "You found a Code Spike!",
+        'pillar_status': {"Pillar of Abstraction": True, "Pillar of Encapsulation": False},
+        'return_to_menu': False,
+        'debug': True
+    }
+
+
+def test_round_trip_game(game_state):
+    state = decode_game_state(encode_game_state(game_state))
+    for key in ('hero_name', 'current_floor', 'position', 'current_message', 'pillar_status',
+                'return_to_menu', 'debug'):
+        assert state[key] == game_state[key]
+
+
+def test_round_trip_adventurer(game_state):
+    original = game_state['active_adventurer']
+    adventurer = decode_game_state(encode_game_state(game_state))['active_adventurer']
+    assert type(adventurer) is type(original)
+    assert (adventurer.name, adventurer.hp, adventurer.max_hp) == ("Noah", 40, 75)
+    assert adventurer.damage_range == (40, 55)
+    assert adventurer.hit_chance == original.hit_chance
+    assert adventurer.block_chance == original.block_chance
+    assert [(entry["item"].name, entry["quantity"]) for entry in adventurer.inventory.items] == [("Energy Drink", 2)]
+
+
+def test_round_trip_floors(game_state):
+    floors = decode_game_state(encode_game_state(game_state))['dungeon']
+    for floor, original in zip(floors, game_state['dungeon_manager'].dungeon):
+        assert floor.get_room_list() == original.get_room_list()
+        assert floor.get_entrance_coords() == original.get_entrance_coords()
+        assert floor.get_exit_coords() == original.get_exit_coords()
+        assert floor.get_pillar_coords() == original.get_pillar_coords()
+        assert str(floor) == str(original)
+        rooms = original.get_room_list()
+        assert floor.fetch_room(*rooms[0]).get_visited()
+        assert floor.fetch_room(*rooms[0]).valid_directions == original.fetch_room(*rooms[0]).valid_directions
+        monster = floor.fetch_room(*rooms[1]).get_monster()
+        assert (monster.type, monster.hp) == ("Elite", 17)
+        assert floor.fetch_room(*rooms[2]).get_item().one_time_item
+
+
+def test_decoded_floor_write_through(game_state):
+    floor = decode_game_state(encode_game_state(game_state))['dungeon'][0]
+    x, y = floor.get_room_list()[-1]
+    floor.fetch_room(x, y).set_type('TRAP')
+    assert floor.get_room_code(x, y) == ROOM_CODES['TRAP']
+
+
+def test_smaller_than_pickle(game_state):
+    pickled = pickle.dumps(game_state)
+    assert len(encode_game_state(game_state)) < len(pickled)
+
+
+def test_rejects_other_files(managers):
+    with pytest.raises(ValueError, match="Not a Dungeon Adventure save"):
+        decode_game_state(pickle.dumps({}))
+
+
+def test_rejects_unknown_version(managers):
+    with pytest.raises(ValueError, match="Unsupported save version"):
+        decode_game_state(SAVE_MAGIC + b'\xff\x00')
+
+
+def test_rejects_truncated_save(game_state):
+    data = encode_game_state(game_state)
+    with pytest.raises(ValueError, match="truncated"):
+        decode_game_state(data[:-40])
+
+
+def test_rejects_save_cut_mid_field(game_state):
+    data = encode_game_state(game_state)
+    with pytest.raises(ValueError, match="truncated"):
+        decode_game_state(data[:7])
+
+
+def test_legacy_save_migrated_on_load(game_state, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data")
+    game_controller = GameController.__new__(GameController)
+    game_controller.__setstate__(game_state)
+    with open(LEGACY_SAVE_PATH, 'wb') as f:
+        pickle.dump(game_controller, f)
+
+    # Loaded at start-up in the game
+    monkeypatch.setattr(RoomManager, '_instance', None)
+    monkeypatch.setattr(DungeonManager, '_instance', None)
+    RoomManager.get_instance([])
+
+    loaded = GameStateManager.load_game_state()
+    assert loaded.hero_name == "Noah"
+    # Restored like a current save, into the dungeon manager singleton
+    assert loaded.dungeon_manager is DungeonManager.get_instance()
+    assert [str(floor) for floor in loaded.dungeon_manager.dungeon] == [str(floor) for floor in
+                                                                         game_state['dungeon_manager'].dungeon]
+    assert loaded.active_adventurer.hp == 40
+    with open(SAVE_PATH, 'rb') as f:
+        assert decode_game_state(f.read())['position'] == game_state['position']
+
+
+def test_save_written_atomically_in_background(game_state, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data")
+    game_controller = GameController.__new__(GameController)
+    game_controller.__setstate__(game_state)
+    results = []
+
+    GameStateManager.save_game_state(game_controller, results.append).join()
+    assert results == [None]
+    assert os.listdir("data") == ["save.dat"]
+    with open(SAVE_PATH, 'rb') as f:
+        assert decode_game_state(f.read())['hero_name'] == "Noah"
+
+
+def test_failed_save_reported_to_callback(game_state, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    game_controller = GameController.__new__(GameController)
+    game_controller.__setstate__(game_state)
+    results = []
+
+    GameStateManager.save_game_state(game_controller, results.append).join()
+    assert isinstance(results[0], OSError)
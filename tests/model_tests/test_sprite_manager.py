@@ -1,3 +1,4 @@
+import os
 import pytest
 from unittest.mock import patch, MagicMock
 from src.model.managers.sprite_manager import SpriteManager
@@ -105,4 +106,100 @@ def test_load_invalid_sprite_path(sprite_manager, mock_pygame):
     mock_pygame.image.load.side_effect = FileNotFoundError("File not found")
     sprite = sprite_manager.load_sprite("sprite1", "invalid/path/to/sprite1.png")
     assert sprite is None
-    mock_pygame.image.load.assert_called_once_with("invalid/path/to/sprite1.png")
\ No newline at end of file
+    mock_pygame.image.load.assert_called_once_with("invalid/path/to/sprite1.png")
+
+def test_get_portrait_cached(sprite_manager, mock_pygame):
+    sprite_manager.load_sprite("mark_portrait", "path/to/mark_portrait.png")
+    portrait = sprite_manager.get_portrait("Mark")
+    assert portrait is sprite_manager.get_portrait("Mark")
+    mock_pygame.image.load.assert_called_once_with("path/to/mark_portrait.png")
+    mock_pygame.transform.scale.assert_called_once_with(mock_pygame.image.load(), (150, 150))
+
+
+def test_get_portrait_fallback_path(sprite_manager, mock_pygame):
+    sprite_manager.get_portrait("Noah", (64, 64))
+    mock_pygame.image.load.assert_called_once_with(
+        os.path.join(sprite_manager.portrait_dir, "Noah_portrait.png"))
+
+
+def test_get_portrait_missing(sprite_manager, mock_pygame):
+    mock_pygame.image.load.side_effect = FileNotFoundError("File not found")
+    assert sprite_manager.get_portrait("Nobody") is None
+
+
+def test_clear_sprites_clears_portraits(sprite_manager, mock_pygame):
+    sprite_manager.get_portrait("Mark")
+    sprite_manager.clear_sprites()
+    assert len(sprite_manager.portraits) == 0
+
+
+def make_surface(width, height, bytesize=4):
+    surface = MagicMock()
+    surface.get_width.return_value = width
+    surface.get_height.return_value = height
+    surface.get_bytesize.return_value = bytesize
+    return surface
+
+
+def test_transformed_sprite_cached(sprite_manager, mock_pygame):
+    sprite_manager.load_sprite("sprite1", "path/to/sprite1.png")
+    first = sprite_manager.get_transformed_sprite("sprite1", rotate=90)
+    second = sprite_manager.get_transformed_sprite("sprite1", rotate=90)
+    assert first is second
+    mock_pygame.transform.rotate.assert_called_once()
+    stats = sprite_manager.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_transformed_sprite_cache_evicts_lru(sprite_manager, mock_pygame):
+    sprite_manager.sprites = {"sprite1": make_surface(10, 10)}
+    mock_pygame.transform.rotate.side_effect = lambda sprite, angle: make_surface(10, 10)
+    sprite_manager.set_cache_budget(1000)
+    sprite_manager.get_transformed_sprite("sprite1", rotate=90)
+    sprite_manager.get_transformed_sprite("sprite1", rotate=180)
+    # Touch 90 so that 180 becomes the least recently used
+    sprite_manager.get_transformed_sprite("sprite1", rotate=90)
+    sprite_manager.get_transformed_sprite("sprite1", rotate=270)
+    assert list(sprite_manager.transformed_sprites) == [("sprite1", False, 90, None), ("sprite1", False, 270, None)]
+    assert sprite_manager.get_cache_stats()["evictions"] == 1
+    assert sprite_manager.cache_bytes == 800
+
+
+def test_transformed_sprite_over_budget_not_cached(sprite_manager, mock_pygame):
+    sprite_manager.sprites = {"sprite1": make_surface(10, 10)}
+    mock_pygame.transform.scale.return_value = make_surface(100, 100)
+    sprite_manager.set_cache_budget(1000)
+    sprite_manager.get_transformed_sprite("sprite1", scale=(100, 100))
+    assert len(sprite_manager.transformed_sprites) == 0
+
+
+def test_clear_sprites_clears_transformed(sprite_manager, mock_pygame):
+    sprite_manager.load_sprite("sprite1", "path/to/sprite1.png")
+    sprite_manager.get_transformed_sprite("sprite1", rotate=90)
+    sprite_manager.clear_sprites()
+    assert sprite_manager.get_cache_stats()["entries"] == 0
+    assert sprite_manager.cache_bytes == 0
+    assert sprite_manager.get_transformed_sprite("sprite1", rotate=90) is None
+
+
+def test_transformed_sprite_scale_as_list(sprite_manager, mock_pygame):
+    sprite_manager.load_sprite("sprite1", "path/to/sprite1.png")
+    sprite_manager.get_transformed_sprite("sprite1", scale=[64, 64])
+    sprite_manager.get_transformed_sprite("sprite1", scale=(64, 64))
+    assert sprite_manager.get_cache_stats()["hits"] == 1
+    mock_pygame.transform.scale.assert_called_once_with(mock_pygame.image.load(), (64, 64))
+
+
+def test_get_scaled_sprite_loads_once(sprite_manager, mock_pygame):
+    with patch.dict("src.model.managers.sprite_manager.SPRITE_PATHS", {"white_box": "path/to/white_box.png"}):
+        image = sprite_manager.get_scaled_sprite("white_box", (64, 64))
+        assert image is sprite_manager.get_scaled_sprite("white_box", (64, 64))
+    mock_pygame.image.load.assert_called_once_with("path/to/white_box.png")
+    mock_pygame.transform.scale.assert_called_once_with(mock_pygame.image.load(), (64, 64))
+
+
+def test_get_scaled_sprite_unknown(sprite_manager, mock_pygame):
+    assert sprite_manager.get_scaled_sprite("placeholder", (100, 100)) is None
+    mock_pygame.image.load.assert_not_called()
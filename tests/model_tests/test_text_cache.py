@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import MagicMock
+from src.view.text_cache import TextCache
+
+
+@pytest.fixture
+def text_cache():
+    """Reset the singleton and return a fresh instance."""
+    TextCache._instance = None
+    return TextCache.get_instance()
+
+
+@pytest.fixture
+def font():
+    """A font whose render returns a new surface for every call."""
+    mock_font = MagicMock()
+    mock_font.render.side_effect = lambda *args: MagicMock()
+    return mock_font
+
+
+def test_singleton_behavior(text_cache):
+    assert text_cache is TextCache.get_instance()
+    with pytest.raises(Exception, match="This class is a singleton!"):
+        TextCache()
+
+
+def test_render_reuses_surface(text_cache, font):
+    """Unchanged text should only be rendered once."""
+    first = text_cache.render(font, "HP: 10 / 10", True, (255, 255, 255))
+    second = text_cache.render(font, "HP: 10 / 10", True, [255, 255, 255])
+
+    assert first is second
+    font.render.assert_called_once_with("HP: 10 / 10", True, (255, 255, 255))
+    assert (text_cache.hits, text_cache.misses) == (1, 1)
+
+
+def test_render_changed_text(text_cache, font):
+    """Changed text, colors or fonts should each be rendered again."""
+    other_font = MagicMock()
+    text_cache.render(font, "HP: 10 / 10", True, (255, 255, 255))
+    text_cache.render(font, "HP: 9 / 10", True, (255, 255, 255))
+    text_cache.render(font, "HP: 9 / 10", True, (0, 0, 0))
+    text_cache.render(other_font, "HP: 9 / 10", True, (0, 0, 0))
+
+    assert font.render.call_count == 3
+    other_font.render.assert_called_once()
+
+
+def test_render_evicts_least_recently_used(text_cache, font):
+    text_cache.max_size = 2
+    text_cache.render(font, "a", True, (0, 0, 0))
+    text_cache.render(font, "b", True, (0, 0, 0))
+    text_cache.render(font, "a", True, (0, 0, 0))
+    text_cache.render(font, "c", True, (0, 0, 0))
+
+    assert [key[1] for key in text_cache.surfaces] == ["a", "c"]
+
+
+def test_clear(text_cache, font):
+    text_cache.render(font, "a", True, (0, 0, 0))
+    text_cache.clear()
+    assert not text_cache.surfaces
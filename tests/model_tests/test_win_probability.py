@@ -0,0 +1,57 @@
+import random
+import pytest
+from assets.seeders.adventurer_seeder import ADVENTURERS_DATA
+from assets.seeders.monster_seeder import MONSTERS_DATA
+from src.model.battle.battle_engine import ADVENTURER_WON, BattleEngine
+from src.model.battle.win_probability import stat_signature, win_probability, win_table
+from src.model.factories.adventurer_factory import AdventurerFactory
+from src.model.factories.monster_factory import MonsterFactory
+
+
+def make_fighters(adventurer_data, monster_data):
+    return (AdventurerFactory.get_instance().make_adventurer(adventurer_data),
+            MonsterFactory.get_instance().make_monster(monster_data))
+
+
+def test_hand_computed_odds():
+    # One hit kills the monster, one unblocked hit kills the adventurer
+    adventurer, monster = make_fighters(("Hero", "Warrior", 1, 1, 0.5, 1, 1, 0),
+                                        ("Rat", "Normal", 1, 1, 1, 1, 1, 0, 1, 1))
+    assert win_probability(adventurer, monster) == pytest.approx(0.5)
+    # Blocking half the monster's hits: p = 0.5 + 0.5 * 0.5 * p
+    adventurer, monster = make_fighters(("Hero", "Warrior", 1, 1, 0.5, 1, 1, 0.5),
+                                        ("Rat", "Normal", 1, 1, 1, 1, 1, 0, 1, 1))
+    assert win_probability(adventurer, monster) == pytest.approx(2 / 3)
+
+
+def test_matches_engine():
+    # A Priest against an Ogre wins about a third of the time
+    battles, wins = 3000, 0
+    for seed in range(battles):
+        adventurer, monster = make_fighters(ADVENTURERS_DATA[1][:8], MONSTERS_DATA[0])
+        adventurer.rng = monster.rng = random.Random(seed)
+        wins += BattleEngine(adventurer, monster).run().outcome == ADVENTURER_WON
+    adventurer, monster = make_fighters(ADVENTURERS_DATA[1][:8], MONSTERS_DATA[0])
+    assert win_probability(adventurer, monster) == pytest.approx(wins / battles, abs=0.03)
+
+
+def test_tables_shared_by_signature():
+    adventurer, monster = make_fighters(ADVENTURERS_DATA[2][:8], MONSTERS_DATA[2])
+    other_adventurer, other_monster = make_fighters(ADVENTURERS_DATA[2][:8], MONSTERS_DATA[2])
+    assert win_table(stat_signature(adventurer, monster)) is win_table(stat_signature(other_adventurer,
+                                                                                      other_monster))
+    full = win_probability(adventurer, monster)
+    adventurer.hp = 10
+    assert win_probability(adventurer, monster) < full
+    monster.hp = 0
+    assert win_probability(adventurer, monster) == 1
+
+
+def test_odds_follow_hp():
+    adventurer, monster = make_fighters(ADVENTURERS_DATA[3][:8], MONSTERS_DATA[1])
+    table = win_table(stat_signature(adventurer, monster))
+    for adventurer_hp in range(1, adventurer.max_hp + 1):
+        odds = [table.probability(adventurer_hp, monster_hp) for monster_hp in range(monster.max_hp + 1)]
+        assert all(higher >= lower - 1e-12 for higher, lower in zip(odds, odds[1:]))
+        assert all(table.probability(adventurer_hp - 1, monster_hp) <= chance + 1e-12
+                   for monster_hp, chance in enumerate(odds))
@@ -0,0 +1,230 @@
+"""
+Sweeps a grid of stat changes over the adventurer and monster tables and reports, for every class and monster
+pair, the adventurer's win rate and the average battle length. Battles are simulated with BattleSimulator,
+spread over a process pool, so NumPy is needed. No display is needed.
+
+The tables are read from the game's database, which is built by running the game once. Run from the project
+root:
+    python -m tools.balance_sweep --stats hp damage --deltas -20 -10 10 20 --monsters Tom
+to try Tom with 10 or 20 more or less HP or damage, or:
+    python -m tools.balance_sweep --target adventurers --stats speed --deltas -1 1 --output sweep.csv
+to change every class's attack speed instead and write the whole grid to a CSV file.
+"""
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from src.controller.database_init import DatabaseInitializer
+from src.model.battle.battle_simulator import simulate_battles
+from src.model.managers.database_manager import DatabaseManager
+
+# Positions of each stat that can be swept in a row as laid out for the factories, the same for adventurers
+# and monsters. Damage moves both ends of the damage range.
+STAT_FIELDS = {'hp': (2,), 'speed': (3,), 'damage': (5, 6)}
+DEFAULT_DELTAS = (-10, -5, 5, 10)
+DEFAULT_BATTLES = 20000
+# Battles per chunk of work sent to a worker process
+CHUNK_BATTLES = 20000
+
+# Which table the stat changes apply to
+TARGET_MONSTERS = 'monsters'
+TARGET_ADVENTURERS = 'adventurers'
+
+
+def load_tables(db_path):
+    """
+    Loads the adventurer and monster rows from the database, laid out for the factories.
+
+    :param db_path: The path of the game's database.
+    :return: The adventurer rows and the monster rows.
+    """
+    db_manager = DatabaseManager.get_instance(db_path)
+    # Drop the id column; the factories take the rows from the name on
+    adventurers = [row[1:9] for row in db_manager.fetch_adventurers()]
+    monsters = [row[1:] for row in db_manager.fetch_monsters()]
+    db_manager.close_connection()
+    return adventurers, monsters
+
+
+def adjust(row, stat, delta):
+    """
+    Returns a copy of a row with a stat changed.
+
+    :param row: The adventurer or monster row.
+    :param stat: A key of STAT_FIELDS.
+    :param delta: The amount to add to the stat.
+    :return: The changed row.
+    """
+    row = list(row)
+    for field in STAT_FIELDS[stat]:
+        row[field] += delta
+    return tuple(row)
+
+
+def build_variants(stats, deltas):
+    """
+    Lists the stat changes to sweep: the unchanged tables first, then each stat with each delta.
+
+    :param stats: The stats to change.
+    :param deltas: The amounts to add to each stat.
+    :return: A list of (stat, delta) pairs, with (None, 0) for the unchanged tables.
+    """
+    return [(None, 0)] + [(stat, delta) for stat in stats for delta in deltas if delta != 0]
+
+
+def build_tasks(adventurers, monsters, variants, target, battles, special_chance, seed):
+    """
+    Lists the simulations making up the sweep: every variant of every class and monster pair.
+
+    :param adventurers: The adventurer rows.
+    :param monsters: The monster rows.
+    :param variants: The stat changes, as returned by build_variants.
+    :param target: TARGET_MONSTERS or TARGET_ADVENTURERS.
+    :param battles: The number of battles per pair.
+    :param special_chance: The chance the adventurer uses their special action on a turn.
+    :param seed: The base seed. Each task gets its own seed from it, so a sweep can be repeated exactly.
+    :return: The tasks, as (variant, adventurer row, monster row, battles, special chance, seed) tuples.
+    """
+    tasks = []
+    for variant in variants:
+        stat, delta = variant
+        changed_adventurers, changed_monsters = adventurers, monsters
+        if stat is not None and target == TARGET_MONSTERS:
+            changed_monsters = [adjust(row, stat, delta) for row in monsters]
+        elif stat is not None:
+            changed_adventurers = [adjust(row, stat, delta) for row in adventurers]
+        for adventurer in changed_adventurers:
+            for monster in changed_monsters:
+                tasks.append((variant, adventurer, monster, battles, special_chance, seed + len(tasks)))
+    return tasks
+
+
+def simulate(task):
+    """
+    Runs one task of the sweep. Called in the worker processes.
+
+    :param task: The task, as built by build_tasks.
+    :return: The adventurer's win rate and the average number of turns.
+    """
+    variant, adventurer, monster, battles, special_chance, seed = task
+    result = simulate_battles(adventurer, monster, battles, special_chance, seed)
+    return result.win_rate, float(result.turns.mean())
+
+
+def run_sweep(tasks, workers=None):
+    """
+    Runs every task of the sweep over a process pool.
+
+    :param tasks: The tasks, as built by build_tasks.
+    :param workers: The number of worker processes, None for one per core, or 0 to run the tasks in this
+    process.
+    :return: Each task's win rate and average number of turns, in task order.
+    """
+    if workers == 0:
+        return [simulate(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Send several small tasks to a worker at once, so the pool is not kept busy passing them around
+        chunk_size = max(1, CHUNK_BATTLES // tasks[0][3]) if tasks else 1
+        return list(executor.map(simulate, tasks, chunksize=chunk_size))
+
+
+def describe(variant, target):
+    """
+    Returns a variant's name.
+
+    :param variant: The (stat, delta) pair.
+    :param target: TARGET_MONSTERS or TARGET_ADVENTURERS.
+    :return: The name, such as 'monsters hp +10', or 'base' for the unchanged tables.
+    """
+    stat, delta = variant
+    return 'base' if stat is None else f"{target} {stat} {delta:+d}"
+
+
+def print_matrices(tasks, results, target):
+    """
+    Prints, for each variant, a matrix of win rates and average turns with a row per class and a column per
+    monster.
+
+    :param tasks: The tasks of the sweep.
+    :param results: The results of the tasks.
+    :param target: TARGET_MONSTERS or TARGET_ADVENTURERS.
+    """
+    matrices = {}
+    for task, (win_rate, turns) in zip(tasks, results):
+        variant, adventurer, monster = task[:3]
+        matrix = matrices.setdefault(variant, {})
+        matrix.setdefault(adventurer[1], {})[monster[0]] = f"{win_rate:>6.1%} {turns:>5.1f}t"
+
+    for variant, matrix in matrices.items():
+        monsters = list(next(iter(matrix.values())))
+        print(f"\n{describe(variant, target)} (win rate, average turns)")
+        print(f"{'':<10}" + "".join(f"{name:>15}" for name in monsters))
+        for adventurer_class, cells in matrix.items():
+            print(f"{adventurer_class:<10}" + "".join(f"{cells[name]:>15}" for name in monsters))
+
+
+def write_csv(path, tasks, results, target):
+    """
+    Writes the results of the sweep to a CSV file, a row per task.
+
+    :param path: The path of the file.
+    :param tasks: The tasks of the sweep.
+    :param results: The results of the tasks.
+    :param target: TARGET_MONSTERS or TARGET_ADVENTURERS.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['variant', 'adventurer', 'class', 'monster', 'battles', 'win_rate', 'average_turns'])
+        for task, (win_rate, turns) in zip(tasks, results):
+            variant, adventurer, monster, battles = task[:4]
+            writer.writerow([describe(variant, target), adventurer[0], adventurer[1], monster[0], battles,
+                             f"{win_rate:.4f}", f"{turns:.2f}"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balance sweep over the adventurer and monster tables.")
+    parser.add_argument('--db', help="path of the game's database, the one the game builds by default")
+    parser.add_argument('--target', choices=(TARGET_MONSTERS, TARGET_ADVENTURERS), default=TARGET_MONSTERS,
+                        help="table the stat changes apply to")
+    parser.add_argument('--stats', nargs='+', choices=tuple(STAT_FIELDS), default=tuple(STAT_FIELDS),
+                        help="stats to change")
+    parser.add_argument('--deltas', type=int, nargs='+', default=DEFAULT_DELTAS,
+                        help="amounts to add to each stat")
+    parser.add_argument('--adventurers', nargs='+', help="only these classes, e.g. Warrior")
+    parser.add_argument('--monsters', nargs='+', help="only these monsters, e.g. Tom")
+    parser.add_argument('--battles', type=int, default=DEFAULT_BATTLES, help="battles per pair")
+    parser.add_argument('--special-chance', type=float, default=0.0,
+                        help="chance the adventurer uses their special action on a turn")
+    parser.add_argument('--seed', type=int, default=0, help="base seed of the simulations")
+    parser.add_argument('--workers', type=int,
+                        help="worker processes, one per core by default, or 0 to run in this process")
+    parser.add_argument('--output', help="write the results to this CSV file")
+    args = parser.parse_args(argv)
+
+    db_path = args.db if args.db is not None else DatabaseInitializer().db_path
+    # Checked first, as connecting would create an empty database
+    if not os.path.exists(db_path):
+        print(f"No database at {db_path}. Run the game once to build it.")
+        return 1
+    adventurers, monsters = load_tables(db_path)
+    if args.adventurers:
+        adventurers = [row for row in adventurers if row[1] in args.adventurers]
+    if args.monsters:
+        monsters = [row for row in monsters if row[0] in args.monsters]
+    if not adventurers or not monsters:
+        print("No adventurers or monsters to sweep. Check the --adventurers and --monsters names.")
+        return 1
+
+    tasks = build_tasks(adventurers, monsters, build_variants(args.stats, args.deltas), args.target,
+                        args.battles, args.special_chance, args.seed)
+    results = run_sweep(tasks, args.workers)
+
+    print_matrices(tasks, results, args.target)
+    if args.output:
+        write_csv(args.output, tasks, results, args.target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())